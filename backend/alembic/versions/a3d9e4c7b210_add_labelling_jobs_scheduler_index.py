@@ -0,0 +1,32 @@
+"""add_labelling_jobs_scheduler_index
+
+Revision ID: a3d9e4c7b210
+Revises: f57cc8b2ea3b
+Create Date: 2026-10-17 10:04:18.553921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d9e4c7b210'
+down_revision: Union[str, None] = 'f57cc8b2ea3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Labelling jobs - scheduler scan for active jobs that are due; partial on
+    # is_active and INCLUDE the selected columns so it is an index-only scan
+    op.create_index(
+        'idx_labelling_jobs_active_next_run_at', 'labelling_jobs', ['next_run_at'],
+        postgresql_where=sa.text('is_active'),
+        postgresql_include=['id', 'name', 'frequency_minutes']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_labelling_jobs_active_next_run_at', 'labelling_jobs')
@@ -0,0 +1,38 @@
+"""cascade_project_dataset_image_deletes
+
+Revision ID: c81e5f2a9d47
+Revises: a3d9e4c7b210
+Create Date: 2026-10-17 11:26:40.918305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81e5f2a9d47'
+down_revision: Union[str, None] = 'a3d9e4c7b210'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (constraint, table, referred table, column) - names are Postgres defaults
+CASCADE_FOREIGN_KEYS = [
+    ('datasets_project_id_fkey', 'datasets', 'projects', 'project_id'),
+    ('images_dataset_id_fkey', 'images', 'datasets', 'dataset_id'),
+    ('annotations_image_id_fkey', 'annotations', 'images', 'image_id'),
+]
+
+
+def upgrade() -> None:
+    # Let Postgres cascade project -> datasets -> images -> annotation deletes
+    # so deleting a project is a single DELETE statement
+    for name, table, referred_table, column in CASCADE_FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referred_table, [column], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    for name, table, referred_table, column in reversed(CASCADE_FOREIGN_KEYS):
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referred_table, [column], ['id'])
@@ -0,0 +1,27 @@
+"""add_users_created_at_index
+
+Revision ID: d4b7a2e9c130
+Revises: c81e5f2a9d47
+Create Date: 2026-10-17 13:02:55.174620
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b7a2e9c130'
+down_revision: Union[str, None] = 'c81e5f2a9d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Users - admin user list ordered newest first
+    op.create_index('idx_users_created_at', 'users', [sa.text('created_at DESC'), sa.text('id DESC')])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_users_created_at', 'users')
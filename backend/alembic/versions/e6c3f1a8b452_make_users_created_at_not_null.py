@@ -0,0 +1,29 @@
+"""make_users_created_at_not_null
+
+Revision ID: e6c3f1a8b452
+Revises: d4b7a2e9c130
+Create Date: 2026-10-17 18:20:41.513208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6c3f1a8b452'
+down_revision: Union[str, None] = 'd4b7a2e9c130'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Users - the admin list pages by (created_at, id); a NULL created_at can't
+    # be encoded in a cursor and sorts first under DESC, outside the keyset
+    op.execute("UPDATE users SET created_at = COALESCE(last_login_at, now()) WHERE created_at IS NULL")
+    op.alter_column('users', 'created_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column('users', 'created_at', existing_type=sa.DateTime(), nullable=True)
@@ -0,0 +1,46 @@
+"""add_labelling_composite_indexes
+
+Revision ID: f57cc8b2ea3b
+Revises: bdb80060ab5f
+Create Date: 2026-10-17 09:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f57cc8b2ea3b'
+down_revision: Union[str, None] = 'bdb80060ab5f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Labelling job runs - run history ordered newest first (keyset on started_at, id)
+    op.create_index(
+        'idx_labelling_job_runs_job_started_at', 'labelling_job_runs',
+        ['labelling_job_id', sa.text('started_at DESC'), sa.text('id DESC')]
+    )
+    # Superseded by the composite index above
+    op.drop_index('idx_labelling_job_runs_job', 'labelling_job_runs')
+
+    # Labelling results - result pages and latest-result thumbnail lookup;
+    # INCLUDE image_id so the thumbnail lookup is an index-only scan
+    op.create_index(
+        'idx_labelling_results_job_created_at', 'labelling_results',
+        ['labelling_job_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_include=['image_id']
+    )
+    # Superseded by the composite index above (and unique_job_image)
+    op.drop_index('idx_labelling_results_job', 'labelling_results')
+
+
+def downgrade() -> None:
+    op.create_index('idx_labelling_results_job', 'labelling_results', ['labelling_job_id'])
+    op.drop_index('idx_labelling_results_job_created_at', 'labelling_results')
+
+    op.create_index('idx_labelling_job_runs_job', 'labelling_job_runs', ['labelling_job_id'])
+    op.drop_index('idx_labelling_job_runs_job_started_at', 'labelling_job_runs')
@@ -6,7 +6,7 @@ from pydantic import BaseModel
 from typing import Optional, Dict, Any
 import structlog
 
-from services.agent_service import AgentService
+from services.agent_service import get_agent_service
 from api.v1.auth import get_current_user
 from models.user import User
 
@@ -45,7 +45,7 @@ async def execute_agent(
         Agent execution result with intermediate steps
     """
     try:
-        agent_service = AgentService()
+        agent_service = get_agent_service()
         result = await agent_service.execute(
             prompt=request.prompt,
             context=request.context,
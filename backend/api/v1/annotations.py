@@ -16,7 +16,7 @@ import os
 import uuid
 import shutil
 
-from core.database import SessionLocal
+from api.deps import get_db
 from core.config import settings
 from models.image import Image, Annotation
 from models.project import Project, Dataset
@@ -29,13 +29,6 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # Schemas
 class AnnotationCreate(BaseModel):
     answer_value: Optional[Any] = None
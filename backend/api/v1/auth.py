@@ -15,16 +15,25 @@ import base64
 import json
 from urllib.parse import urlparse
 
+from core.cache import get_response_cache
 from core.config import settings
-from core.database import SessionLocal
+from core.database import get_db
+from services.project_service import PROJECTS_CACHE_NAMESPACE
 from models.user import User, UserRole
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
-# Security scheme for JWT
-security = HTTPBearer()
+# Security scheme for JWT; optional because the HttpOnly cookie is the primary carrier
+security = HTTPBearer(auto_error=False)
+
+# Response cache namespace for the admin user list (logins update the rows it shows)
+USERS_CACHE_NAMESPACE = "users"
+
+# Cached responses that embed user fields: the user list, and the project list's
+# creator name/email. Changing a user's profile, role or status drops them together
+USER_DEPENDENT_CACHE_NAMESPACES = (USERS_CACHE_NAMESPACE, PROJECTS_CACHE_NAMESPACE)
 
 # OAuth setup
 oauth = OAuth()
@@ -37,15 +46,6 @@ oauth.register(
 )
 
 
-def get_db():
-    """Database session dependency"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -58,12 +58,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-async def get_current_user(
+def get_current_user(
     request: Request,
     db: Session = Depends(get_db),
-    auth_token: Optional[str] = Cookie(default=None)
+    auth_token: Optional[str] = Cookie(default=None),
+    bearer: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> User:
-    """Get current user from JWT token in HttpOnly cookie or Authorization header"""
+    """
+    Get current user from JWT token in HttpOnly cookie or Authorization header
+
+    Plain def: the user lookup is a sync DB query, so FastAPI runs this
+    dependency in the threadpool instead of blocking the event loop.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -83,11 +89,9 @@ async def get_current_user(
     # Try to get token from cookie first, then fall back to Authorization header
     token = auth_token
     token_source = "cookie"
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-            token_source = "header"
+    if not token and bearer:
+        token = bearer.credentials
+        token_source = "header"
 
     if not token:
         logger.warning(
@@ -135,12 +139,10 @@ async def google_login(request: Request, next: Optional[str] = None):
         frontend_url = f"{parsed.scheme}://{parsed.netloc}"
 
     # Validate against ALLOWED_ORIGINS to prevent open redirects
-    allowed_origins = settings.ALLOWED_ORIGINS
     # Normalize URLs for comparison (remove trailing slash)
     normalized_url = frontend_url.rstrip('/')
-    normalized_origins = [origin.rstrip('/') for origin in allowed_origins]
 
-    if normalized_url not in normalized_origins:
+    if normalized_url not in settings.NORMALIZED_ALLOWED_ORIGINS:
         logger.warning(
             f"Potential open redirect blocked: {frontend_url} not in allowed origins"
         )
@@ -242,6 +244,7 @@ async def google_callback(code: str, state: Optional[str] = None, db: Session =
         user.picture_url = picture
         user.last_login_at = datetime.utcnow()
         db.commit()
+        get_response_cache().invalidate(*USER_DEPENDENT_CACHE_NAMESPACES)
         logger.info(f"User logged in: {email}")
 
         # Create JWT token
@@ -258,11 +261,9 @@ async def google_callback(code: str, state: Optional[str] = None, db: Session =
                     candidate_url = state_data["return_url"]
 
                     # Validate against ALLOWED_ORIGINS
-                    allowed_origins = settings.ALLOWED_ORIGINS
                     normalized_url = candidate_url.rstrip('/')
-                    normalized_origins = [origin.rstrip('/') for origin in allowed_origins]
 
-                    if normalized_url in normalized_origins:
+                    if normalized_url in settings.NORMALIZED_ALLOWED_ORIGINS:
                         redirect_base = candidate_url
                         logger.info(f"Using dynamic redirect: {redirect_base}")
                     else:
@@ -3,7 +3,7 @@ Dataset and image management endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, BackgroundTasks
 from fastapi.responses import FileResponse, Response
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from pydantic import BaseModel
 from typing import List, Optional, Tuple
 from datetime import datetime
@@ -12,19 +12,20 @@ import structlog
 import os
 import uuid
 import shutil
-import base64
 import asyncio
 
+from core.cache import get_response_cache
 from core.config import settings
 from models.project import Project, Dataset
 from models.image import Image, Annotation
 from models.user import User
 from api.deps import get_db, require_write_access, get_current_user
 
-from core.image_utils import generate_thumbnail
+from core.image_utils import THUMBNAIL_WORKERS, generate_thumbnails_async, thumbnail_data_uris
 
 # Import Storage Service
 from services.storage_service import get_storage_provider
+from services.project_service import PROJECTS_CACHE_NAMESPACE
 from core.interfaces.storage import IStorageProvider
 
 logger = structlog.get_logger(__name__)
@@ -32,7 +33,7 @@ logger = structlog.get_logger(__name__)
 router = APIRouter()
 
 # Allowed image extensions (with leading dot)
-ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.JPG', '.JPEG', '.PNG', '.GIF', '.WEBP'}
+ALLOWED_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp', '.JPG', '.JPEG', '.PNG', '.GIF', '.WEBP'})
 
 def is_valid_image_file(filename: str, content_type: str) -> bool:
     """
@@ -144,6 +145,8 @@ async def create_dataset(
     db.add(dataset)
     db.commit()
     db.refresh(dataset)
+    # Cached project responses embed the dataset list and counts
+    get_response_cache().invalidate(PROJECTS_CACHE_NAMESPACE)
 
     logger.info(f"Created dataset: {dataset.name} in project: {project.name}")
 
@@ -165,8 +168,10 @@ async def list_datasets(
 ):
     """List all datasets in a project"""
 
-    # Verify project exists
-    project = db.query(Project).filter(Project.id == project_id).first()
+    # Verify project exists; datasets come with SQL-side image counts
+    project = db.query(Project).options(
+        selectinload(Project.datasets).undefer(Dataset.image_count)
+    ).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(
@@ -180,7 +185,7 @@ async def list_datasets(
             name=d.name,
             project_id=str(d.project_id),
             created_at=d.created_at,
-            image_count=len(d.images) if d.images else 0,
+            image_count=d.image_count or 0,
             processing_status=d.processing_status,
             total_files=d.total_files,
             processed_files=d.processed_files,
@@ -232,6 +237,7 @@ async def delete_dataset(
     dataset_name = dataset.name
     db.delete(dataset)
     db.commit()
+    get_response_cache().invalidate(PROJECTS_CACHE_NAMESPACE)
 
     logger.info(f"Deleted dataset: {dataset_name}")
 
@@ -282,78 +288,86 @@ async def upload_images(
     errors = []
 
     try:
-        for file in files:
-            try:
-                # Validate file type (checks both MIME type and extension)
-                if not is_valid_image_file(file.filename, file.content_type):
-                    # Get file extension for better error message
-                    _, ext = os.path.splitext(file.filename)
-                    if ext:
-                        error_msg = f"Invalid file extension '{ext}' (allowed: .jpg, .jpeg, .png, .gif, .webp)"
-                    else:
-                        error_msg = f"No file extension (allowed: .jpg, .jpeg, .png, .gif, .webp)"
-                    errors.append(f"{file.filename}: {error_msg}")
-                    logger.warning(f"Skipping {file.filename}: {error_msg} (MIME type: {file.content_type})")
+        # Work in slices of one file per thumbnail worker: each slice's thumbnails
+        # run in parallel, and only one slice of source buffers is held at a time
+        for slice_start in range(0, len(files), THUMBNAIL_WORKERS):
+            # Validate and read the slice, so its thumbnails can be generated as one batch
+            pending: List[Tuple[UploadFile, bytes]] = []
+            for file in files[slice_start:slice_start + THUMBNAIL_WORKERS]:
+                try:
+                    # Validate file type (checks both MIME type and extension)
+                    if not is_valid_image_file(file.filename, file.content_type):
+                        # Get file extension for better error message
+                        _, ext = os.path.splitext(file.filename)
+                        if ext:
+                            error_msg = f"Invalid file extension '{ext}' (allowed: .jpg, .jpeg, .png, .gif, .webp)"
+                        else:
+                            error_msg = f"No file extension (allowed: .jpg, .jpeg, .png, .gif, .webp)"
+                        errors.append(f"{file.filename}: {error_msg}")
+                        logger.warning(f"Skipping {file.filename}: {error_msg} (MIME type: {file.content_type})")
+                        continue
+
+                    # Read file bytes once for both thumbnail and storage
+                    pending.append((file, await file.read()))
+
+                except Exception as e:
+                    logger.error(f"Failed to read {file.filename}: {str(e)}", exc_info=True)
+                    errors.append(f"{file.filename}: {str(e)}")
+                finally:
+                    # Ensure file is closed; its bytes are held in pending
                     await file.close()
-                    continue
 
-                # Generate unique filename
-                ext = os.path.splitext(file.filename)[1]
-                unique_filename = f"{uuid.uuid4()}{ext}"
-                storage_path = f"{storage_prefix}/{unique_filename}"
+            # Generate the slice's thumbnails in parallel off the event loop
+            thumbnails = await generate_thumbnails_async([file_bytes for _, file_bytes in pending])
 
-                # Read file bytes once for both thumbnail and storage
-                file_bytes = await file.read()
-                file_size = len(file_bytes)
-
-                # Generate thumbnail
+            for (file, file_bytes), thumbnail_bytes in zip(pending, thumbnails):
                 try:
-                    thumbnail_bytes = generate_thumbnail(file_bytes)
+                    if isinstance(thumbnail_bytes, Exception):
+                        # If thumbnail generation fails, the file is likely corrupted or not a valid image
+                        logger.warning(f"Failed to generate thumbnail for {file.filename}: {str(thumbnail_bytes)}")
+                        errors.append(f"{file.filename}: Corrupted or invalid image file (thumbnail generation failed)")
+                        continue
                     logger.info(f"Generated thumbnail for {file.filename}: {len(thumbnail_bytes)} bytes")
-                except Exception as thumb_error:
-                    # If thumbnail generation fails, the file is likely corrupted or not a valid image
-                    logger.warning(f"Failed to generate thumbnail for {file.filename}: {str(thumb_error)}")
-                    errors.append(f"{file.filename}: Corrupted or invalid image file (thumbnail generation failed)")
-                    await file.close()
-                    continue
 
-                # Create BytesIO object for storage upload (avoids file seek issues)
-                file_obj = BytesIO(file_bytes)
-
-                # Upload using storage provider
-                uploaded_path, _ = await storage.upload(file_obj, storage_path)
-
-                # Create database record with thumbnail
-                # Mark as completed since thumbnail is already generated
-                image = Image(
-                    dataset_id=dataset_id,
-                    filename=file.filename,
-                    storage_path=uploaded_path,
-                    file_size=file_size,
-                    thumbnail_data=thumbnail_bytes,
-                    processing_status='completed',
-                    uploaded_by_id=current_user.id
-                )
-                db.add(image)
-                uploaded_images.append(image)
-                logger.info(f"Successfully uploaded {file.filename} ({file_size} bytes)")
-                await file.close()
-
-            except HTTPException as he:
-                # Propagate HTTP exceptions (e.g. file too large)
-                errors.append(f"{file.filename}: {he.detail}")
-                await file.close()
-            except Exception as e:
-                logger.error(f"Failed to upload {file.filename}: {str(e)}", exc_info=True)
-                errors.append(f"{file.filename}: {str(e)}")
-                await file.close()
-            finally:
-                # Ensure file is closed
-                await file.close()
+                    # Generate unique filename
+                    ext = os.path.splitext(file.filename)[1]
+                    unique_filename = f"{uuid.uuid4()}{ext}"
+                    storage_path = f"{storage_prefix}/{unique_filename}"
+                    file_size = len(file_bytes)
+
+                    # Create BytesIO object for storage upload (avoids file seek issues)
+                    file_obj = BytesIO(file_bytes)
+
+                    # Upload using storage provider
+                    uploaded_path, _ = await storage.upload(file_obj, storage_path)
+
+                    # Create database record with thumbnail
+                    # Mark as completed since thumbnail is already generated
+                    image = Image(
+                        dataset_id=dataset_id,
+                        filename=file.filename,
+                        storage_path=uploaded_path,
+                        file_size=file_size,
+                        thumbnail_data=thumbnail_bytes,
+                        processing_status='completed',
+                        uploaded_by_id=current_user.id
+                    )
+                    db.add(image)
+                    uploaded_images.append(image)
+                    logger.info(f"Successfully uploaded {file.filename} ({file_size} bytes)")
+
+                except HTTPException as he:
+                    # Propagate HTTP exceptions (e.g. file too large)
+                    errors.append(f"{file.filename}: {he.detail}")
+                except Exception as e:
+                    logger.error(f"Failed to upload {file.filename}: {str(e)}", exc_info=True)
+                    errors.append(f"{file.filename}: {str(e)}")
 
         # Commit all successful uploads
         if uploaded_images:
             db.commit()
+            # Project detail embeds per-dataset image counts
+            get_response_cache().invalidate(PROJECTS_CACHE_NAMESPACE)
             logger.info(f"Committed {len(uploaded_images)} images to database")
 
             # Refresh to get IDs
@@ -447,15 +461,14 @@ async def list_images(
     # Order by newest first
     images = query.order_by(Image.uploaded_at.desc()).offset(skip).limit(limit).all()
 
+    # Encode all thumbnails for the page in one pass
+    thumbnail_urls = thumbnail_data_uris(
+        {img.id: img.thumbnail_data for img in images}
+    ) if include_thumbnails else {}
+
     results = []
     for img in images:
-        thumbnail_url = None
-        if include_thumbnails and img.thumbnail_data:
-            try:
-                b64_data = base64.b64encode(img.thumbnail_data).decode('utf-8')
-                thumbnail_url = f"data:image/jpeg;base64,{b64_data}"
-            except Exception as e:
-                logger.error(f"Failed to encode thumbnail for image {img.id}: {e}")
+        thumbnail_url = thumbnail_urls.get(str(img.id))
 
         # Check annotation status
         is_annotated = False
@@ -689,6 +702,8 @@ async def delete_image(
     filename = image.filename
     db.delete(image)
     db.commit()
+    # Project detail embeds per-dataset image counts
+    get_response_cache().invalidate(PROJECTS_CACHE_NAMESPACE)
 
     return {"message": f"Image '{filename}' deleted successfully"}
 
@@ -873,6 +888,8 @@ async def batch_upload_images(
         if uploaded_images:
             db.add_all(uploaded_images)
             db.commit()
+            # Project detail embeds per-dataset image counts
+            get_response_cache().invalidate(PROJECTS_CACHE_NAMESPACE)
             logger.info(f"Committed {len(uploaded_images)} images to database")
 
         # Update dataset status
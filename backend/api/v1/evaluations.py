@@ -18,6 +18,7 @@ import math
 from sqlalchemy.sql.expression import func
 
 from core.database import SessionLocal
+from api.deps import get_db
 from core.prompt_config import get_system_prompt
 from core.prompt_utils import substitute_variables, validate_variable_references
 from models.evaluation import ModelConfig, Evaluation, EvaluationResult
@@ -40,13 +41,6 @@ from api.v1.evaluations_helper import ImageEvalData
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # Schemas
 class EvaluationCreate(BaseModel):
     name: str
@@ -814,19 +808,11 @@ async def create_evaluation(
         created_by_id=current_user.id
     )
     db.add(evaluation)
-    db.commit()
-    db.refresh(evaluation)
-
-    # Start evaluation in a background thread (survives even if user closes page)
-    thread = threading.Thread(
-        target=run_evaluation_in_thread,
-        args=(str(evaluation.id),),
-        daemon=True  # Daemon thread won't prevent app shutdown
-    )
-    thread.start()
-    logger.info(f"Started evaluation {evaluation.id} in background thread")
-
-    return EvaluationResponse(
+    # Defaults are client-side, so after flush the row is complete: build the
+    # response now instead of commit + refresh (and before the runner thread
+    # starts mutating the row)
+    db.flush()
+    response = EvaluationResponse(
         id=str(evaluation.id),
         name=evaluation.name,
         project_id=str(evaluation.project_id),
@@ -850,6 +836,18 @@ async def create_evaluation(
         actual_cost=evaluation.actual_cost,
         cost_details=evaluation.cost_details
     )
+    db.commit()
+
+    # Start evaluation in a background thread (survives even if user closes page)
+    thread = threading.Thread(
+        target=run_evaluation_in_thread,
+        args=(response.id,),
+        daemon=True  # Daemon thread won't prevent app shutdown
+    )
+    thread.start()
+    logger.info(f"Started evaluation {response.id} in background thread")
+
+    return response
 
 @router.get("/{evaluation_id}", response_model=EvaluationResponse)
 async def get_evaluation(
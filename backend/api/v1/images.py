@@ -9,9 +9,10 @@ from typing import Optional
 import structlog
 import base64
 import os
+import re
 
 from core.config import settings
-from core.database import SessionLocal
+from api.deps import get_db
 from api.v1.auth import get_current_user
 from models.user import User
 from models.image import Image
@@ -22,14 +23,7 @@ logger = structlog.get_logger(__name__)
 router = APIRouter()
 
 # Allowed image extensions (with leading dot)
-ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.JPG', '.JPEG', '.PNG', '.GIF', '.WEBP'}
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+ALLOWED_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp', '.JPG', '.JPEG', '.PNG', '.GIF', '.WEBP'})
 
 @router.get("/{image_id}/thumbnail")
 async def get_image_thumbnail(
@@ -72,6 +66,19 @@ class ImageAnalysisResponse(BaseModel):
     labels: list[str]
     confidence: Optional[float] = None
 
+# Keywords recognised as labels, in the order they are reported
+COMMON_OBJECTS = (
+    "person", "people", "car", "building", "tree", "animal",
+    "dog", "cat", "food", "nature", "urban", "indoor", "outdoor"
+)
+
+# One case-insensitive pass over the description finds every keyword; the
+# lookahead makes matches zero-width so overlapping keywords are all reported
+_LABEL_RE = re.compile(
+    "(?=(" + "|".join(re.escape(obj) for obj in COMMON_OBJECTS) + "))",
+    re.IGNORECASE
+)
+
 def extract_labels(description: str) -> list[str]:
     """
     Extract potential labels from description
@@ -79,16 +86,8 @@ def extract_labels(description: str) -> list[str]:
     """
     # Basic keyword extraction
     # In production, you might want to use NLP techniques or another model
-    common_objects = [
-        "person", "people", "car", "building", "tree", "animal",
-        "dog", "cat", "food", "nature", "urban", "indoor", "outdoor"
-    ]
-
-    description_lower = description.lower()
-    found_labels = [
-        obj for obj in common_objects
-        if obj in description_lower
-    ]
+    found = {match.lower() for match in _LABEL_RE.findall(description)}
+    found_labels = [obj for obj in COMMON_OBJECTS if obj in found]
 
     return found_labels[:5]  # Return top 5 labels
 
@@ -114,7 +113,7 @@ async def analyze_image(
         if not is_valid_image_file(file.filename, file.content_type):
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid file type. Allowed types: {settings.ALLOWED_IMAGE_TYPES}"
+                detail=f"Invalid file type. Allowed types: {sorted(settings.ALLOWED_IMAGE_TYPES)}"
             )
 
         # Read file content
@@ -1,15 +1,16 @@
 """
 Labelling Jobs API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, insert, tuple_, update
+from sqlalchemy.orm import Session, load_only
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from typing import List, Optional
 from datetime import datetime, timedelta
 import structlog
-import asyncio
-import threading
-import base64
+import re
+import uuid
 
 from core.database import SessionLocal
 from models.labelling_job import LabellingJob, LabellingJobRun, LabellingResult
@@ -18,33 +19,30 @@ from models.evaluation import Evaluation, ModelConfig
 from models.image import Image
 from models.user import User
 from api.v1.auth import get_current_user
-from services.labelling_job_service import get_labelling_job_service
+from api.deps import get_db, require_write_access
+from services.labelling_job_service import get_labelling_job_service, LABELLING_JOBS_CACHE_NAMESPACE
 from services.cloud_tasks_service import get_cloud_tasks_service
 from core.config import settings
+from core.cache import get_response_cache
+from core.http_cache import make_etag, etag_matches, not_modified
+from core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from core.image_utils import thumbnail_data_uris
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
 
-def require_write_access(current_user: User = Depends(get_current_user)) -> User:
-    """Require user to have write access (not a viewer)"""
-    from models.user import UserRole
-    if current_user.role == UserRole.VIEWER.value:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Viewers have read-only access. Cannot create, update, or delete resources."
-        )
-    return current_user
+# gs://<bucket>[/<prefix>] - bucket names are 3-222 chars of [a-z0-9._-]
+GCS_PATH_RE = re.compile(r"^gs://[a-z0-9][a-z0-9._-]{2,221}(/.*)?$")
+MAX_FREQUENCY_MINUTES = 10080  # One week
 
 
-def get_db():
-    """Database session dependency"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def validate_gcs_folder_path(value: Optional[str]) -> Optional[str]:
+    """Reject malformed GCS paths before any DB or GCS access"""
+    if value is not None and not GCS_PATH_RE.match(value):
+        raise ValueError("GCS folder path must be of the form gs://bucket-name/optional/prefix")
+    return value
 
 
 # Pydantic schemas
@@ -53,16 +51,20 @@ class LabellingJobCreate(BaseModel):
     project_id: str
     evaluation_id: str  # Copy prompt config from this evaluation
     gcs_folder_path: str
-    frequency_minutes: int = 15
+    frequency_minutes: int = Field(default=15, gt=0, le=MAX_FREQUENCY_MINUTES)
     is_active: bool = True
 
+    _validate_gcs_folder_path = field_validator('gcs_folder_path')(validate_gcs_folder_path)
+
 
 class LabellingJobUpdate(BaseModel):
     name: Optional[str] = None
     gcs_folder_path: Optional[str] = None
-    frequency_minutes: Optional[int] = None
+    frequency_minutes: Optional[int] = Field(default=None, gt=0, le=MAX_FREQUENCY_MINUTES)
     is_active: Optional[bool] = None
 
+    _validate_gcs_folder_path = field_validator('gcs_folder_path')(validate_gcs_folder_path)
+
 
 class LabellingJobResponse(BaseModel):
     id: str
@@ -126,30 +128,98 @@ class LabellingResultResponse(BaseModel):
         from_attributes = True
 
 
+# Precompiled adapters: validate and serialize a whole page in one call
+# instead of constructing a response model per row
+JOB_RUNS_ADAPTER = TypeAdapter(List[LabellingJobRunResponse])
+JOB_RESULTS_ADAPTER = TypeAdapter(List[LabellingResultResponse])
+
+# Columns read by the response schemas; skips wide fields such as the
+# copied system_message/question_text and run error_details
+JOB_LIST_COLUMNS = (
+    LabellingJob.id, LabellingJob.name, LabellingJob.project_id, LabellingJob.dataset_id,
+    LabellingJob.gcs_folder_path, LabellingJob.last_processed_timestamp,
+    LabellingJob.frequency_minutes, LabellingJob.is_active, LabellingJob.status,
+    LabellingJob.last_run_at, LabellingJob.next_run_at, LabellingJob.total_runs,
+    LabellingJob.total_images_processed, LabellingJob.total_images_labeled,
+    LabellingJob.total_errors, LabellingJob.created_by_id, LabellingJob.created_at,
+    LabellingJob.updated_at
+)
+JOB_RUN_COLUMNS = (
+    LabellingJobRun.id, LabellingJobRun.labelling_job_id, LabellingJobRun.status,
+    LabellingJobRun.trigger_type, LabellingJobRun.images_discovered,
+    LabellingJobRun.images_ingested, LabellingJobRun.images_labeled,
+    LabellingJobRun.images_failed, LabellingJobRun.started_at, LabellingJobRun.completed_at,
+    LabellingJobRun.duration_seconds, LabellingJobRun.error_message, LabellingJobRun.created_at
+)
+JOB_RESULT_COLUMNS = (
+    LabellingResult.id, LabellingResult.labelling_job_id, LabellingResult.labelling_job_run_id,
+    LabellingResult.image_id, LabellingResult.model_response, LabellingResult.parsed_answer,
+    LabellingResult.confidence_score, LabellingResult.latency_ms, LabellingResult.error,
+    LabellingResult.gcs_source_path, LabellingResult.created_at
+)
+
 # Helper functions
-def run_job_in_thread(job_id: str, trigger_type: str):
-    """Run job in a separate thread with its own event loop"""
-    def _run():
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+EMPTY_RUN_STATS = {
+    "total_runs": 0,
+    "total_images_processed": 0,
+    "total_images_labeled": 0,
+    "total_errors": 0
+}
 
-        db = SessionLocal()
-        try:
-            service = get_labelling_job_service()
-            loop.run_until_complete(service.run_job(job_id, db, trigger_type))
-        except Exception as e:
-            logger.error(f"Job execution failed: {str(e)}", exc_info=True)
-        finally:
-            db.close()
-            loop.close()
 
-    thread = threading.Thread(target=_run, daemon=True)
-    thread.start()
+def _aggregate_run_stats(db: Session, job_ids: List[uuid.UUID]) -> dict:
+    """
+    Compute per-job totals from run history in a single GROUP BY.
+
+    Mirrors how LabellingJobService.run_job maintains the stored counters:
+    only completed runs that ingested at least one image count as runs (runs
+    that found nothing return early), and a failed run adds one error.
+    """
+    completed = (LabellingJobRun.status == 'completed') & (LabellingJobRun.images_ingested > 0)
+    rows = db.query(
+        LabellingJobRun.labelling_job_id,
+        func.count(LabellingJobRun.id).filter(completed),
+        func.coalesce(func.sum(LabellingJobRun.images_ingested).filter(completed), 0),
+        func.coalesce(func.sum(LabellingJobRun.images_labeled).filter(completed), 0),
+        func.coalesce(func.sum(LabellingJobRun.images_failed).filter(completed), 0)
+        + func.count(LabellingJobRun.id).filter(LabellingJobRun.status == 'failed')
+    ).filter(
+        LabellingJobRun.labelling_job_id.in_(job_ids)
+    ).group_by(LabellingJobRun.labelling_job_id).all()
+
+    return {
+        str(job_id): {
+            "total_runs": runs,
+            "total_images_processed": processed,
+            "total_images_labeled": labeled,
+            "total_errors": errors
+        }
+        for job_id, runs, processed, labeled, errors in rows
+    }
+
+
+async def _run_job_bg(job_id: str, trigger_type: str):
+    """
+    Run a job on the app's event loop (scheduled via BackgroundTasks).
+
+    run_job hands its blocking Session and GCS calls to the threadpool itself,
+    so the loop only waits on storage and LLM I/O.
+    """
+    db = SessionLocal()
+    try:
+        service = get_labelling_job_service()
+        await service.run_job(job_id, db, trigger_type)
+    except Exception as e:
+        logger.error(f"Job execution failed: {str(e)}", exc_info=True)
+    finally:
+        db.close()
 
 
 # Endpoints
+# These only do blocking Session I/O, so they are plain `def` and FastAPI runs
+# them in its threadpool instead of stalling the event loop
 @router.post("/labelling-jobs", response_model=LabellingJobResponse, status_code=status.HTTP_201_CREATED)
-async def create_labelling_job(
+def create_labelling_job(
     job_data: LabellingJobCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_write_access)
@@ -181,38 +251,29 @@ async def create_labelling_job(
             detail="Evaluation not found"
         )
 
-    # Validate GCS path format
-    if not job_data.gcs_folder_path.startswith('gs://'):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="GCS folder path must start with gs://"
-        )
-
-    # Create job
-    job = LabellingJob(
-        name=job_data.name,
-        project_id=job_data.project_id,
-        gcs_folder_path=job_data.gcs_folder_path,
-        model_config_id=evaluation.model_config_id,
-        system_message=evaluation.system_message or "",
-        question_text=evaluation.question_text or project.question_text,
-        frequency_minutes=job_data.frequency_minutes,
-        is_active=job_data.is_active,
-        status='idle',
-        created_by_id=current_user.id
-    )
-
     # Calculate next run time if active
+    next_run_at = None
     if job_data.is_active:
-        job.next_run_at = datetime.utcnow() + timedelta(minutes=job_data.frequency_minutes)
-
-    db.add(job)
-    db.commit()
-    db.refresh(job)
-
-    logger.info(f"Created labelling job {job.id}: {job.name}")
-
-    # Build response
+        next_run_at = datetime.utcnow() + timedelta(minutes=job_data.frequency_minutes)
+
+    # Create job; RETURNING gives the stored row without a follow-up SELECT
+    job = db.scalars(
+        insert(LabellingJob).values(
+            name=job_data.name,
+            project_id=job_data.project_id,
+            gcs_folder_path=job_data.gcs_folder_path,
+            model_config_id=evaluation.model_config_id,
+            system_message=evaluation.system_message or "",
+            question_text=evaluation.question_text or project.question_text,
+            frequency_minutes=job_data.frequency_minutes,
+            is_active=job_data.is_active,
+            next_run_at=next_run_at,
+            status='idle',
+            created_by_id=current_user.id
+        ).returning(LabellingJob)
+    ).one()
+
+    # Build response before commit so the returned row isn't expired and re-read
     response = LabellingJobResponse(
         id=str(job.id),
         name=job.name,
@@ -234,88 +295,142 @@ async def create_labelling_job(
         created_at=job.created_at,
         updated_at=job.updated_at
     )
+    db.commit()
+    get_response_cache().invalidate(LABELLING_JOBS_CACHE_NAMESPACE)
+
+    logger.info(f"Created labelling job {response.id}: {response.name}")
     return response
 
 
-@router.get("/labelling-jobs", response_model=List[LabellingJobResponse])
-async def list_labelling_jobs(
+@router.get("/labelling-jobs", response_model=List[LabellingJobResponse], response_class=ORJSONResponse)
+def list_labelling_jobs(
     project_id: Optional[str] = None,
+    with_stats: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List all labelling jobs, optionally filtered by project"""
-    query = db.query(LabellingJob)
+    """
+    List all labelling jobs, optionally filtered by project.
+
+    Rows are serialized straight to dicts and returned via orjson, skipping
+    per-item response model validation on this hot path. With `with_stats`,
+    the total_* counters are recomputed from run history in one GROUP BY
+    instead of read from the stored columns.
+    """
+    cache = get_response_cache()
+    cache_key = (project_id, with_stats)
+    cached = cache.get(LABELLING_JOBS_CACHE_NAMESPACE, cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    query = db.query(LabellingJob).options(load_only(*JOB_LIST_COLUMNS))
 
     if project_id:
         query = query.filter(LabellingJob.project_id == project_id)
 
     jobs = query.order_by(LabellingJob.created_at.desc()).all()
 
-    # Build responses with dataset names
-    responses = []
+    # Fetch the latest labelled image per job for the card thumbnail
+    thumbnail_images = {}
     for job in jobs:
-        dataset_name = job.dataset.name if job.dataset else None
-        
-        # Fetch thumbnail from latest result
-        thumbnail = None
         try:
-            latest_result = db.query(LabellingResult).filter(
+            latest_result = db.query(LabellingResult).options(
+                load_only(LabellingResult.image_id)
+            ).filter(
                 LabellingResult.labelling_job_id == job.id,
                 LabellingResult.image_id.isnot(None)
             ).order_by(LabellingResult.created_at.desc()).first()
-            
+
             if latest_result and latest_result.image and latest_result.image.thumbnail_data:
-                b64_data = base64.b64encode(latest_result.image.thumbnail_data).decode('utf-8')
-                thumbnail = f"data:image/jpeg;base64,{b64_data}"
+                thumbnail_images[job.id] = latest_result.image
         except Exception as e:
             logger.error(f"Failed to fetch thumbnail for job {job.id}: {e}")
 
-        response = LabellingJobResponse(
-            id=str(job.id),
-            name=job.name,
-            project_id=str(job.project_id),
-            dataset_id=str(job.dataset_id) if job.dataset_id else None,
-            dataset_name=dataset_name,
-            thumbnail=thumbnail,
-            gcs_folder_path=job.gcs_folder_path,
-            last_processed_timestamp=job.last_processed_timestamp,
-            frequency_minutes=job.frequency_minutes,
-            is_active=job.is_active,
-            status=job.status,
-            last_run_at=job.last_run_at,
-            next_run_at=job.next_run_at,
-            total_runs=job.total_runs,
-            total_images_processed=job.total_images_processed,
-            total_images_labeled=job.total_images_labeled,
-            total_errors=job.total_errors,
-            created_by_id=str(job.created_by_id),
-            created_at=job.created_at,
-            updated_at=job.updated_at
-        )
-        responses.append(response)
+    # Encode all thumbnails in one pass
+    thumbnails = thumbnail_data_uris(
+        {image.id: image.thumbnail_data for image in thumbnail_images.values()}
+    )
+
+    # Resolve dataset names in one query instead of lazy-loading each job.dataset
+    dataset_ids = {job.dataset_id for job in jobs if job.dataset_id}
+    dataset_names = dict(
+        db.query(Dataset.id, Dataset.name).filter(Dataset.id.in_(dataset_ids)).all()
+    ) if dataset_ids else {}
 
-    return responses
+    # Build responses with dataset names
+    responses = []
+    for job in jobs:
+        dataset_name = dataset_names.get(job.dataset_id)
+        image = thumbnail_images.get(job.id)
+        thumbnail = thumbnails.get(str(image.id)) if image else None
+
+        responses.append({
+            "id": str(job.id),
+            "name": job.name,
+            "project_id": str(job.project_id),
+            "dataset_id": str(job.dataset_id) if job.dataset_id else None,
+            "dataset_name": dataset_name,
+            "thumbnail": thumbnail,
+            "gcs_folder_path": job.gcs_folder_path,
+            "last_processed_timestamp": job.last_processed_timestamp,
+            "frequency_minutes": job.frequency_minutes,
+            "is_active": job.is_active,
+            "status": job.status,
+            "last_run_at": job.last_run_at,
+            "next_run_at": job.next_run_at,
+            "total_runs": job.total_runs,
+            "total_images_processed": job.total_images_processed,
+            "total_images_labeled": job.total_images_labeled,
+            "total_errors": job.total_errors,
+            "created_by_id": str(job.created_by_id),
+            "created_at": job.created_at,
+            "updated_at": job.updated_at
+        })
+
+    if with_stats and responses:
+        stats = _aggregate_run_stats(db, [job.id for job in jobs])
+        for item in responses:
+            item.update(stats.get(item["id"], EMPTY_RUN_STATS))
+
+    cache.set(LABELLING_JOBS_CACHE_NAMESPACE, cache_key, responses)
+    return ORJSONResponse(responses)
 
 
 @router.get("/labelling-jobs/{job_id}", response_model=LabellingJobResponse)
-async def get_labelling_job(
+def get_labelling_job(
     job_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get a specific labelling job by ID"""
-    job = db.query(LabellingJob).filter(
+    """
+    Get a specific labelling job by ID.
+
+    Supports If-None-Match: only updated_at is read to check the ETag, and the
+    full row is loaded only when the client's copy is stale.
+    """
+    version = db.query(LabellingJob.updated_at).filter(
         LabellingJob.id == job_id
     ).first()
 
-    if not job:
+    if not version:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Labelling job not found"
         )
 
+    etag = make_etag(job_id, version.updated_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    job = db.query(LabellingJob).filter(
+        LabellingJob.id == job_id
+    ).first()
+
     dataset_name = job.dataset.name if job.dataset else None
-    response = LabellingJobResponse(
+    return LabellingJobResponse(
         id=str(job.id),
         name=job.name,
         project_id=str(job.project_id),
@@ -336,11 +451,10 @@ async def get_labelling_job(
         created_at=job.created_at,
         updated_at=job.updated_at
     )
-    return response
 
 
 @router.patch("/labelling-jobs/{job_id}", response_model=LabellingJobResponse)
-async def update_labelling_job(
+def update_labelling_job(
     job_id: str,
     job_data: LabellingJobUpdate,
     db: Session = Depends(get_db),
@@ -357,31 +471,36 @@ async def update_labelling_job(
             detail="Labelling job not found"
         )
 
-    # Update fields
+    # Work out the new column values
+    values = {}
+    next_run_at = job.next_run_at
+    frequency_minutes = job.frequency_minutes
     if job_data.name is not None:
-        job.name = job_data.name
+        values['name'] = job_data.name
     if job_data.gcs_folder_path is not None:
-        if not job_data.gcs_folder_path.startswith('gs://'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="GCS folder path must start with gs://"
-            )
-        job.gcs_folder_path = job_data.gcs_folder_path
+        values['gcs_folder_path'] = job_data.gcs_folder_path
     if job_data.frequency_minutes is not None:
-        job.frequency_minutes = job_data.frequency_minutes
+        values['frequency_minutes'] = frequency_minutes = job_data.frequency_minutes
         # Recalculate next run time
         if job.is_active:
-            job.next_run_at = datetime.utcnow() + timedelta(minutes=job_data.frequency_minutes)
+            next_run_at = datetime.utcnow() + timedelta(minutes=frequency_minutes)
     if job_data.is_active is not None:
-        job.is_active = job_data.is_active
-        if job_data.is_active and not job.next_run_at:
-            job.next_run_at = datetime.utcnow() + timedelta(minutes=job.frequency_minutes)
+        values['is_active'] = job_data.is_active
+        if job_data.is_active and not next_run_at:
+            next_run_at = datetime.utcnow() + timedelta(minutes=frequency_minutes)
         elif not job_data.is_active:
-            job.next_run_at = None
-
-    job.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(job)
+            next_run_at = None
+    values['next_run_at'] = next_run_at
+    values['updated_at'] = datetime.utcnow()
+
+    # UPDATE ... RETURNING gives the new row without a commit + refresh round-trip
+    job = db.scalars(
+        update(LabellingJob)
+        .where(LabellingJob.id == job.id)
+        .values(**values)
+        .returning(LabellingJob)
+        .execution_options(populate_existing=True)
+    ).one()
 
     dataset_name = job.dataset.name if job.dataset else None
     response = LabellingJobResponse(
@@ -405,11 +524,13 @@ async def update_labelling_job(
         created_at=job.created_at,
         updated_at=job.updated_at
     )
+    db.commit()
+    get_response_cache().invalidate(LABELLING_JOBS_CACHE_NAMESPACE)
     return response
 
 
 @router.delete("/labelling-jobs/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_labelling_job(
+def delete_labelling_job(
     job_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_write_access)
@@ -434,13 +555,14 @@ async def delete_labelling_job(
     # Delete job (cascade will handle runs and results)
     db.delete(job)
     db.commit()
+    get_response_cache().invalidate(LABELLING_JOBS_CACHE_NAMESPACE)
 
     logger.info(f"Deleted labelling job {job_id}")
     return None
 
 
 @router.post("/labelling-jobs/{job_id}/trigger", status_code=status.HTTP_202_ACCEPTED)
-async def trigger_labelling_job(
+def trigger_labelling_job(
     job_id: str,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
@@ -466,21 +588,40 @@ async def trigger_labelling_job(
 
     logger.info(f"Manual trigger for job {job_id}")
 
-    # Execute in background thread
-    run_job_in_thread(str(job_id), 'manual')
+    if settings.USE_CLOUD_TASKS:
+        # Production: hand the run to a Cloud Tasks worker so job compute
+        # doesn't share this API instance and survives restarts
+        try:
+            task_name = get_cloud_tasks_service().enqueue_labelling_job_task(str(job_id), trigger_type='manual')
+            logger.info(f"Enqueued Cloud Task for job {job_id}: {task_name}")
+        except Exception as e:
+            logger.error(f"Failed to enqueue Cloud Task for job {job_id}: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to enqueue job: {str(e)}"
+            )
+    else:
+        # Local development: execute after the response is sent
+        background_tasks.add_task(_run_job_bg, str(job_id), 'manual')
 
     return {"message": "Job execution started", "job_id": str(job_id)}
 
 
 @router.get("/labelling-jobs/{job_id}/runs", response_model=List[LabellingJobRunResponse])
-async def get_job_runs(
+def get_job_runs(
     job_id: str,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get execution history for a labelling job"""
+    """
+    Get execution history for a labelling job.
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` to page
+    by keyset instead of offset.
+    """
     # Verify job exists
     job = db.query(LabellingJob).filter(
         LabellingJob.id == job_id
@@ -493,41 +634,67 @@ async def get_job_runs(
         )
 
     # Get runs
-    runs = db.query(LabellingJobRun).filter(
+    query = db.query(LabellingJobRun).options(load_only(*JOB_RUN_COLUMNS)).filter(
         LabellingJobRun.labelling_job_id == job_id
-    ).order_by(LabellingJobRun.started_at.desc()).limit(limit).offset(offset).all()
-
-    # Convert to response objects with proper UUID->string conversion
-    return [
-        LabellingJobRunResponse(
-            id=str(run.id),
-            labelling_job_id=str(run.labelling_job_id),
-            status=run.status,
-            trigger_type=run.trigger_type,
-            images_discovered=run.images_discovered,
-            images_ingested=run.images_ingested,
-            images_labeled=run.images_labeled,
-            images_failed=run.images_failed,
-            started_at=run.started_at,
-            completed_at=run.completed_at,
-            duration_seconds=run.duration_seconds,
-            error_message=run.error_message,
-            created_at=run.created_at
+    )
+
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(LabellingJobRun.started_at, LabellingJobRun.id) < (cursor_ts, cursor_id)
         )
+    elif offset:
+        query = query.offset(offset)
+
+    runs = query.order_by(
+        LabellingJobRun.started_at.desc(), LabellingJobRun.id.desc()
+    ).limit(limit).all()
+
+    # Build raw dicts (UUID->string) and validate/serialize the page in one adapter call
+    raw_runs = [
+        {
+            "id": str(run.id),
+            "labelling_job_id": str(run.labelling_job_id),
+            "status": run.status,
+            "trigger_type": run.trigger_type,
+            "images_discovered": run.images_discovered,
+            "images_ingested": run.images_ingested,
+            "images_labeled": run.images_labeled,
+            "images_failed": run.images_failed,
+            "started_at": run.started_at,
+            "completed_at": run.completed_at,
+            "duration_seconds": run.duration_seconds,
+            "error_message": run.error_message,
+            "created_at": run.created_at
+        }
         for run in runs
     ]
+    response = Response(
+        content=JOB_RUNS_ADAPTER.dump_json(JOB_RUNS_ADAPTER.validate_python(raw_runs)),
+        media_type="application/json"
+    )
+
+    if len(runs) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(runs[-1].started_at, runs[-1].id)
+    return response
 
 
 @router.get("/labelling-jobs/{job_id}/results", response_model=List[LabellingResultResponse])
-async def get_job_results(
+def get_job_results(
     job_id: str,
     run_id: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get labeling results for a job, optionally filtered by run"""
+    """
+    Get labeling results for a job, optionally filtered by run.
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` to page
+    by keyset instead of offset.
+    """
     # Verify job exists
     job = db.query(LabellingJob).filter(
         LabellingJob.id == job_id
@@ -540,29 +707,47 @@ async def get_job_results(
         )
 
     # Query results
-    query = db.query(LabellingResult).filter(
+    query = db.query(LabellingResult).options(load_only(*JOB_RESULT_COLUMNS)).filter(
         LabellingResult.labelling_job_id == job_id
     )
 
     if run_id:
         query = query.filter(LabellingResult.labelling_job_run_id == run_id)
 
-    results = query.order_by(LabellingResult.created_at.desc()).limit(limit).offset(offset).all()
-
-    # Convert to response objects with proper UUID->string conversion
-    return [
-        LabellingResultResponse(
-            id=str(result.id),
-            labelling_job_id=str(result.labelling_job_id),
-            labelling_job_run_id=str(result.labelling_job_run_id),
-            image_id=str(result.image_id),
-            model_response=result.model_response,
-            parsed_answer=result.parsed_answer,
-            confidence_score=result.confidence_score,
-            latency_ms=result.latency_ms,
-            error=result.error,
-            gcs_source_path=result.gcs_source_path,
-            created_at=result.created_at
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(LabellingResult.created_at, LabellingResult.id) < (cursor_ts, cursor_id)
         )
+    elif offset:
+        query = query.offset(offset)
+
+    results = query.order_by(
+        LabellingResult.created_at.desc(), LabellingResult.id.desc()
+    ).limit(limit).all()
+
+    # Build raw dicts (UUID->string) and validate/serialize the page in one adapter call
+    raw_results = [
+        {
+            "id": str(result.id),
+            "labelling_job_id": str(result.labelling_job_id),
+            "labelling_job_run_id": str(result.labelling_job_run_id),
+            "image_id": str(result.image_id),
+            "model_response": result.model_response,
+            "parsed_answer": result.parsed_answer,
+            "confidence_score": result.confidence_score,
+            "latency_ms": result.latency_ms,
+            "error": result.error,
+            "gcs_source_path": result.gcs_source_path,
+            "created_at": result.created_at
+        }
         for result in results
     ]
+    response = Response(
+        content=JOB_RESULTS_ADAPTER.dump_json(JOB_RESULTS_ADAPTER.validate_python(raw_results)),
+        media_type="application/json"
+    )
+
+    if len(results) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(results[-1].created_at, results[-1].id)
+    return response
@@ -1,33 +1,68 @@
 """
 Model Configuration API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
+from sqlalchemy import insert, lambda_stmt, select, update
+from sqlalchemy.orm import Session, undefer
+from pydantic import BaseModel, Field, ValidationError
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
-import httpx
 import structlog
+import asyncio
 import time
-import json
-import io
+import uuid
+import orjson
 
+from core.cache import get_response_cache
+from core.http_cache import make_etag, etag_matches, not_modified
+from core.schemas import UUIDStr
 from core.database import SessionLocal
 from models.evaluation import ModelConfig
 from models.user import User
+from api.deps import get_db
 from api.v1.auth import get_current_user
-from services.llm_service import get_llm_service
+from services.llm_service import LLMService, get_llm_service
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+CACHE_NAMESPACE = "model_configs"
+
+EXPORT_BATCH_SIZE = 200  # Rows fetched per round-trip while streaming the export
+
+# Test endpoint limits: overall timeout per prompt (retries included) and
+# in-flight calls per provider, so a slow provider can't absorb every request
+TEST_TIMEOUT_SECONDS = 60
+PROVIDER_TEST_CONCURRENCY = {
+    "anthropic": 5,
+    "openai": 10,
+    "gemini": 10,
+    "vertex": 10,
+}
+DEFAULT_PROVIDER_TEST_CONCURRENCY = 5
+_provider_test_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+# Fields an import item may overwrite on an existing config (api_key handled separately)
+IMPORT_FIELDS = frozenset({
+    "name", "provider", "model_name", "auth_type", "temperature", "max_tokens",
+    "concurrency", "additional_params", "pricing_config", "retry_config", "is_active",
+})
+
+# Columns needed for ModelConfigListItem
+MODEL_CONFIG_LIST_COLUMNS = (
+    ModelConfig.id,
+    ModelConfig.name,
+    ModelConfig.provider,
+    ModelConfig.model_name,
+    ModelConfig.auth_type,
+    ModelConfig.is_active,
+    ModelConfig.created_at,
+)
+
+# Built once: the list query has no parameters
+LIST_STMT = select(*MODEL_CONFIG_LIST_COLUMNS).order_by(ModelConfig.created_at.desc())
 
 # Schemas
 class ModelConfigCreate(BaseModel):
@@ -43,11 +78,12 @@ class ModelConfigCreate(BaseModel):
     pricing_config: Optional[dict] = None  # Cost tracking configuration
     retry_config: Optional[dict] = None  # Retry configuration: {"max_attempts": 5, "initial_wait": 2, "max_wait": 30, "exponential_base": 2}
 
-    @validator('concurrency')
-    def validate_concurrency(cls, v):
-        if v < 1 or v > 100:
-            raise ValueError('Concurrency must be between 1 and 100')
-        return v
+class ModelConfigImportItem(ModelConfigCreate):
+    """One entry of an import file; `id` selects an existing config to update"""
+    id: Optional[str] = None
+    additional_params: Optional[dict] = Field(default_factory=dict)
+    pricing_config: Optional[dict] = Field(default_factory=dict)
+    is_active: bool = True
 
 class ModelConfigUpdate(BaseModel):
     name: Optional[str] = None
@@ -63,14 +99,8 @@ class ModelConfigUpdate(BaseModel):
     retry_config: Optional[dict] = None  # Retry configuration
     is_active: Optional[bool] = None
 
-    @validator('concurrency')
-    def validate_concurrency(cls, v):
-        if v is not None and (v < 1 or v > 100):
-            raise ValueError('Concurrency must be between 1 and 100')
-        return v
-
 class ModelConfigResponse(BaseModel):
-    id: str
+    id: UUIDStr
     name: str
     provider: str
     model_name: str
@@ -85,8 +115,11 @@ class ModelConfigResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    class Config:
+        from_attributes = True
+
 class ModelConfigListItem(BaseModel):
-    id: str
+    id: UUIDStr
     name: str
     provider: str
     model_name: str
@@ -94,126 +127,168 @@ class ModelConfigListItem(BaseModel):
     is_active: bool
     created_at: datetime
 
+    class Config:
+        from_attributes = True
+
 class TestRequest(BaseModel):
+    prompt: Optional[str] = None
+    prompts: Optional[List[str]] = Field(default=None, max_length=20, description="Test several prompts concurrently")
+
+class PromptTestResult(BaseModel):
     prompt: str
+    success: bool
+    response: Optional[str] = None
+    error: Optional[str] = None
+    latency_ms: Optional[int] = None
 
 class TestResponse(BaseModel):
     success: bool
     response: Optional[str] = None
     error: Optional[str] = None
     latency_ms: Optional[int] = None
+    results: Optional[List[PromptTestResult]] = None  # Set when `prompts` was given
 
 class ImportResponse(BaseModel):
     message: str
     imported_count: int
     updated_count: int
 
+def _parse_uuid(value: Any) -> Optional[uuid.UUID]:
+    """Parse an id from an import item, or None if missing/malformed"""
+    if not value:
+        return None
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+def _version_stmt(config_uuid: uuid.UUID):
+    """updated_at probe for ETags; lambda_stmt caches construction, config_uuid becomes a bind"""
+    return lambda_stmt(lambda: select(ModelConfig.updated_at).where(ModelConfig.id == config_uuid))
+
+def _get_config_or_404(db: Session, config_id: str, *options) -> ModelConfig:
+    """Primary-key lookup through the session identity map; 404 if unknown or malformed"""
+    config_uuid = _parse_uuid(config_id)
+    config = db.get(ModelConfig, config_uuid, options=options) if config_uuid else None
+    if not config:
+        raise HTTPException(status_code=404, detail="Model config not found")
+    return config
+
 # Endpoints
+# Endpoints that only do blocking Session I/O are plain `def` so FastAPI runs
+# them in its threadpool; export (streams from its own session) and test
+# (awaits provider calls) stay async
 @router.get("/export")
 async def export_model_configs(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
-    """Export all model configurations as JSON"""
-    configs = db.query(ModelConfig).all()
-
-    export_data = []
-    for c in configs:
-        data = {
-            "id": str(c.id), # Include ID to allow updates
-            "name": c.name,
-            "provider": c.provider,
-            "model_name": c.model_name,
-            "auth_type": c.auth_type,
-            "temperature": c.temperature,
-            "max_tokens": c.max_tokens,
-            "concurrency": c.concurrency,
-            "additional_params": c.additional_params,
-            "pricing_config": c.pricing_config,
-            "retry_config": c.retry_config,
-            "is_active": c.is_active
-            # Exclude API Key for security
-        }
-        export_data.append(data)
-
-    json_str = json.dumps(export_data, indent=2)
-    stream = io.StringIO(json_str)
-
+    """Export all model configurations as JSON (streamed row by row)"""
     return StreamingResponse(
-        stream,
+        _iter_export_json(),
         media_type="application/json",
         headers={"Content-Disposition": "attachment; filename=model_configs_export.json"}
     )
 
+def _iter_export_json():
+    """
+    Yield the export as a JSON array, one config per chunk.
+
+    Uses its own session: the request's get_db session is closed before a
+    streaming body is sent.
+    """
+    db = SessionLocal()
+    try:
+        configs = db.scalars(
+            select(ModelConfig)
+            .options(undefer(ModelConfig.additional_params))
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+
+        yield b"["
+        separator = b"\n"
+        for c in configs:
+            data = {
+                "id": str(c.id), # Include ID to allow updates
+                "name": c.name,
+                "provider": c.provider,
+                "model_name": c.model_name,
+                "auth_type": c.auth_type,
+                "temperature": c.temperature,
+                "max_tokens": c.max_tokens,
+                "concurrency": c.concurrency,
+                "additional_params": c.additional_params,
+                "pricing_config": c.pricing_config,
+                "retry_config": c.retry_config,
+                "is_active": c.is_active
+                # Exclude API Key for security
+            }
+            yield separator + orjson.dumps(data)
+            separator = b",\n"
+        yield b"\n]"
+    finally:
+        db.close()
+
 @router.post("/import", response_model=ImportResponse)
-async def import_model_configs(
+def import_model_configs(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Import model configurations from JSON file"""
     try:
-        content = await file.read()
-        data = json.loads(content)
-    except json.JSONDecodeError:
+        content = file.file.read()
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON file")
 
     if not isinstance(data, list):
         raise HTTPException(status_code=400, detail="JSON root must be a list of model objects")
 
-    imported = 0
-    updated = 0
-
-    for item in data:
-        # Validate minimal required fields
-        if not all(k in item for k in ("name", "provider", "model_name")):
-            continue
-
-        existing = None
-        if "id" in item and item["id"]:
-            # Try to match by ID for update
-            existing = db.query(ModelConfig).filter(
-                ModelConfig.id == item["id"]
-            ).first()
-
-        if existing:
-            # Update existing
-            existing.name = item.get("name", existing.name)
-            existing.provider = item.get("provider", existing.provider)
-            existing.model_name = item.get("model_name", existing.model_name)
-            existing.auth_type = item.get("auth_type", existing.auth_type)
-            existing.temperature = item.get("temperature", existing.temperature)
-            existing.max_tokens = item.get("max_tokens", existing.max_tokens)
-            existing.concurrency = item.get("concurrency", existing.concurrency)
-            existing.additional_params = item.get("additional_params", existing.additional_params)
-            existing.pricing_config = item.get("pricing_config", existing.pricing_config)
-            existing.retry_config = item.get("retry_config", existing.retry_config)
-            existing.is_active = item.get("is_active", existing.is_active)
-            if "api_key" in item and item["api_key"]:
-                existing.api_key = item["api_key"]
-            updated += 1
+    items = []
+    for raw in data:
+        try:
+            items.append(ModelConfigImportItem.model_validate(raw))
+        except ValidationError:
+            continue  # Skip malformed entries (missing required fields, bad types or ranges)
+
+    # One IN query to find which payload ids already exist (instead of a SELECT per item)
+    payload_ids = {_parse_uuid(item.id) for item in items} - {None}
+    existing_ids = set(db.scalars(
+        select(ModelConfig.id).where(ModelConfig.id.in_(payload_ids))
+    )) if payload_ids else set()
+
+    inserts = []
+    updates = []
+    for item in items:
+        config_id = _parse_uuid(item.id)
+
+        if config_id in existing_ids:
+            # Update existing: only fields present in the item are overwritten
+            mapping = item.model_dump(include=IMPORT_FIELDS, exclude_unset=True)
+            mapping["id"] = config_id
+            if item.api_key:
+                mapping["api_key"] = item.api_key
+            updates.append(mapping)
         else:
             # Create new (Add)
             # Ignore ID from JSON to allow creation of new record with fresh UUID
-            new_config = ModelConfig(
-                name=item["name"],
-                provider=item["provider"],
-                model_name=item["model_name"],
-                api_key=item.get("api_key", "sk-placeholder"),
-                auth_type=item.get("auth_type", "api_key"),
-                temperature=item.get("temperature", 0.0),
-                max_tokens=item.get("max_tokens", 1024),
-                concurrency=item.get("concurrency", 3),
-                additional_params=item.get("additional_params", {}),
-                pricing_config=item.get("pricing_config", {}),
-                retry_config=item.get("retry_config"),
-                is_active=item.get("is_active", True),
+            mapping = item.model_dump(exclude={"id"})
+            mapping.update(
+                id=uuid.uuid4(),
+                api_key=item.api_key or "sk-placeholder",
                 created_by_id=current_user.id
             )
-            db.add(new_config)
-            imported += 1
+            inserts.append(mapping)
+
+    if updates:
+        db.bulk_update_mappings(ModelConfig, updates)
+    if inserts:
+        db.bulk_insert_mappings(ModelConfig, inserts)
+    imported = len(inserts)
+    updated = len(updates)
 
     db.commit()
+    get_response_cache().invalidate(CACHE_NAMESPACE)
     return ImportResponse(
         message="Import completed successfully",
         imported_count=imported,
@@ -221,151 +296,143 @@ async def import_model_configs(
     )
 
 @router.get("", response_model=List[ModelConfigListItem])
-async def list_model_configs(
+def list_model_configs(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """List all model configurations for current user"""
-    configs = db.query(ModelConfig).order_by(ModelConfig.created_at.desc()).all()
-
-    return [
-        ModelConfigListItem(
-            id=str(c.id),
-            name=c.name,
-            provider=c.provider,
-            model_name=c.model_name,
-            auth_type=c.auth_type,
-            is_active=c.is_active,
-            created_at=c.created_at
-        )
-        for c in configs
-    ]
+    """List all model configurations for current user (supports If-None-Match)"""
+    def load() -> Tuple[str, List[Dict[str, Any]]]:
+        # Only the listed columns: skips api_key and the JSON config blobs
+        rows = db.execute(LIST_STMT).all()
+        # Cache plain dicts so hits skip model construction
+        items = [ModelConfigListItem.model_validate(r).model_dump() for r in rows]
+        # Hash of the listed content: changes only when the list body would
+        return make_etag(orjson.dumps(items).decode()), items
+
+    etag, items = get_response_cache().get_or_set(CACHE_NAMESPACE, ("list",), load)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return items
 
 @router.post("", response_model=ModelConfigResponse)
-async def create_model_config(
+def create_model_config(
     data: ModelConfigCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Create a new model configuration"""
-    config = ModelConfig(
-        name=data.name,
-        provider=data.provider,
-        model_name=data.model_name,
-        api_key=data.api_key,
-        auth_type=data.auth_type,
-        temperature=data.temperature,
-        max_tokens=data.max_tokens,
-        concurrency=data.concurrency,
-        additional_params=data.additional_params,
-        pricing_config=data.pricing_config,
-        retry_config=data.retry_config,
-        created_by_id=current_user.id
-    )
-    db.add(config)
+    # RETURNING gives the stored row without a follow-up SELECT
+    config = db.scalars(
+        insert(ModelConfig).values(
+            name=data.name,
+            provider=data.provider,
+            model_name=data.model_name,
+            api_key=data.api_key,
+            auth_type=data.auth_type,
+            temperature=data.temperature,
+            max_tokens=data.max_tokens,
+            concurrency=data.concurrency,
+            additional_params=data.additional_params,
+            pricing_config=data.pricing_config,
+            retry_config=data.retry_config,
+            created_by_id=current_user.id
+        ).returning(ModelConfig).options(undefer(ModelConfig.additional_params))
+    ).one()
+
+    # Build response before commit so the returned row isn't expired and re-read
+    result = ModelConfigResponse.model_validate(config)
     db.commit()
-    db.refresh(config)
-
-    return ModelConfigResponse(
-        id=str(config.id),
-        name=config.name,
-        provider=config.provider,
-        model_name=config.model_name,
-        auth_type=config.auth_type,
-        temperature=config.temperature,
-        max_tokens=config.max_tokens,
-        concurrency=config.concurrency,
-        additional_params=config.additional_params,
-        pricing_config=config.pricing_config,
-        retry_config=config.retry_config,
-        is_active=config.is_active,
-        created_at=config.created_at,
-        updated_at=config.updated_at
-    )
+    get_response_cache().invalidate(CACHE_NAMESPACE)
+    return result
 
 @router.get("/{config_id}", response_model=ModelConfigResponse)
-async def get_model_config(
+def get_model_config(
     config_id: str,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get a specific model configuration"""
-    config = db.query(ModelConfig).filter(
-        ModelConfig.id == config_id
-    ).first()
-    if not config:
-        raise HTTPException(status_code=404, detail="Model config not found")
-
-    return ModelConfigResponse(
-        id=str(config.id),
-        name=config.name,
-        provider=config.provider,
-        model_name=config.model_name,
-        auth_type=config.auth_type,
-        temperature=config.temperature,
-        max_tokens=config.max_tokens,
-        concurrency=config.concurrency,
-        additional_params=config.additional_params,
-        pricing_config=config.pricing_config,
-        retry_config=config.retry_config,
-        is_active=config.is_active,
-        created_at=config.created_at,
-        updated_at=config.updated_at
-    )
+    """Get a specific model configuration (supports If-None-Match)"""
+    cache = get_response_cache()
+    cached = cache.get(CACHE_NAMESPACE, ("detail", config_id))
+
+    # Check the ETag against updated_at before building the full response
+    if cached is not None:
+        updated_at = cached.updated_at
+    else:
+        config_uuid = _parse_uuid(config_id)
+        version = db.execute(_version_stmt(config_uuid)).first() if config_uuid else None
+        if not version:
+            raise HTTPException(status_code=404, detail="Model config not found")
+        updated_at = version.updated_at
+
+    etag = make_etag(config_id, updated_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    if cached is not None:
+        return cached
+
+    config = _get_config_or_404(db, config_id, undefer(ModelConfig.additional_params))
+
+    result = ModelConfigResponse.model_validate(config)
+    cache.set(CACHE_NAMESPACE, ("detail", config_id), result)
+    return result
 
 @router.patch("/{config_id}", response_model=ModelConfigResponse)
-async def update_model_config(
+def update_model_config(
     config_id: str,
     data: ModelConfigUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update a model configuration"""
-    config = db.query(ModelConfig).filter(
-        ModelConfig.id == config_id
+    update_data = data.model_dump(exclude_unset=True)
+    if not update_data:
+        # Empty PATCH: nothing to write (and no updated_at bump), just return the row
+        config = _get_config_or_404(db, config_id, undefer(ModelConfig.additional_params))
+        return ModelConfigResponse.model_validate(config)
+
+    # A malformed id would reach the UUID column and fail as a DB error
+    config_uuid = _parse_uuid(config_id)
+    if not config_uuid:
+        raise HTTPException(status_code=404, detail="Model config not found")
+
+    # Single UPDATE ... RETURNING: no pre-SELECT, no commit + refresh round-trip
+    config = db.scalars(
+        update(ModelConfig)
+        .where(ModelConfig.id == config_uuid)
+        .values(**update_data)
+        .returning(ModelConfig)
+        .options(undefer(ModelConfig.additional_params))
+        .execution_options(populate_existing=True, synchronize_session=False)
     ).first()
     if not config:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Model config not found")
 
-    update_data = data.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(config, key, value)
-
+    result = ModelConfigResponse.model_validate(config)
     db.commit()
-    db.refresh(config)
-
-    return ModelConfigResponse(
-        id=str(config.id),
-        name=config.name,
-        provider=config.provider,
-        model_name=config.model_name,
-        auth_type=config.auth_type,
-        temperature=config.temperature,
-        max_tokens=config.max_tokens,
-        concurrency=config.concurrency,
-        additional_params=config.additional_params,
-        pricing_config=config.pricing_config,
-        retry_config=config.retry_config,
-        is_active=config.is_active,
-        created_at=config.created_at,
-        updated_at=config.updated_at
-    )
+    get_response_cache().invalidate(CACHE_NAMESPACE)
+    return result
 
 @router.delete("/{config_id}")
-async def delete_model_config(
+def delete_model_config(
     config_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete a model configuration"""
-    config = db.query(ModelConfig).filter(
-        ModelConfig.id == config_id
-    ).first()
-    if not config:
-        raise HTTPException(status_code=404, detail="Model config not found")
+    config = _get_config_or_404(db, config_id)
 
     db.delete(config)
     db.commit()
+    get_response_cache().invalidate(CACHE_NAMESPACE)
     return {"message": "Model config deleted"}
 
 @router.post("/{config_id}/test", response_model=TestResponse)
@@ -373,41 +440,158 @@ async def test_model_config(
     config_id: str,
     data: TestRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    llm_service: LLMService = Depends(get_llm_service)
 ):
-    """Test a model configuration with a simple text prompt"""
-    config = db.query(ModelConfig).filter(
-        ModelConfig.id == config_id
-    ).first()
-    if not config:
-        raise HTTPException(status_code=404, detail="Model config not found")
+    """
+    Test a model configuration with a simple text prompt.
+
+    Pass `prompts` to test several prompts at once; they are sent concurrently
+    (bounded by the config's concurrency) and reported per prompt in `results`.
+    """
+    if not data.prompt and not data.prompts:
+        raise HTTPException(status_code=400, detail="Either prompt or prompts is required")
+
+    # Sync lookup off the event loop; the provider calls below are awaited on it
+    config = await run_in_threadpool(_load_config_for_test, db, config_id)
+
+    if not data.prompts:
+        result = await _run_test_prompt(llm_service, config, data.prompt, raise_if_busy=True)
+        return TestResponse(
+            success=result.success,
+            response=result.response,
+            error=result.error,
+            latency_ms=result.latency_ms
+        )
+
+    semaphore = asyncio.Semaphore(config.concurrency or 1)
+
+    async def run_bounded(prompt: str) -> PromptTestResult:
+        async with semaphore:
+            return await _run_test_prompt(llm_service, config, prompt)
 
     start_time = time.time()
+    results = await asyncio.gather(*(run_bounded(p) for p in data.prompts))
+
+    return TestResponse(
+        success=all(r.success for r in results),
+        latency_ms=int((time.time() - start_time) * 1000),
+        results=results
+    )
+
+def _load_config_for_test(db: Session, config_id: str) -> ModelConfig:
+    """
+    Look up the config, then release the request's DB connection.
 
+    Provider calls can take up to TEST_TIMEOUT_SECONDS. Closing the session
+    ends its transaction and returns the pooled connection before that wait,
+    so slow tests can't starve the pool. The config stays usable detached.
+    """
     try:
-        llm_service = get_llm_service()
-        
-        response_text, latency, usage = await llm_service.generate_content(
-            provider_name=config.provider,
-            api_key=config.api_key,
-            auth_type=config.auth_type,
-            model_name=config.model_name,
-            prompt=data.prompt,
-            temperature=config.temperature,
-            max_tokens=config.max_tokens
+        return _get_config_or_404(db, config_id)
+    finally:
+        db.close()
+
+async def _run_test_prompt(
+    llm_service: LLMService,
+    config: ModelConfig,
+    prompt: str,
+    raise_if_busy: bool = False
+) -> PromptTestResult:
+    """
+    Send one test prompt, capturing provider errors instead of raising.
+
+    If no provider slot frees up in time, the result is a failed "provider busy"
+    entry, or a 503 with raise_if_busy (single-prompt tests, where there is
+    nothing else to report).
+    """
+    start_time = time.time()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + TEST_TIMEOUT_SECONDS
+
+    # Cap in-flight test calls per provider across all requests. Waiting for a
+    # slot counts against the same timeout
+    semaphore = _provider_test_semaphore(config.provider)
+    try:
+        await asyncio.wait_for(semaphore.acquire(), timeout=TEST_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "model_config_test_busy",
+            config_id=str(config.id),
+            provider=config.provider,
+            timeout_seconds=TEST_TIMEOUT_SECONDS
+        )
+        if raise_if_busy:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Too many {config.provider} tests in progress, try again shortly",
+                headers={"Retry-After": str(TEST_TIMEOUT_SECONDS)}
+            )
+        return PromptTestResult(
+            prompt=prompt,
+            success=False,
+            error=f"Provider busy: no free {config.provider} slot after {TEST_TIMEOUT_SECONDS}s",
+            latency_ms=int((time.time() - start_time) * 1000)
         )
 
-        return TestResponse(
+    try:
+        # Bound the total time (including retries) so a hung provider can't pin the request
+        response_text, latency, usage = await asyncio.wait_for(
+            llm_service.generate_content(
+                provider_name=config.provider,
+                api_key=config.api_key,
+                auth_type=config.auth_type,
+                model_name=config.model_name,
+                prompt=prompt,
+                temperature=config.temperature,
+                max_tokens=config.max_tokens
+            ),
+            timeout=max(deadline - loop.time(), 0)
+        )
+
+        return PromptTestResult(
+            prompt=prompt,
             success=True,
             response=response_text,
             latency_ms=latency
         )
 
+    except asyncio.TimeoutError:
+        logger.warning(
+            "model_config_test_timeout",
+            config_id=str(config.id),
+            provider=config.provider,
+            timeout_seconds=TEST_TIMEOUT_SECONDS
+        )
+        return PromptTestResult(
+            prompt=prompt,
+            success=False,
+            error=f"Timed out after {TEST_TIMEOUT_SECONDS}s",
+            latency_ms=int((time.time() - start_time) * 1000)
+        )
+
     except Exception as e:
         latency = int((time.time() - start_time) * 1000)
-        logger.error(f"Test error: {str(e)}", exc_info=True)
-        return TestResponse(
+        logger.error(
+            "model_config_test_failed",
+            config_id=str(config.id),
+            provider=config.provider,
+            error=str(e),
+            exc_info=True
+        )
+        return PromptTestResult(
+            prompt=prompt,
             success=False,
             error=str(e),
             latency_ms=latency
-        )
\ No newline at end of file
+        )
+    finally:
+        semaphore.release()
+
+def _provider_test_semaphore(provider: str) -> asyncio.Semaphore:
+    """Process-wide semaphore limiting concurrent test calls to one provider"""
+    semaphore = _provider_test_semaphores.get(provider)
+    if semaphore is None:
+        limit = PROVIDER_TEST_CONCURRENCY.get(provider, DEFAULT_PROVIDER_TEST_CONCURRENCY)
+        semaphore = _provider_test_semaphores.setdefault(provider, asyncio.Semaphore(limit))
+    return semaphore
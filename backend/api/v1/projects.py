@@ -1,16 +1,19 @@
 """
 Project management endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 import structlog
 
+from core.cache import get_response_cache
+from core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from core.responses import PydanticResponse
 from models.user import User
 from api.deps import get_db, require_write_access, get_current_user
-from services.project_service import ProjectService
+from services.project_service import ProjectService, get_project_service, PROJECTS_CACHE_NAMESPACE
 
 logger = structlog.get_logger(__name__)
 
@@ -44,13 +47,15 @@ class DatasetResponse(BaseModel):
         from_attributes = True
 
 
+# Project responses are serialized with exclude_none, so nullable fields
+# default to None and are simply absent from the payload when unset
 class ProjectResponse(BaseModel):
     id: str
     name: str
-    description: Optional[str]
+    description: Optional[str] = None
     question_text: str
     question_type: str
-    question_options: Optional[List[str]]
+    question_options: Optional[List[str]] = None
     created_by_id: str
     created_at: datetime
     updated_at: datetime
@@ -64,12 +69,12 @@ class ProjectResponse(BaseModel):
 class CreatorInfo(BaseModel):
     id: str
     email: str
-    name: Optional[str]
+    name: Optional[str] = None
 
 class ProjectListResponse(BaseModel):
     id: str
     name: str
-    description: Optional[str]
+    description: Optional[str] = None
     question_type: str
     created_at: datetime
     updated_at: datetime
@@ -80,45 +85,113 @@ class ProjectListResponse(BaseModel):
         from_attributes = True
 
 
+# Rows pulled from the DB cursor per round trip when building the list
+LIST_BATCH_SIZE = 200
+
+
+def _build_project_response(project) -> ProjectResponse:
+    """Build the detail response for a project loaded with its datasets"""
+    construct_dataset = DatasetResponse.model_construct
+    datasets = [
+        construct_dataset(
+            id=str(d.id),
+            name=d.name,
+            created_at=d.created_at,
+            image_count=d.image_count or 0
+        )
+        for d in project.datasets
+    ]
+
+    return ProjectResponse.model_construct(
+        id=str(project.id),
+        name=project.name,
+        description=project.description,
+        question_text=project.question_text,
+        question_type=project.question_type,
+        question_options=project.question_options,
+        created_by_id=str(project.created_by_id),
+        created_at=project.created_at,
+        updated_at=project.updated_at,
+        dataset_count=len(datasets),
+        datasets=datasets
+    )
+
+
 @router.get("", response_model=List[ProjectListResponse])
-async def list_projects(
+def list_projects(
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    project_service: ProjectService = Depends(get_project_service)
 ):
-    """List all projects (visible to all authenticated users)"""
-    project_service = ProjectService(db)
-    projects = project_service.list_projects()
-
-    return [
-        ProjectListResponse(
-            id=str(p.id),
-            name=p.name,
-            description=p.description,
-            question_type=p.question_type,
-            created_at=p.created_at,
-            updated_at=p.updated_at,
-            dataset_count=len(p.datasets) if p.datasets else 0,
-            created_by=CreatorInfo(
-                id=str(p.created_by.id),
-                email=p.created_by.email,
-                name=p.created_by.name
-            )
+    """
+    List projects (visible to all authenticated users)
+
+    Without a limit every project is returned. With one, results are paged by
+    keyset: pass the X-Next-Cursor header of the previous page as `cursor`.
+    """
+    after = decode_cursor(cursor) if cursor else None
+
+    def load() -> Tuple[bytes, Optional[str]]:
+        # Fetch one extra row to know whether another page follows
+        projects = project_service.list_projects(
+            db,
+            limit=limit + 1 if limit is not None else None,
+            after=after,
+            yield_per=LIST_BATCH_SIZE
         )
-        for p in projects
-    ]
+
+        # Encode row by row as batches arrive from the cursor, so neither the
+        # full ORM result nor a list of response models is held at once.
+        # Response models are built with model_construct throughout this module:
+        # the values come straight from DB rows, so re-validating them is wasted work
+        chunks = []
+        last = None
+        next_cursor = None
+        for p in projects:
+            if limit is not None and len(chunks) == limit:
+                next_cursor = encode_cursor(last.created_at, last.id)
+                break
+            item = ProjectListResponse.model_construct(
+                id=str(p.id),
+                name=p.name,
+                description=p.description,
+                question_type=p.question_type,
+                created_at=p.created_at,
+                updated_at=p.updated_at,
+                dataset_count=p.dataset_count or 0,
+                created_by=CreatorInfo.model_construct(
+                    id=str(p.created_by.id),
+                    email=p.created_by.email,
+                    name=p.created_by.name
+                )
+            )
+            chunks.append(item.model_dump_json(exclude_none=True).encode("utf-8"))
+            last = p
+        return b"[" + b",".join(chunks) + b"]", next_cursor
+
+    # Cache the serialized body so hits skip both the queries and the encoding
+    body, next_cursor = get_response_cache().get_or_set(
+        PROJECTS_CACHE_NAMESPACE, ("list", limit, cursor), load
+    )
+    response = Response(content=body, media_type="application/json")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
 
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
-async def create_project(
+def create_project(
     project_data: ProjectCreate,
     current_user: User = Depends(require_write_access),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    project_service: ProjectService = Depends(get_project_service)
 ):
     """Create a new project (requires write access)"""
-    project_service = ProjectService(db)
-    project = project_service.create_project(project_data, current_user)
+    project = project_service.create_project(db, project_data, current_user)
 
-    return ProjectResponse(
+    result = ProjectResponse.model_construct(
         id=str(project.id),
         name=project.name,
         description=project.description,
@@ -131,87 +204,48 @@ async def create_project(
         dataset_count=0,
         datasets=[]
     )
+    return PydanticResponse(result, status_code=status.HTTP_201_CREATED, exclude_none=True)
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-async def get_project(
+def get_project(
     project_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    project_service: ProjectService = Depends(get_project_service)
 ):
     """Get project by ID (visible to all authenticated users)"""
-    project_service = ProjectService(db)
-    project = project_service.get_project(project_id)
-
-    datasets = [
-        DatasetResponse(
-            id=str(d.id),
-            name=d.name,
-            created_at=d.created_at,
-            image_count=len(d.images) if d.images else 0
-        )
-        for d in project.datasets
-    ]
+    def load() -> bytes:
+        project = project_service.get_project(db, project_id)
+        return _build_project_response(project).model_dump_json(exclude_none=True).encode("utf-8")
 
-    return ProjectResponse(
-        id=str(project.id),
-        name=project.name,
-        description=project.description,
-        question_text=project.question_text,
-        question_type=project.question_type,
-        question_options=project.question_options,
-        created_by_id=str(project.created_by_id),
-        created_at=project.created_at,
-        updated_at=project.updated_at,
-        dataset_count=len(datasets),
-        datasets=datasets
-    )
+    # A missing project raises 404 inside load(), so misses are never cached
+    body = get_response_cache().get_or_set(PROJECTS_CACHE_NAMESPACE, ("detail", project_id), load)
+    return Response(content=body, media_type="application/json")
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
-async def update_project(
+def update_project(
     project_id: str,
     project_data: ProjectUpdate,
     current_user: User = Depends(require_write_access),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    project_service: ProjectService = Depends(get_project_service)
 ):
     """Update project (requires write access, owner can edit their own projects)"""
-    project_service = ProjectService(db)
-    project = project_service.update_project(project_id, project_data, current_user)
+    project = project_service.update_project(db, project_id, project_data, current_user)
 
-    datasets = [
-        DatasetResponse(
-            id=str(d.id),
-            name=d.name,
-            created_at=d.created_at,
-            image_count=len(d.images) if d.images else 0
-        )
-        for d in project.datasets
-    ]
-
-    return ProjectResponse(
-        id=str(project.id),
-        name=project.name,
-        description=project.description,
-        question_text=project.question_text,
-        question_type=project.question_type,
-        question_options=project.question_options,
-        created_by_id=str(project.created_by_id),
-        created_at=project.created_at,
-        updated_at=project.updated_at,
-        dataset_count=len(datasets),
-        datasets=datasets
-    )
+    return PydanticResponse(_build_project_response(project), exclude_none=True)
 
 
 @router.delete("/{project_id}")
-async def delete_project(
+def delete_project(
     project_id: str,
     current_user: User = Depends(require_write_access),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    project_service: ProjectService = Depends(get_project_service)
 ):
     """Delete project and all its datasets/images (requires write access, owner only)"""
-    project_service = ProjectService(db)
-    project_name = project_service.delete_project(project_id, current_user)
+    project_name = project_service.delete_project(db, project_id, current_user)
 
     return {"message": f"Project '{project_name}' deleted successfully"}
@@ -6,8 +6,9 @@ import structlog
 import asyncio
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Header
+from sqlalchemy import update
 from sqlalchemy.orm import Session
-from core.database import SessionLocal
+from api.deps import get_db
 from services.image_processing_service import ImageProcessingService
 from services.labelling_job_service import get_labelling_job_service
 from services.cloud_tasks_service import get_cloud_tasks_service
@@ -17,14 +18,8 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
-
-def get_db():
-    """Dependency to get database session"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# Max Cloud Tasks enqueue calls in flight at once from the scheduler
+SCHEDULER_ENQUEUE_CONCURRENCY = 32
 
 
 @router.post("/internal/tasks/process-dataset/{dataset_id}")
@@ -49,17 +44,17 @@ async def process_dataset_task(
     # Security: Verify request is from Cloud Tasks
     # Cloud Tasks automatically adds X-CloudTasks-TaskName header
     if not x_cloudtasks_taskname:
-        logger.warning(f"Unauthorized access attempt to process-dataset endpoint")
+        logger.warning("task_unauthorized", endpoint="process-dataset")
         raise HTTPException(status_code=403, detail="Unauthorized - must be called by Cloud Tasks")
 
-    logger.info(f"Processing dataset {dataset_id} (task: {x_cloudtasks_taskname})")
+    logger.info("dataset_processing_started", dataset_id=dataset_id, task_name=x_cloudtasks_taskname)
 
     try:
         # Create service and process dataset
         service = ImageProcessingService()
         await service.process_dataset_images(dataset_id, db)
 
-        logger.info(f"Dataset {dataset_id} processing completed successfully")
+        logger.info("dataset_processing_completed", dataset_id=dataset_id)
         return {
             "status": "completed",
             "dataset_id": dataset_id,
@@ -67,13 +62,14 @@ async def process_dataset_task(
         }
 
     except Exception as e:
-        logger.error(f"Error processing dataset {dataset_id}: {str(e)}", exc_info=True)
+        logger.error("dataset_processing_failed", dataset_id=dataset_id, error=str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
 
 @router.post("/internal/tasks/run-labelling-job/{job_id}")
 async def run_labelling_job_task(
     job_id: str,
+    trigger_type: str = 'scheduled',
     db: Session = Depends(get_db),
     x_cloudtasks_taskname: str | None = Header(None)
 ):
@@ -83,6 +79,7 @@ async def run_labelling_job_task(
 
     Args:
         job_id: UUID of the labelling job to run
+        trigger_type: 'manual' or 'scheduled' (set by the enqueuer)
         x_cloudtasks_taskname: Header set by Cloud Tasks (for verification)
 
     Returns:
@@ -90,17 +87,17 @@ async def run_labelling_job_task(
     """
     # Security: Verify request is from Cloud Tasks
     if not x_cloudtasks_taskname:
-        logger.warning(f"Unauthorized access attempt to run-labelling-job endpoint")
+        logger.warning("task_unauthorized", endpoint="run-labelling-job")
         raise HTTPException(status_code=403, detail="Unauthorized - must be called by Cloud Tasks")
 
-    logger.info(f"Running labelling job {job_id} (task: {x_cloudtasks_taskname})")
+    logger.info("labelling_job_task_started", job_id=job_id, task_name=x_cloudtasks_taskname)
 
     try:
         # Get service and run job
         service = get_labelling_job_service()
-        run = await service.run_job(job_id, db, trigger_type='scheduled')
+        run = await service.run_job(job_id, db, trigger_type=trigger_type)
 
-        logger.info(f"Labelling job {job_id} completed successfully")
+        logger.info("labelling_job_task_completed", job_id=job_id)
         return {
             "status": "completed",
             "job_id": job_id,
@@ -111,7 +108,7 @@ async def run_labelling_job_task(
         }
 
     except Exception as e:
-        logger.error(f"Error running labelling job {job_id}: {str(e)}", exc_info=True)
+        logger.error("labelling_job_task_failed", job_id=job_id, error=str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=f"Job execution failed: {str(e)}")
 
 
@@ -138,52 +135,71 @@ async def check_scheduled_jobs_task(
     # Security: Verify request is from Cloud Scheduler
     # Cloud Scheduler adds X-CloudScheduler header
     if not x_cloudscheduler:
-        logger.warning(f"Unauthorized access attempt to check-scheduled-jobs endpoint")
+        logger.warning("task_unauthorized", endpoint="check-scheduled-jobs")
         raise HTTPException(status_code=403, detail="Unauthorized - must be called by Cloud Scheduler")
 
-    logger.info(f"Checking scheduled labelling jobs (scheduler: {x_cloudscheduler})")
+    logger.info("scheduled_jobs_check_started", scheduler=x_cloudscheduler)
 
     try:
         now = datetime.utcnow()
 
-        # Query active jobs that are due
-        due_jobs = db.query(LabellingJob).filter(
+        # Query active jobs that are due; only the columns used below, so the
+        # partial (is_active, next_run_at) index can answer it on its own
+        due_jobs = db.query(
+            LabellingJob.id, LabellingJob.name, LabellingJob.frequency_minutes
+        ).filter(
             LabellingJob.is_active == True,
             LabellingJob.next_run_at <= now
         ).all()
 
-        logger.info(f"Found {len(due_jobs)} labelling jobs due for execution")
+        logger.info("scheduled_jobs_due", count=len(due_jobs))
 
         triggered_jobs = []
         failed_jobs = []
+        next_run_updates = []
 
-        # Enqueue tasks for each due job
+        # Enqueue tasks for all due jobs concurrently; the Cloud Tasks client
+        # is blocking, so each call runs in a worker thread
         cloud_tasks = get_cloud_tasks_service()
+        semaphore = asyncio.Semaphore(SCHEDULER_ENQUEUE_CONCURRENCY)
 
-        for job in due_jobs:
-            try:
-                # Enqueue Cloud Task
-                task_name = cloud_tasks.enqueue_labelling_job_task(str(job.id))
+        async def enqueue(job_id: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(cloud_tasks.enqueue_labelling_job_task, job_id)
 
-                # Update next run time
-                job.next_run_at = now + timedelta(minutes=job.frequency_minutes)
-                db.commit()
+        results = await asyncio.gather(
+            *(enqueue(str(job.id)) for job in due_jobs),
+            return_exceptions=True
+        )
 
-                triggered_jobs.append({
+        for job, result in zip(due_jobs, results):
+            if isinstance(result, Exception):
+                logger.error("scheduled_job_enqueue_failed", job_id=str(job.id), job_name=job.name, error=str(result))
+                failed_jobs.append({
                     "job_id": str(job.id),
                     "job_name": job.name,
-                    "task_name": task_name
+                    "error": str(result)
                 })
+                continue
 
-                logger.info(f"✓ Enqueued job {job.id}: {job.name}")
+            # Update next run time
+            next_run_updates.append({
+                "id": job.id,
+                "next_run_at": now + timedelta(minutes=job.frequency_minutes)
+            })
 
-            except Exception as e:
-                logger.error(f"✗ Failed to enqueue job {job.id}: {str(e)}")
-                failed_jobs.append({
-                    "job_id": str(job.id),
-                    "job_name": job.name,
-                    "error": str(e)
-                })
+            triggered_jobs.append({
+                "job_id": str(job.id),
+                "job_name": job.name,
+                "task_name": result
+            })
+
+            logger.info("scheduled_job_enqueued", job_id=str(job.id), job_name=job.name, task_name=result)
+
+        # Reschedule every enqueued job in one bulk UPDATE by primary key
+        if next_run_updates:
+            db.execute(update(LabellingJob), next_run_updates)
+            db.commit()
 
         return {
             "status": "completed",
@@ -194,5 +210,5 @@ async def check_scheduled_jobs_task(
         }
 
     except Exception as e:
-        logger.error(f"Error checking scheduled jobs: {str(e)}", exc_info=True)
+        logger.error("scheduled_jobs_check_failed", error=str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=f"Scheduler check failed: {str(e)}")
@@ -1,34 +1,34 @@
 """
 User management endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import delete, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, EmailStr
-from typing import List, Optional
+from pydantic import BaseModel, EmailStr, TypeAdapter
+from typing import List, Optional, Tuple
 from datetime import datetime
 import structlog
+import uuid
 
-from core.database import SessionLocal
+from core.cache import get_response_cache
+from core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from core.responses import PydanticResponse
+from api.deps import get_db
 from models.user import User, UserRole
-from api.v1.auth import get_current_user
+from api.v1.auth import get_current_user, USERS_CACHE_NAMESPACE, USER_DEPENDENT_CACHE_NAMESPACES
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
-
-def get_db():
-    """Database session dependency"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+ROLE_VALUES = tuple(r.value for r in UserRole)
+_VALID_ROLES = frozenset(ROLE_VALUES)
 
 
 # Pydantic models
 class UserResponse(BaseModel):
-    id: str
+    id: uuid.UUID  # Serialized to its canonical string by pydantic-core, no Python-side str()
     email: str
     name: Optional[str]
     picture_url: Optional[str]
@@ -41,6 +41,9 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+
+
 class UserCreate(BaseModel):
     email: EmailStr
     name: Optional[str] = None
@@ -63,104 +66,127 @@ async def require_admin(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
+def _user_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="User not found"
+    )
+
+
+def _parse_user_id(user_id: str) -> uuid.UUID:
+    """Parse a user id path parameter; 404 if malformed"""
+    try:
+        return uuid.UUID(user_id)
+    except ValueError:
+        raise _user_not_found()
+
+
+def _get_user_or_404(db: Session, user_id: str) -> User:
+    """Primary-key lookup through the session identity map; 404 if unknown or malformed"""
+    user = db.get(User, _parse_user_id(user_id))
+    if not user:
+        raise _user_not_found()
+    return user
+
+
 @router.get("", response_model=List[UserResponse])
-async def list_users(
+def list_users(
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
     admin: User = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
-    """List all users (admin only)"""
-    users = db.query(User).order_by(User.created_at.desc()).all()
-    return [
-        UserResponse(
-            id=str(u.id),
-            email=u.email,
-            name=u.name,
-            picture_url=u.picture_url,
-            role=u.role,
-            is_active=u.is_active,
-            created_at=u.created_at,
-            last_login_at=u.last_login_at
-        )
-        for u in users
-    ]
+    """
+    List all users (admin only)
+
+    Without a limit every user is returned. With one, results are paged by
+    keyset: pass the X-Next-Cursor header of the previous page as `cursor`.
+    """
+    after = decode_cursor(cursor) if cursor else None
+
+    def load() -> Tuple[bytes, Optional[str]]:
+        # Walks idx_users_created_at; fetch one extra row to know whether another page follows
+        query = db.query(User)
+        if after is not None:
+            query = query.filter(tuple_(User.created_at, User.id) < after)
+        query = query.order_by(User.created_at.desc(), User.id.desc())
+        if limit is not None:
+            query = query.limit(limit + 1)
+        users = query.all()
+
+        next_cursor = None
+        if limit is not None and len(users) > limit:
+            users = users[:limit]
+            next_cursor = encode_cursor(users[-1].created_at, users[-1].id)
+        body = USER_LIST_ADAPTER.dump_json(USER_LIST_ADAPTER.validate_python(users, from_attributes=True))
+        return body, next_cursor
+
+    # Users change rarely; cache the serialized page until the next write
+    body, next_cursor = get_response_cache().get_or_set(
+        USERS_CACHE_NAMESPACE, ("list", limit, cursor), load
+    )
+    response = Response(content=body, media_type="application/json")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
 
 
 @router.post("", response_model=UserResponse)
-async def create_user(
+def create_user(
     user_data: UserCreate,
     admin: User = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Create a new user (admin only)"""
 
-    # Check if user already exists
-    existing = db.query(User).filter(User.email == user_data.email).first()
-    if existing:
+    # Validate role
+    if user_data.role not in _VALID_ROLES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User with this email already exists"
+            detail=f"Invalid role. Must be one of: {list(ROLE_VALUES)}"
         )
 
-    # Validate role
-    if user_data.role not in [r.value for r in UserRole]:
+    # One INSERT ... ON CONFLICT DO NOTHING RETURNING: the unique email index
+    # replaces the existence pre-check, and RETURNING the follow-up SELECT
+    user = db.scalars(
+        insert(User).values(
+            email=user_data.email,
+            name=user_data.name,
+            role=user_data.role,
+            is_active=True
+        ).on_conflict_do_nothing(index_elements=[User.email]).returning(User)
+    ).one_or_none()
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid role. Must be one of: {[r.value for r in UserRole]}"
+            detail="User with this email already exists"
         )
 
-    user = User(
-        email=user_data.email,
-        name=user_data.name,
-        role=user_data.role,
-        is_active=True
-    )
-    db.add(user)
+    # Build response before commit so the returned row isn't expired and re-read
+    result = UserResponse.model_validate(user)
     db.commit()
-    db.refresh(user)
+    get_response_cache().invalidate(USERS_CACHE_NAMESPACE)
 
-    logger.info(f"Created user: {user.email} with role: {user.role}")
-
-    return UserResponse(
-        id=str(user.id),
-        email=user.email,
-        name=user.name,
-        picture_url=user.picture_url,
-        role=user.role,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        last_login_at=user.last_login_at
-    )
+    logger.info(f"Created user: {result.email} with role: {result.role}")
+
+    return PydanticResponse(result)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(
+def get_user(
     user_id: str,
     admin: User = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Get user by ID (admin only)"""
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
+    user = _get_user_or_404(db, user_id)
 
-    return UserResponse(
-        id=str(user.id),
-        email=user.email,
-        name=user.name,
-        picture_url=user.picture_url,
-        role=user.role,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        last_login_at=user.last_login_at
-    )
+    return PydanticResponse(UserResponse.model_validate(user))
 
 
 @router.patch("/{user_id}", response_model=UserResponse)
-async def update_user(
+def update_user(
     user_id: str,
     user_data: UserUpdate,
     admin: User = Depends(require_admin),
@@ -168,21 +194,16 @@ async def update_user(
 ):
     """Update user (admin only)"""
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
+    user = _get_user_or_404(db, user_id)
 
     if user_data.name is not None:
         user.name = user_data.name
 
     if user_data.role is not None:
-        if user_data.role not in [r.value for r in UserRole]:
+        if user_data.role not in _VALID_ROLES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid role. Must be one of: {[r.value for r in UserRole]}"
+                detail=f"Invalid role. Must be one of: {list(ROLE_VALUES)}"
             )
         user.role = user_data.role
 
@@ -191,46 +212,43 @@ async def update_user(
 
     db.commit()
     db.refresh(user)
+    get_response_cache().invalidate(*USER_DEPENDENT_CACHE_NAMESPACES)
 
     logger.info(f"Updated user: {user.email}")
 
-    return UserResponse(
-        id=str(user.id),
-        email=user.email,
-        name=user.name,
-        picture_url=user.picture_url,
-        role=user.role,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        last_login_at=user.last_login_at
-    )
+    return PydanticResponse(UserResponse.model_validate(user))
 
 
 @router.delete("/{user_id}")
-async def delete_user(
+def delete_user(
     user_id: str,
     admin: User = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Delete user (admin only)"""
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
+    user_uuid = _parse_user_id(user_id)
 
     # Prevent self-deletion
-    if str(user.id) == str(admin.id):
+    if user_uuid == admin.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete your own account"
         )
 
-    db.delete(user)
+    # DELETE ... RETURNING doubles as the existence check
+    email = db.execute(
+        delete(User)
+        .where(User.id == user_uuid)
+        .returning(User.email)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    if email is None:
+        raise _user_not_found()
+
     db.commit()
+    get_response_cache().invalidate(*USER_DEPENDENT_CACHE_NAMESPACES)
 
-    logger.info(f"Deleted user: {user.email}")
+    logger.info(f"Deleted user: {email}")
 
-    return {"message": f"User {user.email} deleted successfully"}
+    return {"message": f"User {email} deleted successfully"}
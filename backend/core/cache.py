@@ -0,0 +1,132 @@
+"""
+In-process response cache with namespace invalidation.
+
+Used by read-heavy GET endpoints whose rows rarely change between calls.
+Entries expire after a short TTL so instances that did not see a write
+converge quickly; writes in this process invalidate the whole namespace.
+Expired entries linger for a short stale window so that, while one caller
+regenerates them via get_or_set, concurrent callers get the stale value
+instead of all hitting the database at once.
+"""
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+import structlog
+
+from core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_TTL_SECONDS = 30
+DEFAULT_STALE_SECONDS = 0
+DEFAULT_MAX_ENTRIES = 256  # Per namespace
+
+
+class ResponseCache:
+    """Thread-safe TTL cache partitioned into invalidation namespaces"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        stale_seconds: float = DEFAULT_STALE_SECONDS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stale_seconds = stale_seconds
+        self._namespaces: Dict[str, "OrderedDict[Hashable, Tuple[float, Any]]"] = {}
+        self._generations: Dict[str, int] = {}  # Bumped on invalidate
+        self._refreshing: Set[Tuple[str, Hashable]] = set()
+        self._lock = Lock()
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expired entry"""
+        with self._lock:
+            entries = self._namespaces.get(namespace)
+            if not entries or key not in entries:
+                return None
+
+            expires_at, value = entries[key]
+            now = time.monotonic()
+            if expires_at < now:
+                # Keep it around for get_or_set while still inside the stale window
+                if expires_at + self.stale_seconds < now:
+                    del entries[key]
+                return None
+
+            entries.move_to_end(key)
+            return value
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        expires_at = time.monotonic() + (ttl_seconds if ttl_seconds is not None else self.ttl_seconds)
+        with self._lock:
+            self._store(namespace, key, expires_at, value)
+
+    def _store(self, namespace: str, key: Hashable, expires_at: float, value: Any) -> None:
+        """Insert an entry; caller must hold the lock"""
+        entries = self._namespaces.setdefault(namespace, OrderedDict())
+        entries[key] = (expires_at, value)
+        entries.move_to_end(key)
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def get_or_set(self, namespace: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value, calling loader() to build it on a miss.
+
+        If the entry has expired but is within the stale window and another
+        caller is already regenerating it, the stale value is returned.
+        """
+        refresh_key = (namespace, key)
+        with self._lock:
+            entries = self._namespaces.get(namespace)
+            entry = entries.get(key) if entries else None
+            if entry is not None:
+                expires_at, value = entry
+                now = time.monotonic()
+                if now <= expires_at:
+                    entries.move_to_end(key)
+                    return value
+                if now <= expires_at + self.stale_seconds and refresh_key in self._refreshing:
+                    return value
+            self._refreshing.add(refresh_key)
+            generation = self._generations.get(namespace, 0)
+
+        try:
+            value = loader()
+        finally:
+            with self._lock:
+                self._refreshing.discard(refresh_key)
+
+        with self._lock:
+            # Don't store a value built from rows that a concurrent write replaced
+            if self._generations.get(namespace, 0) == generation:
+                self._store(namespace, key, time.monotonic() + self.ttl_seconds, value)
+        return value
+
+    def invalidate(self, *namespaces: str) -> None:
+        """Drop every entry in the given namespaces (call after create/update/delete)"""
+        with self._lock:
+            for namespace in namespaces:
+                self._namespaces.pop(namespace, None)
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        logger.debug("response_cache_invalidated", namespaces=namespaces)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        with self._lock:
+            self._namespaces.clear()
+
+
+_response_cache = ResponseCache(
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    stale_seconds=settings.RESPONSE_CACHE_STALE_SECONDS,
+)
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide ResponseCache instance"""
+    return _response_cache
@@ -1,9 +1,10 @@
 """
 Application configuration using Pydantic settings
 """
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
-from typing import List
+from functools import cached_property
+from typing import FrozenSet, List, Literal
 import os
 import yaml
 from pathlib import Path
@@ -23,9 +24,9 @@ class Settings(BaseSettings):
     # CORS - can be set via CORS_ALLOWED_ORIGINS env var (comma-separated)
     CORS_ALLOWED_ORIGINS: str = ""
 
-    @property
+    @cached_property
     def ALLOWED_ORIGINS(self) -> List[str]:
-        """Get allowed origins from env var, YAML config, or use defaults"""
+        """Get allowed origins from env var, YAML config, or use defaults (resolved once)"""
         # Priority 1: Environment variable (for quick overrides)
         if self.CORS_ALLOWED_ORIGINS:
             return [origin.strip() for origin in self.CORS_ALLOWED_ORIGINS.split(",")]
@@ -57,6 +58,11 @@ class Settings(BaseSettings):
             ])
         return origins
 
+    @cached_property
+    def NORMALIZED_ALLOWED_ORIGINS(self) -> FrozenSet[str]:
+        """Allowed origins without trailing slashes, for redirect validation"""
+        return frozenset(origin.rstrip('/') for origin in self.ALLOWED_ORIGINS)
+
     # Database - can use DATABASE_URL directly or construct from components
     DATABASE_URL: str = ""
     DB_HOST: str = "localhost"
@@ -65,6 +71,13 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = ""
     DB_NAME: str = ""
 
+    # Connection pool (Postgres only). Keep pool + overflow under the instance's
+    # max_connections across all running replicas.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 10  # Seconds to wait for a free connection before erroring
+    DB_POOL_RECYCLE: int = 1800  # Recycle before Cloud SQL / proxy idle timeouts
+
     # Google Cloud / Gemini Configuration
     GEMINI_API_KEY: str = ""  # Legacy AI Studio API key
     VERTEX_AI_API_KEY: str = ""  # Vertex AI API key (preferred)
@@ -80,6 +93,20 @@ class Settings(BaseSettings):
     BACKEND_URL: str = ""  # Backend URL for Cloud Tasks callbacks (set in Cloud Run)
     USE_CLOUD_TASKS: bool = False  # Use Cloud Tasks or local background processing
 
+    # Worker threads for sync (plain def) endpoints and dependencies; AnyIO defaults to 40
+    THREADPOOL_SIZE: int = 100
+
+    # In-process response cache for read-heavy GET endpoints
+    RESPONSE_CACHE_TTL_SECONDS: float = 30
+    RESPONSE_CACHE_STALE_SECONDS: float = 30  # Serve expired entries this long while one request refreshes
+
+    # Shared outbound HTTP client (LLM provider calls)
+    HTTPX_MAX_CONNECTIONS: int = 200
+    HTTPX_MAX_KEEPALIVE_CONNECTIONS: int = 50
+    HTTPX_TIMEOUT_SECONDS: float = 60.0
+    HTTPX_CONNECT_TIMEOUT_SECONDS: float = 10.0
+    PREWARM_PROVIDER_CONNECTIONS: bool = True  # Open provider connections at startup
+
     # LangChain Configuration
     LANGCHAIN_TRACING_V2: bool = False
     LANGCHAIN_API_KEY: str = ""
@@ -90,7 +117,11 @@ class Settings(BaseSettings):
 
     # File Upload
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
-    ALLOWED_IMAGE_TYPES: List[str] = ["image/jpeg", "image/png", "image/gif", "image/webp"]
+    ALLOWED_IMAGE_TYPES: FrozenSet[str] = frozenset({"image/jpeg", "image/png", "image/gif", "image/webp"})
+    # Resampling filter for thumbnails; BICUBIC/BILINEAR trade a little sharpness for speed
+    THUMBNAIL_RESAMPLE: Literal["LANCZOS", "BICUBIC", "BILINEAR"] = "LANCZOS"
+    # Optimized Huffman tables shrink thumbnails ~8% but make the JPEG encode ~1.6x slower
+    THUMBNAIL_OPTIMIZE: bool = False
 
     # Security - SECRET_KEY must be provided via environment variable
     SECRET_KEY: str = ""
@@ -109,23 +140,21 @@ class Settings(BaseSettings):
     # Allowed email domains for access control (comma-separated, e.g., "gmail.com,google.com")
     ALLOWED_EMAIL_DOMAINS: str = ""
 
-    @property
+    @cached_property
     def ADMIN_EMAIL_LIST(self) -> List[str]:
         """Get list of admin emails from env var"""
         if self.ADMIN_EMAILS:
             return [email.strip().lower() for email in self.ADMIN_EMAILS.split(",")]
         return []
 
-    @property
-    def ALLOWED_DOMAIN_LIST(self) -> List[str]:
-        """Get list of allowed email domains for access control"""
+    @cached_property
+    def ALLOWED_DOMAIN_LIST(self) -> FrozenSet[str]:
+        """Get set of allowed email domains for access control"""
         if self.ALLOWED_EMAIL_DOMAINS:
-            return [domain.strip().lower() for domain in self.ALLOWED_EMAIL_DOMAINS.split(",")]
-        return []
+            return frozenset(domain.strip().lower() for domain in self.ALLOWED_EMAIL_DOMAINS.split(","))
+        return frozenset()
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
     def validate_production_settings(self):
         """Validate that critical settings are properly configured for production"""
@@ -1,7 +1,15 @@
+from typing import Generator
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+import orjson
 from core.config import settings
 
+
+def _json_serializer(obj) -> str:
+    """orjson-backed serializer for JSON columns (str keys not required)"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Construct database URL from components or use direct URL if provided
 if settings.DATABASE_URL:
     db_url = settings.DATABASE_URL
@@ -17,12 +25,23 @@ if db_url.startswith("sqlite"):
 else:
     engine = create_engine(
         db_url,
-        pool_size=5,  # Optimized for single instance: 5 persistent connections
-        max_overflow=10,  # Allow burst up to 15 total connections (within db-f1-micro limit)
-        pool_timeout=300,  # Wait up to 5 minutes for a connection instead of failing
+        pool_size=settings.DB_POOL_SIZE,  # Persistent connections
+        max_overflow=settings.DB_MAX_OVERFLOW,  # Extra connections allowed during bursts
+        pool_timeout=settings.DB_POOL_TIMEOUT,  # Fail fast instead of queueing requests for minutes
         pool_pre_ping=True,  # Verify connections before using them
-        pool_recycle=3600,  # Recycle connections after 1 hour
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        json_serializer=_json_serializer,  # orjson for JSON columns (results, configs)
+        json_deserializer=orjson.loads,
     )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
+
+
+def get_db() -> Generator[Session, None, None]:
+    """Database session dependency shared by every router, so one request gets one session"""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
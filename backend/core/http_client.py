@@ -1,11 +1,49 @@
 import httpx
 import structlog
 import asyncio
+import weakref
+
+from core.config import settings
 
 logger = structlog.get_logger(__name__)
 
+# HTTP/2 needs the optional 'h2' package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Keep warm connections to the LLM provider hosts so repeated calls
+# (e.g. model config tests, evaluations) skip the TCP/TLS handshake.
+# max_connections also caps outbound concurrency, so bursts queue here
+# instead of flooding the providers.
+HTTP_TIMEOUT = httpx.Timeout(
+    settings.HTTPX_TIMEOUT_SECONDS,
+    connect=settings.HTTPX_CONNECT_TIMEOUT_SECONDS
+)
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=settings.HTTPX_MAX_KEEPALIVE_CONNECTIONS,
+    max_connections=settings.HTTPX_MAX_CONNECTIONS,
+    keepalive_expiry=60.0
+)
+
+# Provider hosts to open keep-alive connections to at startup; any response
+# (even 404) is fine, the point is to finish DNS + TCP + TLS ahead of traffic
+PROVIDER_WARMUP_URLS = (
+    "https://api.openai.com",
+    "https://api.anthropic.com",
+    "https://generativelanguage.googleapis.com",
+    f"https://{settings.GCP_LOCATION}-aiplatform.googleapis.com",
+)
+PREWARM_TIMEOUT_SECONDS = 5.0
+
 class HttpClient:
-    _clients = {}
+    # One pooled client per event loop: the app loop's is opened at startup and
+    # closed at shutdown; evaluation threads run their own loops and close their
+    # client when done. Keys are weak so a loop that goes away without close()
+    # is not kept alive here along with its client
+    _clients = weakref.WeakKeyDictionary()
 
     @classmethod
     def get_client(cls) -> httpx.AsyncClient:
@@ -19,8 +57,12 @@ class HttpClient:
             if loop in cls._clients:
                 del cls._clients[loop]
 
-            logger.info(f"Initializing HTTP client for loop {id(loop)}")
-            cls._clients[loop] = httpx.AsyncClient(timeout=60.0)
+            logger.info(f"Initializing HTTP client for loop {id(loop)} (http2={HTTP2_AVAILABLE})")
+            cls._clients[loop] = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT,
+                limits=HTTP_LIMITS,
+                http2=HTTP2_AVAILABLE
+            )
 
         return cls._clients[loop]
 
@@ -46,3 +88,19 @@ class HttpClient:
                 except Exception as e:
                     logger.warning(f"Error closing client for loop {id(loop)}: {e}")
         cls._clients.clear()
+
+    @classmethod
+    async def prewarm(cls, urls=PROVIDER_WARMUP_URLS):
+        """Open pooled connections to the given hosts with cheap HEAD requests"""
+        client = cls.get_client()
+
+        async def warm(url):
+            try:
+                await client.head(url, timeout=PREWARM_TIMEOUT_SECONDS)
+                return True
+            except httpx.HTTPError as e:
+                logger.debug("http_prewarm_failed", url=url, error=str(e))
+                return False
+
+        results = await asyncio.gather(*(warm(url) for url in urls))
+        logger.info("http_prewarm_complete", warmed=sum(results), total=len(urls))
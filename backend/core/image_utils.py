@@ -1,31 +1,82 @@
 """
 Image processing utilities for thumbnail generation.
 """
+import asyncio
+import hashlib
+import os
+import struct
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import BinaryIO, Union
+from threading import Lock
+from typing import Any, BinaryIO, Dict, Mapping, Optional, Sequence, Union
 from PIL import Image
+import base64
 import structlog
 
+from core.config import settings
+
 logger = structlog.get_logger(__name__)
 
+# Image input accepted by the helpers below: a raw buffer or a binary file-like object
+ImageData = Union[bytes, bytearray, memoryview, BinaryIO]
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
 THUMBNAIL_SIZE = (256, 256)
 THUMBNAIL_FORMAT = "JPEG"
 THUMBNAIL_QUALITY = 85
+THUMBNAIL_OPTIMIZE = settings.THUMBNAIL_OPTIMIZE
+THUMBNAIL_RESAMPLE = Image.Resampling[settings.THUMBNAIL_RESAMPLE]
+# Pre-reduce large sources until they are within 3x of the target before
+# resampling; at 3.0 the result is indistinguishable from a full-size resample
+THUMBNAIL_REDUCING_GAP = 3.0
+
+# Encoded data: URIs are memoized per image; thumbnails never change once generated
+THUMBNAIL_URI_CACHE_SIZE = 1024
+_thumbnail_uri_cache: "OrderedDict[str, str]" = OrderedDict()
+_thumbnail_uri_lock = Lock()
+_THUMBNAIL_URI_PREFIX = b"data:image/jpeg;base64,"
+
+# Generated thumbnails keyed by (content digest, size): identical files (a
+# re-ingested upload, the same image in several datasets) skip decode, resize
+# and encode. Entries are ~10-80 KB of JPEG each
+THUMBNAIL_CACHE_SIZE = 256
+_thumbnail_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_thumbnail_cache_lock = Lock()
+
+# Dedicated pool for CPU-bound thumbnail work. Pillow releases the GIL while
+# decoding, resampling and encoding, so one worker per core runs in parallel,
+# and a burst of uploads can't starve the default executor
+THUMBNAIL_WORKERS = os.cpu_count() or 4
+_thumbnail_executor = ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS, thread_name_prefix="thumbnail")
+
+
+def _open_image(image_data: ImageData) -> Image.Image:
+    """
+    Open image data with Pillow, wrapping raw buffers in a BytesIO exactly once.
+
+    BytesIO shares the buffer of an immutable bytes object, so bytes input is
+    not copied; bytearray and memoryview input is copied once. File-like
+    objects are handed to Pillow as is.
+    """
+    if isinstance(image_data, _BYTES_LIKE):
+        return Image.open(BytesIO(image_data))
+    return Image.open(image_data)
 
 
 def generate_thumbnail(
-    image_data: Union[bytes, BinaryIO],
+    image_data: ImageData,
     size: tuple[int, int] = THUMBNAIL_SIZE
 ) -> bytes:
     """
     Generate a center-cropped thumbnail from image data.
 
     Uses center cropping to ensure the thumbnail fills the entire size
-    without black bars. The image is first resized to ensure one dimension
-    matches the target, then the excess is cropped from the center.
+    without black bars. The largest centered region with the target aspect
+    ratio is resampled straight to the target size.
 
     Args:
-        image_data: Image data as bytes or file-like object
+        image_data: Image data as a bytes-like or file-like object
         size: Tuple of (width, height) for thumbnail. Default is 256x256.
 
     Returns:
@@ -35,79 +86,287 @@ def generate_thumbnail(
         ValueError: If image cannot be processed
         IOError: If image format is unsupported
     """
+    # Only raw buffers can be keyed by content; streams are rendered directly
+    if not isinstance(image_data, _BYTES_LIKE):
+        return _render_thumbnail(image_data, size)
+
+    cache_key = (hashlib.blake2b(image_data, digest_size=16).digest(), tuple(size))
+    with _thumbnail_cache_lock:
+        thumbnail_bytes = _thumbnail_cache.get(cache_key)
+        if thumbnail_bytes is not None:
+            _thumbnail_cache.move_to_end(cache_key)
+            return thumbnail_bytes
+
+    thumbnail_bytes = _render_thumbnail(image_data, size)
+
+    with _thumbnail_cache_lock:
+        _thumbnail_cache[cache_key] = thumbnail_bytes
+        _thumbnail_cache.move_to_end(cache_key)
+        while len(_thumbnail_cache) > THUMBNAIL_CACHE_SIZE:
+            _thumbnail_cache.popitem(last=False)
+
+    return thumbnail_bytes
+
+
+def _render_thumbnail(image_data: ImageData, size: tuple[int, int]) -> bytes:
+    """Decode, center-crop, resample and encode one thumbnail (uncached)"""
+    # With no buffer exported, getvalue() trims the BytesIO's own bytes object
+    # in place and returns it without copying; bytes(output.getbuffer()) would
+    # force a full copy instead
+    with BytesIO() as output:
+        write_thumbnail(image_data, output, size)
+        thumbnail_bytes = output.getvalue()
+
+    logger.info(f"Generated thumbnail: {len(thumbnail_bytes)} bytes")
+    return thumbnail_bytes
+
+
+def write_thumbnail(
+    image_data: ImageData,
+    sink: BinaryIO,
+    size: tuple[int, int] = THUMBNAIL_SIZE
+) -> None:
+    """
+    Generate a center-cropped thumbnail and encode it straight into a stream.
+
+    Same output as generate_thumbnail, but the JPEG is written to `sink`
+    (an open file, a storage upload stream, ...) without first being built
+    up as an in-memory bytes object. Not cached.
+
+    Args:
+        image_data: Image data as a bytes-like or file-like object
+        sink: Writable binary stream that receives the JPEG data
+        size: Tuple of (width, height) for thumbnail. Default is 256x256.
+
+    Raises:
+        ValueError: If image cannot be processed
+    """
     try:
-        # Open image from bytes or file-like object
-        if isinstance(image_data, bytes):
-            image = Image.open(BytesIO(image_data))
-        else:
-            image = Image.open(image_data)
-
-        # Convert to RGB if necessary (handles RGBA, P, L modes)
-        if image.mode not in ('RGB', 'L'):
-            # For images with transparency, use white background
-            if image.mode == 'RGBA':
-                background = Image.new('RGB', image.size, (255, 255, 255))
-                background.paste(image, mask=image.split()[3])  # Use alpha channel as mask
-                image = background
-            else:
-                image = image.convert('RGB')
+        image = _open_image(image_data)
 
-        # Calculate dimensions for center crop
         target_width, target_height = size
-        target_ratio = target_width / target_height
-        image_ratio = image.width / image.height
 
-        if image_ratio > target_ratio:
-            # Image is wider than target - fit height, crop width
-            new_height = target_height
-            new_width = int(new_height * image_ratio)
-        else:
-            # Image is taller than target - fit width, crop height
-            new_width = target_width
-            new_height = int(new_width / image_ratio)
+        # For JPEGs, let libjpeg decode at 1/2, 1/4 or 1/8 scale via DCT scaling
+        # instead of at full resolution. Asking for twice the target keeps the
+        # draft large enough that the resize below is still a downscale
+        if image.format == "JPEG":
+            image.draft("RGB", (target_width * 2, target_height * 2))
 
-        # Resize image to ensure one dimension matches target
-        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Convert to RGB if necessary (handles P and other modes). RGBA stays as
+        # is until after the resize and crop, so the white-background composite
+        # touches thumbnail-sized pixels rather than the full-resolution image
+        if image.mode not in ('RGB', 'L', 'RGBA'):
+            image = image.convert('RGB')
 
-        # Calculate crop box to center the image
-        left = (new_width - target_width) // 2
-        top = (new_height - target_height) // 2
-        right = left + target_width
-        bottom = top + target_height
+        # Largest centered region with the target aspect ratio, in source
+        # coordinates (image.size reflects any draft scaling)
+        target_ratio = target_width / target_height
+        if image.width / image.height > target_ratio:
+            # Image is wider than target - keep full height, crop width
+            crop_width, crop_height = image.height * target_ratio, image.height
+        else:
+            # Image is taller than target - keep full width, crop height
+            crop_width, crop_height = image.width, image.width / target_ratio
+        left = (image.width - crop_width) / 2
+        top = (image.height - crop_height) / 2
 
-        # Crop to final size
-        image = image.crop((left, top, right, bottom))
+        # Scale and center-crop in one pass: box= limits the filter to the kept
+        # region, and reducing_gap lets Pillow box-reduce by an integer factor
+        # first so the convolution runs on a much smaller image
+        image = image.resize(
+            size,
+            THUMBNAIL_RESAMPLE,
+            box=(left, top, left + crop_width, top + crop_height),
+            reducing_gap=THUMBNAIL_REDUCING_GAP
+        )
 
-        # Save to bytes as JPEG
-        output = BytesIO()
-        image.save(output, format=THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY, optimize=True)
-        thumbnail_bytes = output.getvalue()
+        # For images with transparency, use white background. Pillow resizes
+        # RGBA with premultiplied alpha, so transparent pixels don't bleed in;
+        # alpha_composite blends in C without splitting out the bands
+        if image.mode == 'RGBA':
+            background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+            image = Image.alpha_composite(background, image).convert('RGB')
 
-        logger.info(f"Generated thumbnail: {len(thumbnail_bytes)} bytes")
-        return thumbnail_bytes
+        image.save(sink, format=THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY, optimize=THUMBNAIL_OPTIMIZE)
 
     except Exception as e:
         logger.error(f"Failed to generate thumbnail: {str(e)}")
         raise ValueError(f"Unable to process image: {str(e)}")
 
 
-def get_image_dimensions(image_data: Union[bytes, BinaryIO]) -> tuple[int, int]:
+async def generate_thumbnail_async(
+    image_data: ImageData,
+    size: tuple[int, int] = THUMBNAIL_SIZE
+) -> bytes:
+    """
+    Run generate_thumbnail on the thumbnail thread pool.
+
+    Use this from async code so decoding and resizing don't block the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_thumbnail_executor, generate_thumbnail, image_data, size)
+
+
+async def generate_thumbnails_async(
+    images: Sequence[ImageData],
+    size: tuple[int, int] = THUMBNAIL_SIZE
+) -> list[Union[bytes, Exception]]:
+    """
+    Generate thumbnails for a batch of images in parallel on the thumbnail pool.
+
+    Results are returned in input order. An image that can't be processed
+    yields its exception in place of bytes, so one bad file doesn't fail the batch.
+    """
+    return await asyncio.gather(
+        *(generate_thumbnail_async(image_data, size) for image_data in images),
+        return_exceptions=True
+    )
+
+
+def get_image_dimensions(image_data: ImageData) -> tuple[int, int]:
     """
     Get dimensions of an image without loading the entire image into memory.
 
+    PNG, JPEG, GIF and WebP bytes are answered from the file header without
+    going through Pillow. Anything else falls back to Image.open, which only
+    parses the header; the context manager releases the decoder as soon as
+    the size is read. A caller's file-like object is left open.
+
     Args:
-        image_data: Image data as bytes or file-like object
+        image_data: Image data as a bytes-like or file-like object
 
     Returns:
         Tuple of (width, height)
     """
-    try:
-        if isinstance(image_data, bytes):
-            image = Image.open(BytesIO(image_data))
-        else:
-            image = Image.open(image_data)
+    if isinstance(image_data, _BYTES_LIKE):
+        dimensions = _header_dimensions(image_data)
+        if dimensions is not None:
+            return dimensions
 
-        return image.size
+    try:
+        with _open_image(image_data) as image:
+            return image.size
     except Exception as e:
         logger.error(f"Failed to get image dimensions: {str(e)}")
         raise ValueError(f"Unable to read image: {str(e)}")
+
+
+# JPEG start-of-frame markers (baseline, progressive, lossless, ...); C4, C8
+# and CC share the range but are DHT, JPG and DAC, not frame headers
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers that stand alone without a length field
+_JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+
+
+def _header_dimensions(data: Union[bytes, bytearray, memoryview]) -> Optional[tuple[int, int]]:
+    """Read (width, height) from a PNG/JPEG/GIF/WebP header, or None if not recognized"""
+    try:
+        if data[:8] == b"\x89PNG\r\n\x1a\n" and data[12:16] == b"IHDR":
+            return struct.unpack(">II", data[16:24])
+
+        if data[:6] in (b"GIF87a", b"GIF89a"):
+            return struct.unpack("<HH", data[6:10])
+
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            chunk = data[12:16]
+            if chunk == b"VP8 " and data[23:26] == b"\x9d\x01\x2a":
+                width, height = struct.unpack("<HH", data[26:30])
+                return width & 0x3FFF, height & 0x3FFF
+            if chunk == b"VP8L" and data[20] == 0x2F:
+                bits = int.from_bytes(data[21:25], "little")
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b"VP8X":
+                return (
+                    int.from_bytes(data[24:27], "little") + 1,
+                    int.from_bytes(data[27:30], "little") + 1
+                )
+            return None
+
+        if data[:2] == b"\xff\xd8":
+            # Walk the marker segments up to the first frame header
+            offset = 2
+            while offset + 9 <= len(data):
+                if data[offset] != 0xFF:
+                    return None
+                marker = data[offset + 1]
+                if marker == 0xFF:
+                    # Fill byte before a marker
+                    offset += 1
+                elif marker in _JPEG_SOF_MARKERS:
+                    height, width = struct.unpack(">HH", data[offset + 5:offset + 9])
+                    return width, height
+                elif marker in _JPEG_STANDALONE_MARKERS:
+                    offset += 2
+                else:
+                    offset += 2 + struct.unpack(">H", data[offset + 2:offset + 4])[0]
+    except (IndexError, struct.error):
+        pass
+    return None
+
+
+def thumbnail_data_uri(image_id, thumbnail_data: bytes) -> str:
+    """
+    Return the thumbnail as a `data:image/jpeg;base64,...` URI.
+
+    The encoded string is kept in a bounded in-process LRU keyed by image ID,
+    so list endpoints don't re-encode the same blob on every request.
+
+    Args:
+        image_id: ID of the image the thumbnail belongs to
+        thumbnail_data: Raw JPEG thumbnail bytes
+
+    Returns:
+        Data URI string suitable for an <img src>; empty data gives a URI
+        with an empty payload
+    """
+    # The batch version skips empty thumbnails, so there may be no entry
+    return thumbnail_data_uris({image_id: thumbnail_data}).get(
+        str(image_id), _THUMBNAIL_URI_PREFIX.decode("ascii")
+    )
+
+
+def thumbnail_data_uris(thumbnails: Mapping[Any, bytes]) -> Dict[str, str]:
+    """
+    Batch version of thumbnail_data_uri for list endpoints.
+
+    Takes the cache lock once for all lookups and once for all inserts, and
+    encodes the misses in a single pass. Empty thumbnails are skipped.
+
+    Args:
+        thumbnails: Mapping of image ID to raw JPEG thumbnail bytes
+
+    Returns:
+        Dict of str(image ID) to data URI
+    """
+    uris: Dict[str, str] = {}
+    misses: Dict[str, bytes] = {}
+
+    with _thumbnail_uri_lock:
+        for image_id, thumbnail_data in thumbnails.items():
+            if not thumbnail_data:
+                continue
+            key = str(image_id)
+            uri = _thumbnail_uri_cache.get(key)
+            if uri is None:
+                misses[key] = thumbnail_data
+            else:
+                _thumbnail_uri_cache.move_to_end(key)
+                uris[key] = uri
+
+    if not misses:
+        return uris
+
+    encoded = {
+        key: (_THUMBNAIL_URI_PREFIX + base64.b64encode(thumbnail_data)).decode("ascii")
+        for key, thumbnail_data in misses.items()
+    }
+
+    with _thumbnail_uri_lock:
+        _thumbnail_uri_cache.update(encoded)
+        for key in encoded:
+            _thumbnail_uri_cache.move_to_end(key)
+        while len(_thumbnail_uri_cache) > THUMBNAIL_URI_CACHE_SIZE:
+            _thumbnail_uri_cache.popitem(last=False)
+
+    uris.update(encoded)
+    return uris
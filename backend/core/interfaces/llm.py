@@ -42,7 +42,7 @@ class ILLMProvider(ABC):
         self,
         input_text: str,
         output_est_text: str,
-        images: list[str],
+        images: list[bytes],
         pricing_config: Dict[str, Any]
     ) -> float:
         """
@@ -51,7 +51,7 @@ class ILLMProvider(ABC):
         Args:
             input_text: The input text prompt.
             output_est_text: Estimated output text.
-            images: List of base64 encoded images.
+            images: List of raw image bytes.
             pricing_config: Pricing configuration dictionary.
 
         Returns:
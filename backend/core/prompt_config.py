@@ -4,34 +4,36 @@ Loads system prompts from config/prompts.yaml
 """
 import os
 import yaml
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-_prompts: Dict[str, str] = {}
-_loaded = False
+# Read-only question_type -> prompt mapping, stripped once at load time.
+# Populated on import, so lookups need no "loaded yet?" check
+_prompts: Mapping[str, str] = MappingProxyType({})
 
 def load_prompts():
     """Load prompts from config file"""
-    global _prompts, _loaded
+    global _prompts
 
     config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'prompts.yaml')
 
     try:
         with open(config_path, 'r') as f:
             config = yaml.safe_load(f)
-            _prompts = config.get('system_prompts', {})
-            _prompts['default'] = config.get('default', 'Answer the question based on the image.')
-            _loaded = True
+            prompts = dict(config.get('system_prompts', {}))
+            prompts['default'] = config.get('default', 'Answer the question based on the image.')
     except Exception as e:
         print(f"Warning: Could not load prompts config: {e}")
         # Fallback defaults
-        _prompts = {
+        prompts = {
             'binary': 'Reply only true or false, nothing else.',
             'multiple_choice': 'Reply only with one of these values: {options}',
             'text': 'Reply as short as you can with classification of what you see.',
             'count': 'Reply only with a number that is a count.',
             'default': 'Answer the question based on the image.'
         }
-        _loaded = True
+
+    _prompts = MappingProxyType({key: prompt.strip() for key, prompt in prompts.items()})
 
 def get_system_prompt(question_type: str, options: Optional[list] = None) -> str:
     """
@@ -44,17 +46,15 @@ def get_system_prompt(question_type: str, options: Optional[list] = None) -> str
     Returns:
         System prompt string
     """
-    if not _loaded:
-        load_prompts()
-
-    prompt = _prompts.get(question_type, _prompts.get('default', ''))
+    prompts = _prompts
+    prompt = prompts.get(question_type, prompts['default'])
 
-    # Replace {options} placeholder for multiple choice
+    # Replace {options} placeholder for multiple choice. str.replace rather than
+    # format_map, so literal braces elsewhere in a configured prompt stay valid
     if question_type == 'multiple_choice' and options:
-        options_str = ', '.join(options)
-        prompt = prompt.replace('{options}', options_str)
+        prompt = prompt.replace('{options}', ', '.join(options)).strip()
 
-    return prompt.strip()
+    return prompt
 
 # Load on import
 load_prompts()
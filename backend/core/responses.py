@@ -0,0 +1,22 @@
+"""
+Response classes that serialize Pydantic models directly.
+
+Returning one of these from an endpoint bypasses FastAPI's response_model
+pass (re-validation + jsonable_encoder + json.dumps); the model is dumped
+once by pydantic-core. Keep `response_model=` on the route for OpenAPI docs.
+Pass exclude_none=True to drop null fields from the payload.
+"""
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class PydanticResponse(JSONResponse):
+    """JSON response rendered with the model's compiled model_dump_json()"""
+
+    def __init__(self, content: BaseModel, *args, exclude_none: bool = False, **kwargs):
+        # Set before super().__init__, which calls render()
+        self.exclude_none = exclude_none
+        super().__init__(content, *args, **kwargs)
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json(exclude_none=self.exclude_none).encode("utf-8")
@@ -0,0 +1,20 @@
+"""
+Shared Pydantic field types for API schemas
+"""
+from typing import Any
+from uuid import UUID
+
+from pydantic import BeforeValidator
+from typing_extensions import Annotated
+
+
+def _uuid_to_str(value: Any) -> Any:
+    """Coerce UUID primary keys read from ORM rows into their string form"""
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+# `id: UUIDStr` lets response models validate straight from ORM objects
+# (from_attributes=True) while still serializing ids as plain strings
+UUIDStr = Annotated[str, BeforeValidator(_uuid_to_str)]
@@ -1,7 +1,6 @@
 import time
 import httpx
 import math
-import base64
 import io
 from PIL import Image as PILImage
 from typing import Tuple, Optional, Dict, Any, List
@@ -26,7 +25,7 @@ class AnthropicProvider(ILLMProvider):
         self,
         input_text: str,
         output_est_text: str,
-        images: List[str],
+        images: List[bytes],
         pricing_config: Dict[str, Any]
     ) -> float:
         input_price = float(pricing_config.get('input_price_per_1m', 0))
@@ -38,9 +37,8 @@ class AnthropicProvider(ILLMProvider):
 
         # Image tokens
         image_tokens = 0
-        for img_b64 in images:
+        for img_bytes in images:
             try:
-                img_bytes = base64.b64decode(img_b64)
                 with PILImage.open(io.BytesIO(img_bytes)) as img:
                     w, h = img.size
                 image_tokens += self._calculate_image_tokens(w, h)
@@ -2,7 +2,6 @@ import time
 import httpx
 import math
 import tiktoken
-import base64
 import io
 from PIL import Image as PILImage
 from typing import Tuple, Optional, Dict, Any, List
@@ -63,7 +62,7 @@ class OpenAIProvider(ILLMProvider):
         self,
         input_text: str,
         output_est_text: str,
-        images: List[str],
+        images: List[bytes],
         pricing_config: Dict[str, Any]
     ) -> float:
         input_price = float(pricing_config.get('input_price_per_1m', 0))
@@ -77,9 +76,8 @@ class OpenAIProvider(ILLMProvider):
 
         # Image tokens
         image_tokens = 0
-        for img_b64 in images:
+        for img_bytes in images:
             try:
-                img_bytes = base64.b64decode(img_b64)
                 with PILImage.open(io.BytesIO(img_bytes)) as img:
                     w, h = img.size
                 image_tokens += self._calculate_image_tokens(w, h)
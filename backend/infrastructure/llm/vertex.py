@@ -26,7 +26,7 @@ class VertexAIProvider(ILLMProvider):
         self,
         input_text: str,
         output_est_text: str,
-        images: List[str],
+        images: List[bytes],
         pricing_config: Dict[str, Any]
     ) -> float:
         input_price = float(pricing_config.get('input_price_per_1m', 0))
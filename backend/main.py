@@ -9,9 +9,12 @@ if not os.environ.get("LANGCHAIN_ENDPOINT"):
     os.environ["LANGCHAIN_ENDPOINT"] = ""
 
 from datetime import datetime
+import asyncio
+import contextlib
+import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
 import structlog
 from core.logging_config import configure_logging
@@ -33,7 +36,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
-    redirect_slashes=False  # Prevent 307 redirects that strip Authorization headers
+    redirect_slashes=False,  # Prevent 307 redirects that strip Authorization headers
+    default_response_class=ORJSONResponse  # orjson instead of stdlib json for response bodies
 )
 
 # Configure CORS
@@ -45,9 +49,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
+@app.on_event("startup")
+async def configure_threadpool():
+    """Size the threadpool that runs sync endpoints, which hold a DB session per request"""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
+
 @app.on_event("startup")
 async def sync_admin_users():
     """Sync admin users from ADMIN_EMAILS on startup"""
@@ -200,6 +211,21 @@ async def restart_interrupted_evaluations():
     finally:
         db.close()
 
+
+@app.on_event("startup")
+async def prewarm_provider_connections():
+    """Open the shared HTTP client and warm LLM provider connections so the first call skips the handshake"""
+    from core.http_client import HttpClient
+
+    # The app loop's client lives from startup to shutdown_event
+    HttpClient.get_client()
+    if not settings.PREWARM_PROVIDER_CONNECTIONS:
+        return
+
+    # Run in the background so a slow or unreachable provider doesn't delay startup
+    app.state.prewarm_task = asyncio.create_task(HttpClient.prewarm())
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """Close resources on shutdown"""
@@ -208,8 +234,15 @@ async def shutdown_event():
     
     logger.info("Closing database connections...")
     engine.dispose()
-    
-    await HttpClient.close()
+
+    # Stop an unfinished prewarm before its client is closed underneath it
+    prewarm_task = getattr(app.state, "prewarm_task", None)
+    if prewarm_task is not None:
+        prewarm_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await prewarm_task
+
+    await HttpClient.close_all()
 
 
 
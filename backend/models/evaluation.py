@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, Text, ForeignKey, DateTime, JSON, Boolean, Integer, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from datetime import datetime
@@ -18,7 +18,8 @@ class ModelConfig(Base):
     temperature = Column(Float, default=0.0)
     max_tokens = Column(Integer, default=1024)
     concurrency = Column(Integer, default=3)  # Number of parallel API calls
-    additional_params = Column(JSON, nullable=True)
+    # Only read by the model config detail/export endpoints, so not loaded by default
+    additional_params = deferred(Column(JSON, nullable=True))
 
     # Pricing configuration
     # Structure: {"input_price_per_1m": 2.50, "output_price_per_1m": 10.00,
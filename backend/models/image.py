@@ -1,15 +1,16 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, JSON, Boolean, Text, LargeBinary
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, JSON, Boolean, Text, LargeBinary, func, select
+from sqlalchemy.orm import relationship, column_property
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from datetime import datetime
 from core.database import Base
+from models.project import Dataset
 
 class Image(Base):
     __tablename__ = "images"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    dataset_id = Column(UUID(as_uuid=True), ForeignKey("datasets.id"), nullable=False)
+    dataset_id = Column(UUID(as_uuid=True), ForeignKey("datasets.id", ondelete="CASCADE"), nullable=False)
     filename = Column(String, nullable=False)
     storage_path = Column(String, nullable=False)
     file_size = Column(Integer, nullable=True)
@@ -24,13 +25,13 @@ class Image(Base):
 
     dataset = relationship("Dataset", back_populates="images")
     uploaded_by = relationship("User")
-    annotation = relationship("Annotation", back_populates="image", uselist=False, cascade="all, delete-orphan")
+    annotation = relationship("Annotation", back_populates="image", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
 
 class Annotation(Base):
     __tablename__ = "annotations"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    image_id = Column(UUID(as_uuid=True), ForeignKey("images.id"), unique=True, nullable=False)
+    image_id = Column(UUID(as_uuid=True), ForeignKey("images.id", ondelete="CASCADE"), unique=True, nullable=False)
     answer_value = Column(JSON, nullable=True)
     is_skipped = Column(Boolean, default=False)
     is_flagged = Column(Boolean, default=False)
@@ -42,3 +43,13 @@ class Annotation(Base):
 
     image = relationship("Image", back_populates="annotation")
     annotator = relationship("User")
+
+
+# Deferred COUNT of a dataset's images (see Project.dataset_count)
+Dataset.image_count = column_property(
+    select(func.count(Image.id))
+    .where(Image.dataset_id == Dataset.id)
+    .correlate_except(Image)
+    .scalar_subquery(),
+    deferred=True
+)
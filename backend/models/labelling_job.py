@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, ForeignKey, DateTime, JSON, Boolean, Integer, Float, UniqueConstraint, Index
+from sqlalchemy import Column, String, Text, ForeignKey, DateTime, JSON, Boolean, Integer, Float, UniqueConstraint, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -48,6 +48,14 @@ class LabellingJob(Base):
     runs = relationship("LabellingJobRun", back_populates="job", cascade="all, delete-orphan")
     results = relationship("LabellingResult", back_populates="job", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index(
+            'idx_labelling_jobs_active_next_run_at', next_run_at,
+            postgresql_where=text('is_active'),
+            postgresql_include=['id', 'name', 'frequency_minutes']
+        ),
+    )
+
 
 class LabellingJobRun(Base):
     __tablename__ = "labelling_job_runs"
@@ -80,7 +88,7 @@ class LabellingJobRun(Base):
     results = relationship("LabellingResult", back_populates="run", cascade="all, delete-orphan")
 
     __table_args__ = (
-        Index('idx_labelling_job_runs_job', 'labelling_job_id'),
+        Index('idx_labelling_job_runs_job_started_at', labelling_job_id, started_at.desc(), id.desc()),
     )
 
 
@@ -114,6 +122,9 @@ class LabellingResult(Base):
 
     __table_args__ = (
         UniqueConstraint('labelling_job_id', 'image_id', name='unique_job_image'),
-        Index('idx_labelling_results_job', 'labelling_job_id'),
+        Index(
+            'idx_labelling_results_job_created_at', labelling_job_id, created_at.desc(), id.desc(),
+            postgresql_include=['image_id']
+        ),
         Index('idx_labelling_results_image', 'image_id'),
     )
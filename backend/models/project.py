@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, Text, ForeignKey, DateTime, JSON, Integer
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, ForeignKey, DateTime, JSON, Integer, func, select
+from sqlalchemy.orm import relationship, column_property
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from datetime import datetime
@@ -21,14 +21,14 @@ class Project(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     created_by = relationship("User")
-    datasets = relationship("Dataset", back_populates="project", cascade="all, delete-orphan")
+    datasets = relationship("Dataset", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
 
 class Dataset(Base):
     __tablename__ = "datasets"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
@@ -43,4 +43,15 @@ class Dataset(Base):
 
     project = relationship("Project", back_populates="datasets")
     created_by = relationship("User")
-    images = relationship("Image", back_populates="dataset", cascade="all, delete-orphan")
+    images = relationship("Image", back_populates="dataset", cascade="all, delete-orphan", passive_deletes=True)
+
+
+# Child counts as correlated subqueries, so responses don't load child rows
+# just to take len(). Deferred: only queries that undefer them pay for it.
+Project.dataset_count = column_property(
+    select(func.count(Dataset.id))
+    .where(Dataset.project_id == Project.id)
+    .correlate_except(Dataset)
+    .scalar_subquery(),
+    deferred=True
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Boolean, Enum
+from sqlalchemy import Column, String, DateTime, Boolean, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 import enum
@@ -22,5 +22,11 @@ class User(Base):
     google_id = Column(String, unique=True, index=True, nullable=True)
     role = Column(String, default=UserRole.USER.value, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     last_login_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Auth looks users up by email (unique ix_users_email) and admin
+    # endpoints by primary key, so both are already index lookups
+    __table_args__ = (
+        Index('idx_users_created_at', created_at.desc(), id.desc()),
+    )
@@ -43,6 +43,9 @@ class AgentService:
         # Define tools
         self.tools = self._create_tools()
 
+        # ReAct agent, built on first use (pulling the prompt is a network round trip)
+        self._agent = None
+
     def _create_tools(self) -> list: # Changed return type hint to generic list to avoid NameError if Tool is None
         """Create tools for the agent"""
 
@@ -76,6 +79,17 @@ class AgentService:
 
         return tools
 
+    def _get_agent(self):
+        """Build the ReAct agent once and reuse it across executions"""
+        if self._agent is None:
+            react_prompt = hub.pull("hwchase17/react")
+            self._agent = create_react_agent(
+                llm=self.llm,
+                tools=self.tools,
+                prompt=react_prompt
+            )
+        return self._agent
+
     async def execute(
         self,
         prompt: str,
@@ -97,19 +111,9 @@ class AgentService:
             if not hub or not create_react_agent or not AgentExecutor:
                  raise ImportError("LangChain dependencies missing")
 
-            # Get prompt template
-            react_prompt = hub.pull("hwchase17/react")
-
-            # Create agent
-            agent = create_react_agent(
-                llm=self.llm,
-                tools=self.tools,
-                prompt=react_prompt
-            )
-
-            # Create executor
+            # Create executor around the shared agent
             agent_executor = AgentExecutor(
-                agent=agent,
+                agent=self._get_agent(),
                 tools=self.tools,
                 verbose=True,
                 max_iterations=max_iterations or settings.MAX_ITERATIONS,
@@ -140,3 +144,15 @@ class AgentService:
         except Exception as e:
             logger.error(f"Agent execution failed: {str(e)}", exc_info=True)
             raise
+
+
+# Singleton instance
+_agent_service = None
+
+
+def get_agent_service() -> AgentService:
+    """Get the AgentService singleton instance"""
+    global _agent_service
+    if _agent_service is None:
+        _agent_service = AgentService()
+    return _agent_service
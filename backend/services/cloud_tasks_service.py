@@ -66,12 +66,13 @@ class CloudTasksService:
             logger.error(f"  Configuration: BACKEND_URL={settings.BACKEND_URL}, GCP_PROJECT_ID={self.project}, REGION={self.location}")
             raise
 
-    def enqueue_labelling_job_task(self, job_id: str) -> str:
+    def enqueue_labelling_job_task(self, job_id: str, trigger_type: str = 'scheduled') -> str:
         """
         Enqueue a task to run a labelling job.
 
         Args:
             job_id: UUID of the labelling job to run
+            trigger_type: 'manual' or 'scheduled', recorded on the run
 
         Returns:
             Task name/ID
@@ -85,7 +86,7 @@ class CloudTasksService:
 
             # Build queue path
             parent = self.client.queue_path(self.project, self.location, self.queue)
-            target_url = f"{settings.BACKEND_URL}/api/v1/internal/tasks/run-labelling-job/{job_id}"
+            target_url = f"{settings.BACKEND_URL}/api/v1/internal/tasks/run-labelling-job/{job_id}?trigger_type={trigger_type}"
             service_account = f"multiprompt-backend-sa@{self.project}.iam.gserviceaccount.com"
 
             # Log configuration
@@ -1,5 +1,4 @@
 import structlog
-import base64
 from typing import Optional, Dict, List, Any, Union
 from sqlalchemy.orm import Session
 
@@ -90,13 +89,12 @@ class CostEstimationService:
         for img in sample_images:
             try:
                 img_data = await storage.download(img.storage_path)
-                img_b64 = base64.b64encode(img_data).decode('utf-8')
-                
+
                 # Estimate cost for this single image (no text, as text is added separately)
                 cost = provider.estimate_cost(
                     input_text="", 
                     output_est_text="", 
-                    images=[img_b64], 
+                    images=[img_data], 
                     pricing_config=config.pricing_config
                 )
                 total_sample_cost += cost
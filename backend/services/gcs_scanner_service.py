@@ -8,7 +8,7 @@ import re
 logger = structlog.get_logger(__name__)
 
 # Supported image extensions
-ALLOWED_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff']
+ALLOWED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff'})
 
 @dataclass
 class GCSFileInfo:
@@ -1,11 +1,10 @@
 import asyncio
 import structlog
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from sqlalchemy.orm import Session
 from models.image import Image
 from models.project import Dataset
-from core.image_utils import generate_thumbnail
+from core.image_utils import generate_thumbnail_async
 from services.storage_service import get_storage_provider
 
 logger = structlog.get_logger(__name__)
@@ -15,7 +14,6 @@ class ImageProcessingService:
     """Service for processing images in the background (thumbnails, validation, etc.)"""
 
     def __init__(self):
-        self.executor = ThreadPoolExecutor(max_workers=4)
         self.storage = get_storage_provider()
 
     async def process_dataset_images(self, dataset_id: str, db: Session):
@@ -72,12 +70,7 @@ class ImageProcessingService:
                     logger.info(f"Downloaded image {image.id} ({len(file_data)} bytes)")
 
                     # Generate thumbnail in thread pool (CPU-bound operation)
-                    loop = asyncio.get_event_loop()
-                    thumbnail_bytes = await loop.run_in_executor(
-                        self.executor,
-                        generate_thumbnail,
-                        file_data
-                    )
+                    thumbnail_bytes = await generate_thumbnail_async(file_data)
                     logger.info(f"Generated thumbnail for image {image.id} ({len(thumbnail_bytes)} bytes)")
 
                     # Update database with thumbnail
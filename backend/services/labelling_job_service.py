@@ -3,7 +3,8 @@ import structlog
 import uuid
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
 
 from models.labelling_job import LabellingJob, LabellingJobRun, LabellingResult
@@ -14,10 +15,15 @@ from services.gcs_scanner_service import GCSScannerService, GCSFileInfo
 from services.storage_service import get_storage_provider
 from services.cloud_tasks_service import get_cloud_tasks_service
 from services.llm_service import get_llm_service
+from services.project_service import PROJECTS_CACHE_NAMESPACE
 from core.config import settings
+from core.cache import get_response_cache
 
 logger = structlog.get_logger(__name__)
 
+# Response cache namespace for the labelling job list endpoint
+LABELLING_JOBS_CACHE_NAMESPACE = "labelling_jobs"
+
 
 class LabellingJobService:
     """Service for executing labelling jobs"""
@@ -35,6 +41,11 @@ class LabellingJobService:
         """
         Execute a labelling job.
 
+        Runs on the caller's event loop. Session queries, commits and the GCS
+        scan/copy are blocking, so each is handed to the threadpool; only the
+        storage and LLM awaits run on the loop. The session is used by one
+        thread at a time, never concurrently.
+
         Args:
             job_id: UUID of the job to run
             db: Database session
@@ -46,50 +57,47 @@ class LabellingJobService:
         start_time = datetime.utcnow()
         logger.info(f"Starting labelling job {job_id} (trigger: {trigger_type})")
 
-        # Get job
-        job = db.query(LabellingJob).filter(LabellingJob.id == job_id).first()
-        if not job:
-            raise ValueError(f"Job {job_id} not found")
-
-        # Create run record
-        run = LabellingJobRun(
-            labelling_job_id=job_id,
-            trigger_type=trigger_type,
-            status='running',
-            started_at=start_time
-        )
-        db.add(run)
+        # This session's objects are only written through it, so keep their
+        # state after commits: an expired attribute read on the loop would
+        # otherwise be a blocking SELECT
+        expire_on_commit = db.expire_on_commit
+        db.expire_on_commit = False
+        try:
+            return await self._run_job(job_id, db, trigger_type, start_time)
+        finally:
+            db.expire_on_commit = expire_on_commit
 
-        # Update job status
-        job.status = 'running'
-        job.last_run_at = start_time
-        db.commit()
+    async def _run_job(
+        self,
+        job_id: str,
+        db: Session,
+        trigger_type: str,
+        start_time: datetime
+    ) -> LabellingJobRun:
+        """Body of run_job; see there for the threading rules"""
+        job, run = await run_in_threadpool(self._start_run, job_id, trigger_type, start_time, db)
+        get_response_cache().invalidate(LABELLING_JOBS_CACHE_NAMESPACE)
 
         try:
             # Step 1: Ensure dataset exists
             if not job.dataset_id:
                 logger.info(f"Creating dedicated dataset for job {job.name}")
-                dataset = await self._create_dataset(job, db)
-                job.dataset_id = dataset.id
-                db.commit()
-            else:
-                dataset = job.dataset
+            dataset = await run_in_threadpool(self._ensure_dataset, job, db)
+            get_response_cache().invalidate(LABELLING_JOBS_CACHE_NAMESPACE)
 
             # Step 2: Scan GCS folder for new files
             logger.info(f"Scanning GCS folder: {job.gcs_folder_path}")
-            files = self.gcs_scanner.scan_folder(
+            files = await run_in_threadpool(
+                self.gcs_scanner.scan_folder,
                 job.gcs_folder_path,
                 last_processed_timestamp=job.last_processed_timestamp
             )
             run.images_discovered = len(files)
-            db.commit()
+            await run_in_threadpool(db.commit)
 
             if not files:
                 logger.info(f"No new files found for job {job_id}")
-                run.status = 'completed'
-                run.completed_at = datetime.utcnow()
-                run.duration_seconds = int((datetime.utcnow() - start_time).total_seconds())
-                db.commit()
+                await run_in_threadpool(self._complete_run, run, start_time, db)
                 return run
 
             logger.info(f"Found {len(files)} new files to process")
@@ -98,16 +106,13 @@ class LabellingJobService:
             logger.info(f"Starting ingestion of {len(files)} discovered files...")
             images = await self._ingest_images(job, dataset, files, run, db)
             run.images_ingested = len(images)
-            db.commit()
+            await run_in_threadpool(db.commit)
 
             logger.info(f"Ingestion result: {len(images)} images ingested, {run.images_failed} failed")
 
             if not images:
                 logger.warning(f"No images were successfully ingested for job {job_id}. Check logs above for errors.")
-                run.status = 'completed'
-                run.completed_at = datetime.utcnow()
-                run.duration_seconds = int((datetime.utcnow() - start_time).total_seconds())
-                db.commit()
+                await run_in_threadpool(self._complete_run, run, start_time, db)
                 return run
 
             # Step 4: Skip waiting for thumbnails - labelling works on full images
@@ -119,7 +124,7 @@ class LabellingJobService:
             results = await self._generate_labels(job, run, images, db)
             run.images_labeled = len([r for r in results if not r.error])
             run.images_failed = len([r for r in results if r.error])
-            db.commit()
+            await run_in_threadpool(db.commit)
 
             # Step 6: Update job statistics
             job.total_runs += 1
@@ -132,41 +137,99 @@ class LabellingJobService:
                 job.last_processed_timestamp = max(f.time_created for f in files)
 
             job.status = 'idle'
-            db.commit()
+            await run_in_threadpool(db.commit)
+            get_response_cache().invalidate(LABELLING_JOBS_CACHE_NAMESPACE)
 
             # Mark run as completed
-            run.status = 'completed'
-            run.completed_at = datetime.utcnow()
-            run.duration_seconds = int((datetime.utcnow() - start_time).total_seconds())
-            db.commit()
+            await run_in_threadpool(self._complete_run, run, start_time, db)
 
             logger.info(f"✓ Job {job_id} completed: {run.images_labeled} labeled, {run.images_failed} failed")
             return run
 
         except Exception as e:
             logger.error(f"✗ Job {job_id} failed: {str(e)}", exc_info=True)
+            await run_in_threadpool(self._fail_run, job, run, start_time, e, db)
+            get_response_cache().invalidate(LABELLING_JOBS_CACHE_NAMESPACE)
+            raise
 
-            # Rollback any pending transaction before updating
-            db.rollback()
+    def _start_run(
+        self,
+        job_id: str,
+        trigger_type: str,
+        start_time: datetime,
+        db: Session
+    ) -> Tuple[LabellingJob, LabellingJobRun]:
+        """Load the job and record a new running run (blocking; threadpool only)"""
+        # Load the relationships the run reads up front, so no lazy load fires on the loop
+        job = db.query(LabellingJob).options(
+            joinedload(LabellingJob.dataset),
+            joinedload(LabellingJob.model_config),
+            joinedload(LabellingJob.project)
+        ).filter(LabellingJob.id == job_id).first()
+        if not job:
+            raise ValueError(f"Job {job_id} not found")
 
-            # Reload objects from database
-            db.expire_all()
+        # Create run record
+        run = LabellingJobRun(
+            labelling_job_id=job_id,
+            trigger_type=trigger_type,
+            status='running',
+            started_at=start_time
+        )
+        db.add(run)
 
-            # Update run status
-            run.status = 'failed'
-            run.error_message = str(e)
-            run.error_details = {'traceback': str(e)}
-            run.completed_at = datetime.utcnow()
-            run.duration_seconds = int((datetime.utcnow() - start_time).total_seconds())
+        # Update job status
+        job.status = 'running'
+        job.last_run_at = start_time
+        db.commit()
+        return job, run
 
-            # Update job status
-            job.status = 'error'
-            job.total_errors += 1
+    def _ensure_dataset(self, job: LabellingJob, db: Session) -> Dataset:
+        """Return the job's output dataset, creating it on first run (blocking; threadpool only)"""
+        if job.dataset_id:
+            return job.dataset
 
-            db.commit()
-            raise
+        dataset = self._create_dataset(job, db)
+        job.dataset_id = dataset.id
+        db.commit()
+        return dataset
+
+    def _complete_run(self, run: LabellingJobRun, start_time: datetime, db: Session) -> None:
+        """Mark the run completed (blocking; threadpool only)"""
+        run.status = 'completed'
+        run.completed_at = datetime.utcnow()
+        run.duration_seconds = int((run.completed_at - start_time).total_seconds())
+        db.commit()
 
-    async def _create_dataset(self, job: LabellingJob, db: Session) -> Dataset:
+    def _fail_run(
+        self,
+        job: LabellingJob,
+        run: LabellingJobRun,
+        start_time: datetime,
+        error: Exception,
+        db: Session
+    ) -> None:
+        """Record a failed run on the job (blocking; threadpool only)"""
+        # Rollback any pending transaction before updating
+        db.rollback()
+
+        # Reload objects from database
+        db.expire_all()
+
+        # Update run status
+        run.status = 'failed'
+        run.error_message = str(error)
+        run.error_details = {'traceback': str(error)}
+        run.completed_at = datetime.utcnow()
+        run.duration_seconds = int((run.completed_at - start_time).total_seconds())
+
+        # Update job status
+        job.status = 'error'
+        job.total_errors += 1
+
+        db.commit()
+
+    def _create_dataset(self, job: LabellingJob, db: Session) -> Dataset:
         """Create a dedicated dataset for the job"""
         dataset = Dataset(
             name=f"Job Output: {job.name}",
@@ -176,6 +239,7 @@ class LabellingJobService:
         )
         db.add(dataset)
         db.commit()
+        get_response_cache().invalidate(PROJECTS_CACHE_NAMESPACE)
         db.refresh(dataset)
         logger.info(f"Created dataset {dataset.id}: {dataset.name}")
         return dataset
@@ -195,11 +259,7 @@ class LabellingJobService:
         ingested_images = []
 
         # Get existing filenames in dataset to detect duplicates
-        existing_filenames = {
-            img.filename for img in db.query(Image.filename).filter(
-                Image.dataset_id == dataset.id
-            ).all()
-        }
+        existing_filenames = await run_in_threadpool(self._existing_filenames, dataset.id, db)
 
         for file_info in files:
             try:
@@ -223,7 +283,8 @@ class LabellingJobService:
                     bucket_name = self.gcs_scanner.client.bucket(settings.GCS_BUCKET_NAME).name
                     logger.info(f"Destination bucket: {bucket_name}")
 
-                    destination_full_path, size = self.gcs_scanner.copy_blob(
+                    destination_full_path, size = await run_in_threadpool(
+                        self.gcs_scanner.copy_blob,
                         file_info.full_path,
                         bucket_name,
                         destination_path
@@ -245,7 +306,7 @@ class LabellingJobService:
                     processing_status='pending'  # Will be processed for thumbnails
                 )
                 db.add(image)
-                db.flush()  # Get image ID
+                await run_in_threadpool(db.flush)  # Get image ID
 
                 ingested_images.append(image)
                 existing_filenames.add(filename)
@@ -256,7 +317,10 @@ class LabellingJobService:
                 logger.error(f"✗ Failed to ingest {file_info.filename}: {str(e)}", exc_info=True)
                 run.images_failed += 1
 
-        db.commit()
+        await run_in_threadpool(db.commit)
+        if ingested_images:
+            # Project detail embeds per-dataset image counts
+            get_response_cache().invalidate(PROJECTS_CACHE_NAMESPACE)
 
         # Log ingestion summary
         logger.info(f"Ingestion complete: {len(ingested_images)} succeeded, {run.images_failed} failed out of {len(files)} total")
@@ -265,7 +329,8 @@ class LabellingJobService:
         if ingested_images and settings.USE_CLOUD_TASKS:
             try:
                 cloud_tasks = get_cloud_tasks_service()
-                task_name = cloud_tasks.enqueue_dataset_processing(
+                task_name = await run_in_threadpool(
+                    cloud_tasks.enqueue_dataset_processing,
                     str(job.project_id),
                     str(dataset.id)
                 )
@@ -275,6 +340,14 @@ class LabellingJobService:
 
         return ingested_images
 
+    def _existing_filenames(self, dataset_id: uuid.UUID, db: Session) -> set:
+        """Filenames already in the dataset, to detect duplicates (blocking; threadpool only)"""
+        return {
+            img.filename for img in db.query(Image.filename).filter(
+                Image.dataset_id == dataset_id
+            ).all()
+        }
+
     async def _wait_for_thumbnails(self, images: List[Image], db: Session, timeout: int = 600):
         """
         Poll until all thumbnails are generated or timeout.
@@ -415,7 +488,7 @@ class LabellingJobService:
         # Process all images in parallel
         await asyncio.gather(*[process_image(img) for img in images])
 
-        db.commit()
+        await run_in_threadpool(db.commit)
         return results
 
     async def _preload_images(self, images: List[Image]) -> Dict[str, Tuple[str, str]]:
@@ -13,6 +13,26 @@ from infrastructure.llm.anthropic import AnthropicProvider
 
 logger = structlog.get_logger(__name__)
 
+# Env vars checked (in order) when a model config has no real API key
+ENV_API_KEY_VARS = {
+    "openai": ("OPENAI_API_KEY",),
+    "anthropic": ("ANTHROPIC_API_KEY",),
+    # Gemini provider uses API key authentication only
+    "gemini": ("GEMINI_API_KEY", "GOOGLE_API_KEY"),
+    # Vertex AI provider uses API key or ADC
+    "vertex": ("VERTEX_AI_API_KEY", "GEMINI_API_KEY"),
+}
+
+@lru_cache(maxsize=None)
+def _env_api_key(provider_name: str) -> Optional[str]:
+    """Resolve the fallback API key for a provider once per process"""
+    for var in ENV_API_KEY_VARS.get(provider_name, ()):
+        value = os.environ.get(var)
+        if value:
+            logger.info("using_env_api_key", provider=provider_name, env_var=var)
+            return value
+    return None
+
 def is_retryable_error(exception):
     """Return True if exception should be retried (429 rate limit or 5xx server errors)"""
     if isinstance(exception, httpx.HTTPStatusError):
@@ -91,19 +111,7 @@ class LLMService:
         # Secret Injection: Fallback to env vars if key is missing/placeholder
         final_api_key = api_key
         if not final_api_key or final_api_key == "sk-placeholder":
-            if provider_name == "openai":
-                final_api_key = os.environ.get("OPENAI_API_KEY")
-            elif provider_name == "anthropic":
-                final_api_key = os.environ.get("ANTHROPIC_API_KEY")
-            elif provider_name == "gemini":
-                # Gemini provider uses API key authentication only
-                final_api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
-            elif provider_name == "vertex":
-                # Vertex AI provider uses API key or ADC
-                final_api_key = os.environ.get("VERTEX_AI_API_KEY") or os.environ.get("GEMINI_API_KEY")
-
-            if final_api_key:
-                logger.info("using_env_api_key", provider=provider_name)
+            final_api_key = _env_api_key(provider_name)
 
         # Create retry-wrapped function with model-specific config
         retry_decorator = self._create_retry_decorator(retry_config)
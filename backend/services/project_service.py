@@ -1,24 +1,65 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+import uuid
+from sqlalchemy import delete, exists, tuple_, update
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload, undefer
 from fastapi import HTTPException, status
 import structlog
 
+from core.cache import get_response_cache
 from models.project import Project, Dataset
 from models.user import User
 
 logger = structlog.get_logger(__name__)
 
+# Response cache namespace for the project list/detail endpoints
+PROJECTS_CACHE_NAMESPACE = "projects"
+
+QUESTION_TYPES = ('binary', 'multiple_choice', 'text', 'count')
+_VALID_QUESTION_TYPES = frozenset(QUESTION_TYPES)
+
 class ProjectService:
-    def __init__(self, db: Session):
-        self.db = db
+    """Stateless project operations; the session is passed to each call"""
+
+    __slots__ = ()
+
+    def list_projects(
+        self,
+        db: Session,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        yield_per: Optional[int] = None
+    ) -> Iterable[Project]:
+        """
+        List projects ordered by creation date desc.
+
+        Pass limit (and the (created_at, id) of the previous page's last row
+        as after) to page by keyset; without a limit every project is returned.
+        With yield_per, rows are streamed from the cursor in batches of that
+        size instead of being fetched into one list.
+        """
+        # Load what the list response reads up front (dataset COUNT subquery,
+        # a JOIN for the creator) and fail loudly on any other lazy load
+        query = db.query(Project).options(
+            undefer(Project.dataset_count),
+            joinedload(Project.created_by),
+            raiseload('*')
+        )
+        if after is not None:
+            query = query.filter(tuple_(Project.created_at, Project.id) < after)
 
-    def list_projects(self) -> List[Project]:
-        """List all projects ordered by creation date desc"""
-        return self.db.query(Project).order_by(Project.created_at.desc()).all()
+        query = query.order_by(Project.created_at.desc(), Project.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        if yield_per is not None:
+            return query.yield_per(yield_per)
+        return query.all()
 
-    def get_project(self, project_id: str) -> Project:
+    def get_project(self, db: Session, project_id: str) -> Project:
         """Get project by ID"""
-        project = self.db.query(Project).filter(Project.id == project_id).first()
+        project = db.query(Project).options(
+            selectinload(Project.datasets).undefer(Dataset.image_count)
+        ).filter(Project.id == project_id).first()
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -26,14 +67,13 @@ class ProjectService:
             )
         return project
 
-    def create_project(self, project_data, current_user: User) -> Project:
+    def create_project(self, db: Session, project_data, current_user: User) -> Project:
         """Create a new project"""
         # Validate question_type
-        valid_types = ['binary', 'multiple_choice', 'text', 'count']
-        if project_data.question_type not in valid_types:
+        if project_data.question_type not in _VALID_QUESTION_TYPES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid question_type. Must be one of: {valid_types}"
+                detail=f"Invalid question_type. Must be one of: {list(QUESTION_TYPES)}"
             )
 
         # Multiple choice requires options
@@ -51,61 +91,101 @@ class ProjectService:
             question_options=project_data.question_options,
             created_by_id=current_user.id
         )
-        self.db.add(project)
-        self.db.commit()
-        self.db.refresh(project)
+        db.add(project)
+        db.commit()
+        db.refresh(project)
+        get_response_cache().invalidate(PROJECTS_CACHE_NAMESPACE)
 
         logger.info("project_created", project_name=project.name, user_email=current_user.email, project_id=str(project.id))
         return project
 
-    def update_project(self, project_id: str, project_data, current_user: User) -> Project:
+    def update_project(self, db: Session, project_id: str, project_data, current_user: User) -> Project:
         """Update project"""
-        project = self.get_project(project_id)
-
-        # Only the project owner can edit their project
-        if str(project.created_by_id) != str(current_user.id):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You can only edit your own projects"
-            )
-
-        if project_data.name is not None:
-            project.name = project_data.name
-        if project_data.description is not None:
-            project.description = project_data.description
-        if project_data.question_text is not None:
-            project.question_text = project_data.question_text
         if project_data.question_type is not None:
-            valid_types = ['binary', 'multiple_choice', 'text', 'count']
-            if project_data.question_type not in valid_types:
+            if project_data.question_type not in _VALID_QUESTION_TYPES:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid question_type. Must be one of: {valid_types}"
+                    detail=f"Invalid question_type. Must be one of: {list(QUESTION_TYPES)}"
                 )
-            project.question_type = project_data.question_type
-        if project_data.question_options is not None:
-            project.question_options = project_data.question_options
 
-        self.db.commit()
-        self.db.refresh(project)
+        values = {
+            field: getattr(project_data, field)
+            for field in ('name', 'description', 'question_text', 'question_type', 'question_options')
+            if getattr(project_data, field) is not None
+        }
+
+        if values:
+            # One UPDATE ... RETURNING guarded by ownership instead of
+            # SELECT + assign + commit + refresh
+            updated_id = db.execute(
+                update(Project)
+                .where(Project.id == project_id, Project.created_by_id == current_user.id)
+                .values(**values)
+                .returning(Project.id)
+                .execution_options(synchronize_session=False)
+            ).scalar_one_or_none()
+
+            if updated_id is None:
+                self._raise_missing_or_forbidden(db, project_id, "edit")
+
+            db.commit()
+            get_response_cache().invalidate(PROJECTS_CACHE_NAMESPACE)
+
+        # Re-read with the datasets (and their image counts) in one extra IN query
+        project = self.get_project(db, project_id)
+
+        # Only the project owner can edit their project (already enforced by
+        # the UPDATE's WHERE clause when there was something to write)
+        if not values and str(project.created_by_id) != str(current_user.id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You can only edit your own projects"
+            )
 
         logger.info("project_updated", project_id=project_id, project_name=project.name, user_id=str(current_user.id))
         return project
 
-    def delete_project(self, project_id: str, current_user: User) -> str:
+    def delete_project(self, db: Session, project_id: str, current_user: User) -> str:
         """Delete project and return its name"""
-        project = self.get_project(project_id)
+        # One ownership-guarded DELETE; datasets, images and annotations go
+        # with it through ON DELETE CASCADE instead of ORM-side cascades
+        project_name = db.execute(
+            delete(Project)
+            .where(Project.id == project_id, Project.created_by_id == current_user.id)
+            .returning(Project.name)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
 
-        # Only the project owner can delete their project
-        if str(project.created_by_id) != str(current_user.id):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You can only delete your own projects"
-            )
+        if project_name is None:
+            self._raise_missing_or_forbidden(db, project_id, "delete")
 
-        project_name = project.name
-        self.db.delete(project)
-        self.db.commit()
+        db.commit()
+        get_response_cache().invalidate(PROJECTS_CACHE_NAMESPACE)
 
         logger.info("project_deleted", project_id=project_id, project_name=project_name, user_id=str(current_user.id))
         return project_name
+
+    def _raise_missing_or_forbidden(self, db: Session, project_id: str, action: str) -> None:
+        """After an owner-guarded write matched nothing, raise 404 or 403"""
+        # SELECT EXISTS(...) - no row is hydrated just to pick the status code
+        if not db.query(exists().where(Project.id == project_id)).scalar():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"You can only {action} your own projects"
+        )
+
+
+# Singleton instance
+_project_service = None
+
+
+def get_project_service() -> ProjectService:
+    """Get the ProjectService singleton instance"""
+    global _project_service
+    if _project_service is None:
+        _project_service = ProjectService()
+    return _project_service
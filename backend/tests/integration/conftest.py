@@ -118,6 +118,20 @@ def mock_db_session(mocker):
     return mock_session
 
 
+# ============================================================================
+# Cache Fixtures
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with an empty process-wide response cache"""
+    from core.cache import get_response_cache
+
+    get_response_cache().clear()
+    yield
+    get_response_cache().clear()
+
+
 # ============================================================================
 # API Client Fixtures
 # ============================================================================
@@ -4,9 +4,16 @@ Integration tests for Dataset API endpoints
 These tests verify complete API request/response flows for dataset CRUD operations.
 """
 import pytest
+import uuid
 from datetime import datetime
+from io import BytesIO
 from unittest.mock import patch, AsyncMock
 
+from PIL import Image as PILImage
+
+from core.cache import get_response_cache
+from services.project_service import PROJECTS_CACHE_NAMESPACE
+
 from models.project import Project, Dataset
 from models.image import Image
 
@@ -82,7 +89,7 @@ class TestDatasetListing:
         Expected: 200 status with list of datasets
         """
         test_project.datasets = [test_dataset]
-        mock_db_session.query.return_value.filter.return_value.first.return_value = test_project
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = test_project
 
         response = integration_client.get(f"/api/v1/projects/{test_project.id}/datasets")
 
@@ -99,7 +106,7 @@ class TestDatasetListing:
         Expected: 200 status with empty array
         """
         test_project.datasets = []
-        mock_db_session.query.return_value.filter.return_value.first.return_value = test_project
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = test_project
 
         response = integration_client.get(f"/api/v1/projects/{test_project.id}/datasets")
 
@@ -112,7 +119,7 @@ class TestDatasetListing:
 
         Expected: 404 Not Found
         """
-        mock_db_session.query.return_value.filter.return_value.first.return_value = None
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = None
 
         response = integration_client.get("/api/v1/projects/ffffffff-ffff-ffff-ffff-ffffffffffff/datasets")
 
@@ -156,6 +163,76 @@ class TestDatasetProcessingStatusEndpoint:
         assert response.status_code == 404
 
 
+class TestImageUpload:
+    """Test direct image upload with inline thumbnails"""
+
+    def test_upload_processes_files_in_worker_sized_slices(self, integration_client, mock_db_session, test_project, test_dataset):
+        """
+        Test that uploads are thumbnailed slice by slice, not all buffered at once
+
+        Expected: 200 with every valid file stored; thumbnail batches of at most 2
+        """
+        mock_db_session.query.return_value.filter.return_value.first.side_effect = [
+            test_dataset,  # First call: dataset lookup
+            test_project   # Second call: project lookup
+        ]
+
+        def refresh(image):
+            image.id = uuid.uuid4()
+            image.uploaded_at = datetime(2024, 1, 15, 10, 0, 0)
+
+        mock_db_session.refresh.side_effect = refresh
+
+        png = BytesIO()
+        PILImage.new("RGB", (64, 48)).save(png, format="PNG")
+        files = [("files", (f"img{i}.png", png.getvalue(), "image/png")) for i in range(5)]
+        files.append(("files", ("broken.png", b"not an image", "image/png")))
+
+        get_response_cache().set(PROJECTS_CACHE_NAMESPACE, ("detail", test_project.id), b"stale")
+
+        from core.image_utils import generate_thumbnails_async
+        with patch('api.v1.datasets.get_storage_provider') as mock_storage, \
+                patch('api.v1.datasets.THUMBNAIL_WORKERS', 2), \
+                patch('api.v1.datasets.generate_thumbnails_async', wraps=generate_thumbnails_async) as batch:
+            mock_storage.return_value.upload = AsyncMock(side_effect=lambda file, path: (path, 0))
+            response = integration_client.post(
+                f"/api/v1/projects/{test_project.id}/datasets/{test_dataset.id}/images",
+                files=files
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["images"]) == 5
+        assert len(data["errors"]) == 1
+        assert [len(call.args[0]) for call in batch.call_args_list] == [2, 2, 2]
+        # Project detail embeds image counts, so it must be re-read
+        assert get_response_cache().get(PROJECTS_CACHE_NAMESPACE, ("detail", test_project.id)) is None
+
+    def test_delete_image_invalidates_project_detail(self, integration_client, mock_db_session, test_project, test_dataset):
+        """
+        Test that deleting an image drops the cached project detail
+
+        Expected: 200 and no cached project detail afterwards
+        """
+        image = Image(
+            id="dddddddd-dddd-dddd-dddd-dddddddddddd",
+            dataset_id=test_dataset.id,
+            filename="img.png",
+            storage_path="projects/x/img.png"
+        )
+        mock_db_session.query.return_value.filter.return_value.first.side_effect = [image, test_project]
+        get_response_cache().set(PROJECTS_CACHE_NAMESPACE, ("detail", test_project.id), b"stale")
+
+        with patch('api.v1.datasets.get_storage_provider') as mock_storage:
+            mock_storage.return_value = AsyncMock()
+            response = integration_client.delete(
+                f"/api/v1/projects/{test_project.id}/datasets/{test_dataset.id}/images/{image.id}"
+            )
+
+        assert response.status_code == 200
+        assert get_response_cache().get(PROJECTS_CACHE_NAMESPACE, ("detail", test_project.id)) is None
+
+
 class TestDatasetDeletion:
     """Test dataset deletion endpoints"""
 
@@ -245,7 +322,7 @@ class TestDatasetPermissions:
         Expected: 200 OK
         """
         test_project.datasets = [test_dataset]
-        mock_db_session.query.return_value.filter.return_value.first.return_value = test_project
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = test_project
 
         response = viewer_client.get(f"/api/v1/projects/{test_project.id}/datasets")
 
@@ -0,0 +1,37 @@
+"""
+Integration tests for Model Config API endpoints
+
+These tests verify request/response flows that go through the response cache.
+"""
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+
+class TestModelConfigCaching:
+    """Test that list and detail responses don't share cache entries"""
+
+    def test_detail_lookup_after_list_is_not_served_list_entry(self, integration_client, mock_db_session):
+        """
+        Test that a detail request for id "list" misses the cached list body
+
+        Expected: list returns 200, the bogus detail id returns 404 (not 500)
+        """
+        mock_db_session.execute.return_value.all.return_value = [
+            SimpleNamespace(
+                id=uuid.uuid4(),
+                name="GPT",
+                provider="openai",
+                model_name="gpt-4o",
+                auth_type="api_key",
+                is_active=True,
+                created_at=datetime(2024, 1, 15, 10, 0, 0)
+            )
+        ]
+
+        listing = integration_client.get("/api/v1/model-configs")
+        detail = integration_client.get("/api/v1/model-configs/list")
+
+        assert listing.status_code == 200
+        assert len(listing.json()) == 1
+        assert detail.status_code == 404
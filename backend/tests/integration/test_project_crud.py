@@ -5,7 +5,7 @@ These tests verify complete API request/response flows for project CRUD operatio
 """
 import pytest
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from models.project import Project
 
@@ -102,8 +102,8 @@ class TestProjectListing:
 
         Expected: 200 status with list of projects
         """
-        # Arrange - list_projects uses order_by().all()
-        mock_db_session.query.return_value.order_by.return_value.all.return_value = [test_project]
+        # Arrange - list_projects streams rows with order_by().yield_per()
+        mock_db_session.query.return_value.options.return_value.order_by.return_value.yield_per.return_value = [test_project]
 
         # Act
         response = integration_client.get("/api/v1/projects")
@@ -121,13 +121,79 @@ class TestProjectListing:
 
         Expected: 200 status with empty array
         """
-        mock_db_session.query.return_value.order_by.return_value.all.return_value = []
+        mock_db_session.query.return_value.options.return_value.order_by.return_value.yield_per.return_value = []
 
         response = integration_client.get("/api/v1/projects")
 
         assert response.status_code == 200
         assert response.json() == []
 
+    def test_list_projects_served_from_cache_until_write(self, integration_client, mock_db_session, test_project):
+        """
+        Test that repeated listings reuse the cached body until a project is created
+
+        Expected: one query for two reads, a fresh query after the create
+        """
+        list_query = mock_db_session.query.return_value.options.return_value.order_by.return_value
+        list_query.yield_per.return_value = [test_project]
+
+        def capture_add(project):
+            project.id = "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"
+            project.created_at = datetime(2024, 1, 15, 10, 0, 0)
+            project.updated_at = datetime(2024, 1, 15, 10, 0, 0)
+
+        mock_db_session.add.side_effect = capture_add
+
+        first = integration_client.get("/api/v1/projects")
+        second = integration_client.get("/api/v1/projects")
+
+        assert first.json() == second.json()
+        assert list_query.yield_per.call_count == 1
+
+        integration_client.post(
+            "/api/v1/projects",
+            json={"name": "New", "question_text": "Q?", "question_type": "binary"}
+        )
+        integration_client.get("/api/v1/projects")
+
+        assert list_query.yield_per.call_count == 2
+
+    def test_list_projects_with_limit_returns_next_cursor(self, integration_client, mock_db_session, test_project, admin_user):
+        """
+        Test that a limited listing trims the look-ahead row and returns a cursor
+
+        Expected: one project in the body and an X-Next-Cursor header
+        """
+        older_project = Project(
+            id="cccccccc-cccc-cccc-cccc-cccccccccccc",
+            name="Older Project",
+            question_text="Q?",
+            question_type="binary",
+            created_by_id=admin_user.id,
+            created_at=datetime(2024, 1, 1, 10, 0, 0),
+            updated_at=datetime(2024, 1, 1, 10, 0, 0)
+        )
+        older_project.created_by = admin_user
+        mock_db_session.query.return_value.options.return_value.order_by.return_value.limit.return_value.yield_per.return_value = [
+            test_project, older_project
+        ]
+
+        response = integration_client.get("/api/v1/projects?limit=1")
+
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()] == [test_project.id]
+        assert "x-next-cursor" in response.headers
+
+    def test_list_projects_invalid_cursor(self, integration_client):
+        """
+        Test that a malformed cursor is rejected
+
+        Expected: 400 Bad Request
+        """
+        response = integration_client.get("/api/v1/projects?limit=10&cursor=garbage")
+
+        assert response.status_code == 400
+
 
 class TestProjectRetrieval:
     """Test single project retrieval"""
@@ -138,7 +204,7 @@ class TestProjectRetrieval:
 
         Expected: 200 status with project data
         """
-        mock_db_session.query.return_value.filter.return_value.first.return_value = test_project
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = test_project
 
         response = integration_client.get(f"/api/v1/projects/{test_project.id}")
 
@@ -153,7 +219,7 @@ class TestProjectRetrieval:
 
         Expected: 404 Not Found
         """
-        mock_db_session.query.return_value.filter.return_value.first.return_value = None
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = None
 
         response = integration_client.get("/api/v1/projects/ffffffff-ffff-ffff-ffff-ffffffffffff")
 
@@ -165,7 +231,7 @@ class TestProjectRetrieval:
 
         Expected: 404 Not Found (invalid UUIDs are treated as not found)
         """
-        mock_db_session.query.return_value.filter.return_value.first.return_value = None
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = None
 
         response = integration_client.get("/api/v1/projects/not-a-uuid")
 
@@ -182,7 +248,14 @@ class TestProjectUpdate:
 
         Expected: 200 status with updated project data
         """
-        mock_db_session.query.return_value.filter.return_value.first.return_value = test_project
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = test_project
+
+        def apply_update(stmt):
+            # The UPDATE ... RETURNING runs in the DB; mirror it on the row the re-read returns
+            test_project.name = stmt.compile().params["name"]
+            return Mock(scalar_one_or_none=Mock(return_value=test_project.id))
+
+        mock_db_session.execute.side_effect = apply_update
 
         response = integration_client.patch(
             f"/api/v1/projects/{test_project.id}",
@@ -201,7 +274,7 @@ class TestProjectUpdate:
 
         Expected: 404 Not Found
         """
-        mock_db_session.query.return_value.filter.return_value.first.return_value = None
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = None
 
         response = integration_client.patch(
             "/api/v1/projects/ffffffff-ffff-ffff-ffff-ffffffffffff",
@@ -222,12 +295,14 @@ class TestProjectDeletion:
 
         Expected: 200 status with success message
         """
-        mock_db_session.query.return_value.filter.return_value.first.return_value = test_project
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = test_project.name
 
         response = integration_client.delete(f"/api/v1/projects/{test_project.id}")
 
         assert response.status_code == 200
-        mock_db_session.delete.assert_called_once()
+        assert test_project.name in response.json()["message"]
+        mock_db_session.execute.assert_called_once()
+        mock_db_session.commit.assert_called_once()
 
     def test_delete_project_not_found(self, integration_client, mock_db_session):
         """
@@ -235,7 +310,8 @@ class TestProjectDeletion:
 
         Expected: 404 Not Found
         """
-        mock_db_session.query.return_value.filter.return_value.first.return_value = None
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = None
+        mock_db_session.query.return_value.scalar.return_value = False
 
         response = integration_client.delete("/api/v1/projects/ffffffff-ffff-ffff-ffff-ffffffffffff")
 
@@ -283,7 +359,7 @@ class TestProjectPermissions:
 
         Expected: 200 OK
         """
-        mock_db_session.query.return_value.order_by.return_value.all.return_value = [test_project]
+        mock_db_session.query.return_value.options.return_value.order_by.return_value.yield_per.return_value = [test_project]
 
         response = viewer_client.get("/api/v1/projects")
 
@@ -295,7 +371,7 @@ class TestProjectPermissions:
 
         Expected: 200 OK
         """
-        mock_db_session.query.return_value.filter.return_value.first.return_value = test_project
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = test_project
 
         response = viewer_client.get(f"/api/v1/projects/{test_project.id}")
 
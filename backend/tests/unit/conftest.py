@@ -408,7 +408,8 @@ def mock_settings(mocker):
     mock_settings_obj.GOOGLE_REDIRECT_URI = "http://localhost:8000/api/v1/auth/google/callback"
     mock_settings_obj.FRONTEND_URL = "http://localhost:4200"
     mock_settings_obj.ALLOWED_ORIGINS = ["http://localhost:4200", "http://localhost:3000"]
-    mock_settings_obj.ALLOWED_DOMAIN_LIST = []
+    mock_settings_obj.NORMALIZED_ALLOWED_ORIGINS = frozenset(mock_settings_obj.ALLOWED_ORIGINS)
+    mock_settings_obj.ALLOWED_DOMAIN_LIST = frozenset()
     mock_settings_obj.ENVIRONMENT = "test"
 
     # Patch the settings import
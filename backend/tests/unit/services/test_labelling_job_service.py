@@ -0,0 +1,60 @@
+import threading
+import uuid
+import pytest
+from unittest.mock import MagicMock, patch
+from services.labelling_job_service import LabellingJobService
+
+@pytest.fixture
+def mock_db():
+    db = MagicMock()
+    db.expire_on_commit = True
+    return db
+
+@pytest.fixture
+def labelling_job_service():
+    with patch("services.labelling_job_service.GCSScannerService"), \
+            patch("services.labelling_job_service.get_storage_provider"):
+        return LabellingJobService()
+
+def _job():
+    job = MagicMock(dataset_id=uuid.uuid4(), gcs_folder_path="gs://bucket/in", last_processed_timestamp=None)
+    job.name = "Job"
+    return job
+
+@pytest.mark.asyncio
+async def test_run_job_scans_gcs_off_the_event_loop(labelling_job_service, mock_db):
+    job = _job()
+    mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = job
+    seen = {}
+
+    def scan_folder(path, last_processed_timestamp=None):
+        seen["thread"] = threading.current_thread()
+        return []
+
+    labelling_job_service.gcs_scanner.scan_folder.side_effect = scan_folder
+
+    run = await labelling_job_service.run_job(str(uuid.uuid4()), mock_db)
+
+    assert seen["thread"] is not threading.main_thread()
+    assert run.status == "completed"
+    assert run.images_discovered == 0
+
+@pytest.mark.asyncio
+async def test_run_job_restores_expire_on_commit(labelling_job_service, mock_db):
+    job = _job()
+    mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = job
+    labelling_job_service.gcs_scanner.scan_folder.side_effect = RuntimeError("GCS down")
+
+    with pytest.raises(RuntimeError):
+        await labelling_job_service.run_job(str(uuid.uuid4()), mock_db)
+
+    assert mock_db.expire_on_commit is True
+    assert job.status == "error"
+    mock_db.rollback.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_run_job_missing_job(labelling_job_service, mock_db):
+    mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = None
+
+    with pytest.raises(ValueError):
+        await labelling_job_service.run_job(str(uuid.uuid4()), mock_db)
@@ -50,3 +50,23 @@ def test_image_service_health_endpoint():
     data = response.json()
     assert data["status"] == "healthy"
     assert data["service"] == "images"
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_pending_prewarm():
+    """Test shutdown cancels an unfinished prewarm before closing HTTP clients"""
+    import asyncio
+    from unittest.mock import AsyncMock, patch
+    from main import shutdown_event
+
+    prewarm_task = asyncio.create_task(asyncio.sleep(60))
+    app.state.prewarm_task = prewarm_task
+    try:
+        with patch("core.http_client.HttpClient.close_all", new=AsyncMock()) as close_all, \
+                patch("core.database.engine"):
+            await shutdown_event()
+    finally:
+        del app.state.prewarm_task
+
+    assert prewarm_task.cancelled()
+    close_all.assert_awaited_once()
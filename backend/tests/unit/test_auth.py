@@ -8,6 +8,7 @@ All external dependencies (database, OAuth, HTTP calls) are mocked.
 import pytest
 from datetime import datetime, timedelta
 from fastapi import HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials
 from unittest.mock import Mock, AsyncMock, patch
 from jose import jwt
 
@@ -113,8 +114,7 @@ class TestCreateAccessToken:
 class TestGetCurrentUser:
     """Test user authentication from JWT token"""
 
-    @pytest.mark.asyncio
-    async def test_get_current_user_from_cookie_success(self, mock_db_session, sample_admin_user, mock_settings):
+    def test_get_current_user_from_cookie_success(self, mock_db_session, sample_admin_user, mock_settings):
         """
         Test that get_current_user successfully extracts user from cookie token
 
@@ -135,10 +135,11 @@ class TestGetCurrentUser:
         mock_request.headers = {"user-agent": "test-agent"}
 
         # Act
-        result = await get_current_user(
+        result = get_current_user(
             request=mock_request,
             db=mock_db_session,
-            auth_token=token
+            auth_token=token,
+            bearer=None
         )
 
         # Assert
@@ -146,8 +147,7 @@ class TestGetCurrentUser:
         assert result.email == "admin@test.com"
         assert result.role == UserRole.ADMIN.value
 
-    @pytest.mark.asyncio
-    async def test_get_current_user_from_header_success(self, mock_db_session, sample_regular_user, mock_settings):
+    def test_get_current_user_from_header_success(self, mock_db_session, sample_regular_user, mock_settings):
         """
         Test that get_current_user successfully extracts user from Authorization header
 
@@ -175,19 +175,19 @@ class TestGetCurrentUser:
             "Authorization": f"Bearer {token}"
         })
 
-        # Act
-        result = await get_current_user(
+        # Act - HTTPBearer hands over the parsed header
+        result = get_current_user(
             request=mock_request,
             db=mock_db_session,
-            auth_token=None  # No cookie
+            auth_token=None,  # No cookie
+            bearer=HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
         )
 
         # Assert
         assert result == sample_regular_user
         assert result.email == "user@test.com"
 
-    @pytest.mark.asyncio
-    async def test_get_current_user_no_token_raises_401(self, mock_db_session, mock_settings):
+    def test_get_current_user_no_token_raises_401(self, mock_db_session, mock_settings):
         """
         Test that get_current_user raises 401 when no token is provided
 
@@ -199,17 +199,17 @@ class TestGetCurrentUser:
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            await get_current_user(
+            get_current_user(
                 request=mock_request,
                 db=mock_db_session,
-                auth_token=None
+                auth_token=None,
+                bearer=None
             )
 
         assert exc_info.value.status_code == 401
         assert "Could not validate credentials" in exc_info.value.detail
 
-    @pytest.mark.asyncio
-    async def test_get_current_user_invalid_token_raises_401(self, mock_db_session, mock_settings):
+    def test_get_current_user_invalid_token_raises_401(self, mock_db_session, mock_settings):
         """
         Test that get_current_user raises 401 when token is invalid/malformed
 
@@ -223,16 +223,16 @@ class TestGetCurrentUser:
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            await get_current_user(
+            get_current_user(
                 request=mock_request,
                 db=mock_db_session,
-                auth_token=invalid_token
+                auth_token=invalid_token,
+                bearer=None
             )
 
         assert exc_info.value.status_code == 401
 
-    @pytest.mark.asyncio
-    async def test_get_current_user_inactive_user_raises_400(self, mock_db_session, sample_inactive_user, mock_settings):
+    def test_get_current_user_inactive_user_raises_400(self, mock_db_session, sample_inactive_user, mock_settings):
         """
         Test that get_current_user raises 400 when user is inactive
 
@@ -253,10 +253,11 @@ class TestGetCurrentUser:
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            await get_current_user(
+            get_current_user(
                 request=mock_request,
                 db=mock_db_session,
-                auth_token=token
+                auth_token=token,
+                bearer=None
             )
 
         assert exc_info.value.status_code == 400
@@ -0,0 +1,91 @@
+"""
+Unit tests for the in-process response cache
+"""
+from unittest.mock import patch
+
+from core.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test ResponseCache get/set/invalidate behaviour"""
+
+    def test_miss_returns_none(self):
+        cache = ResponseCache()
+        assert cache.get("ns", "key") is None
+
+    def test_set_then_get(self):
+        cache = ResponseCache()
+        cache.set("ns", "key", [1, 2, 3])
+        assert cache.get("ns", "key") == [1, 2, 3]
+
+    def test_entry_expires_after_ttl(self):
+        cache = ResponseCache(ttl_seconds=10)
+        with patch("core.cache.time.monotonic", return_value=100.0):
+            cache.set("ns", "key", "value")
+        with patch("core.cache.time.monotonic", return_value=111.0):
+            assert cache.get("ns", "key") is None
+
+    def test_invalidate_drops_only_that_namespace(self):
+        cache = ResponseCache()
+        cache.set("a", "key", 1)
+        cache.set("b", "key", 2)
+
+        cache.invalidate("a")
+
+        assert cache.get("a", "key") is None
+        assert cache.get("b", "key") == 2
+
+    def test_invalidate_several_namespaces_at_once(self):
+        cache = ResponseCache()
+        cache.set("a", "key", 1)
+        cache.set("b", "key", 2)
+        cache.set("c", "key", 3)
+
+        cache.invalidate("a", "b")
+
+        assert cache.get("a", "key") is None
+        assert cache.get("b", "key") is None
+        assert cache.get("c", "key") == 3
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set("ns", "first", 1)
+        cache.set("ns", "second", 2)
+        cache.get("ns", "first")  # Touch so "second" becomes the oldest
+        cache.set("ns", "third", 3)
+
+        assert cache.get("ns", "first") == 1
+        assert cache.get("ns", "second") is None
+        assert cache.get("ns", "third") == 3
+
+    def test_get_or_set_loads_once_then_hits(self):
+        cache = ResponseCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_set("ns", "key", loader) == "value"
+        assert cache.get_or_set("ns", "key", loader) == "value"
+        assert len(calls) == 1
+
+    def test_get_or_set_serves_stale_while_refreshing(self):
+        cache = ResponseCache(ttl_seconds=10, stale_seconds=10)
+        with patch("core.cache.time.monotonic", return_value=100.0):
+            cache.set("ns", "key", "old")
+
+        with patch("core.cache.time.monotonic", return_value=115.0):
+            # Simulate another request already regenerating the entry
+            cache._refreshing.add(("ns", "key"))
+            assert cache.get_or_set("ns", "key", lambda: "new") == "old"
+
+    def test_get_or_set_skips_store_after_concurrent_invalidate(self):
+        cache = ResponseCache()
+
+        def loader():
+            cache.invalidate("ns")  # A write lands while the value is being built
+            return "outdated"
+
+        assert cache.get_or_set("ns", "key", loader) == "outdated"
+        assert cache.get("ns", "key") is None
@@ -103,7 +103,7 @@ class TestListDatasets:
         sample_project.datasets = [test_dataset]
 
         # Mock project lookup
-        mock_db_session.query.return_value.filter.return_value.first.return_value = sample_project
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = sample_project
 
         # Act
         response = authenticated_client.get(f"/api/v1/projects/{sample_project.id}/datasets")
@@ -122,7 +122,7 @@ class TestListDatasets:
         """
         # Arrange - Project with no datasets
         sample_project.datasets = []
-        mock_db_session.query.return_value.filter.return_value.first.return_value = sample_project
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = sample_project
 
         # Act
         response = authenticated_client.get(f"/api/v1/projects/{sample_project.id}/datasets")
@@ -138,7 +138,7 @@ class TestListDatasets:
         Expected: 404 error with "Project not found" message
         """
         # Arrange
-        mock_db_session.query.return_value.filter.return_value.first.return_value = None
+        mock_db_session.query.return_value.options.return_value.filter.return_value.first.return_value = None
 
         # Act - Use valid UUID format
         response = authenticated_client.get("/api/v1/projects/cccccccc-cccc-cccc-cccc-cccccccccccc/datasets")
@@ -0,0 +1,43 @@
+"""
+Unit tests for ETag / If-None-Match helpers
+"""
+from unittest.mock import Mock
+
+from core.http_cache import make_etag, etag_matches, not_modified
+
+
+def _request(if_none_match=None):
+    request = Mock()
+    request.headers = {"if-none-match": if_none_match} if if_none_match else {}
+    return request
+
+
+class TestEtag:
+    """Test ETag generation and matching"""
+
+    def test_etag_is_quoted_and_stable(self):
+        etag = make_etag("id", "2024-01-15 10:00:00")
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag("id", "2024-01-15 10:00:00")
+        assert etag != make_etag("id", "2024-01-15 10:00:01")
+
+    def test_matches_exact_weak_and_list(self):
+        etag = make_etag("id", 1)
+
+        assert etag_matches(_request(etag), etag)
+        assert etag_matches(_request(f"W/{etag}"), etag)
+        assert etag_matches(_request(f'"other", {etag}'), etag)
+        assert etag_matches(_request("*"), etag)
+
+    def test_no_match(self):
+        etag = make_etag("id", 1)
+
+        assert not etag_matches(_request(), etag)
+        assert not etag_matches(_request('"other"'), etag)
+
+    def test_not_modified_response(self):
+        response = not_modified('"abc"')
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == '"abc"'
@@ -0,0 +1,45 @@
+"""
+Unit tests for the shared HTTP client
+"""
+import httpx
+import pytest
+from unittest.mock import patch
+
+from core.http_client import HttpClient
+
+
+class TestPrewarm:
+    """Test HttpClient.prewarm connection warm-up"""
+
+    @pytest.mark.asyncio
+    async def test_prewarm_sends_head_and_tolerates_failures(self):
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append((request.method, request.url.host))
+            if request.url.host == "down.example":
+                raise httpx.ConnectError("unreachable", request=request)
+            return httpx.Response(404)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(HttpClient, "get_client", return_value=client):
+            await HttpClient.prewarm(["https://up.example", "https://down.example"])
+        await client.aclose()
+
+        assert requested == [("HEAD", "up.example"), ("HEAD", "down.example")]
+
+
+class TestGetClient:
+    """Test per-loop client lifecycle"""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_for_loop_until_closed(self):
+        client = HttpClient.get_client()
+
+        assert HttpClient.get_client() is client
+
+        await HttpClient.close()
+
+        assert client.is_closed
+        assert HttpClient.get_client() is not client
+        await HttpClient.close()
@@ -0,0 +1,162 @@
+"""
+Unit tests for image utilities
+"""
+import base64
+import uuid
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from core.image_utils import (
+    generate_thumbnail, generate_thumbnail_async, generate_thumbnails_async, get_image_dimensions, thumbnail_data_uri,
+    thumbnail_data_uris, write_thumbnail
+)
+
+
+def _encode(image: Image.Image, fmt: str, **options) -> bytes:
+    buffer = BytesIO()
+    image.save(buffer, format=fmt, **options)
+    return buffer.getvalue()
+
+
+class TestGenerateThumbnail:
+    """Test center-cropped thumbnail generation"""
+
+    def test_large_jpeg_is_cropped_to_size(self):
+        data = _encode(Image.new("RGB", (2400, 1800), (200, 30, 30)), "JPEG")
+
+        with Image.open(BytesIO(generate_thumbnail(data))) as thumb:
+            assert thumb.format == "JPEG"
+            assert thumb.size == (256, 256)
+            r, g, b = thumb.getpixel((128, 128))
+            assert r > 150 and g < 80 and b < 80
+
+    def test_transparent_png_is_flattened_onto_white(self):
+        image = Image.new("RGBA", (400, 400), (0, 0, 0, 0))
+        image.paste((0, 128, 0, 255), (0, 0, 400, 200))  # Opaque green top half
+        data = _encode(image, "PNG")
+
+        with Image.open(BytesIO(generate_thumbnail(data))) as thumb:
+            assert thumb.mode == "RGB"
+            assert all(c > 240 for c in thumb.getpixel((128, 230)))
+            r, g, b = thumb.getpixel((128, 20))
+            assert g > 100 and r < 40 and b < 40
+
+    def test_extreme_aspect_jpeg_still_fills_target(self):
+        data = _encode(Image.new("RGB", (3000, 300), (0, 0, 255)), "JPEG")
+
+        with Image.open(BytesIO(generate_thumbnail(data, size=(128, 64)))) as thumb:
+            assert thumb.size == (128, 64)
+
+    def test_identical_bytes_reuse_cached_thumbnail(self):
+        data = _encode(Image.new("RGB", (320, 240), (1, 2, 3)), "PNG")
+        first = generate_thumbnail(data, size=(64, 64))
+
+        with patch("core.image_utils._render_thumbnail") as render:
+            again = generate_thumbnail(bytes(data), size=(64, 64))
+            generate_thumbnail(data, size=(32, 32))
+
+        assert again is first
+        render.assert_called_once()  # Only the new size is rendered
+
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview])
+    def test_other_buffers_match_bytes_output(self, wrap):
+        data = _encode(Image.new("RGB", (320, 240), (70, 80, 90)), "PNG")
+
+        assert generate_thumbnail(wrap(data), size=(48, 48)) == generate_thumbnail(data, size=(48, 48))
+
+    def test_write_thumbnail_streams_same_jpeg_into_sink(self, tmp_path):
+        data = _encode(Image.new("RGB", (320, 240), (40, 50, 60)), "PNG")
+        path = tmp_path / "thumb.jpg"
+
+        with open(path, "wb") as sink:
+            write_thumbnail(data, sink, size=(64, 64))
+
+        assert path.read_bytes() == generate_thumbnail(data, size=(64, 64))
+
+    @pytest.mark.asyncio
+    async def test_async_wrapper_matches_sync_output(self):
+        data = _encode(Image.new("RGB", (640, 480), (10, 120, 200)), "JPEG")
+
+        assert await generate_thumbnail_async(data) == generate_thumbnail(data)
+
+    @pytest.mark.asyncio
+    async def test_batch_keeps_order_and_isolates_failures(self):
+        red = _encode(Image.new("RGB", (300, 200), (255, 0, 0)), "PNG")
+        blue = _encode(Image.new("RGB", (200, 300), (0, 0, 255)), "PNG")
+
+        results = await generate_thumbnails_async([red, b"not an image", blue])
+
+        assert results[0] == generate_thumbnail(red)
+        assert isinstance(results[1], ValueError)
+        assert results[2] == generate_thumbnail(blue)
+
+
+class TestGetImageDimensions:
+    """Test header-only dimension probing"""
+
+    def test_reads_size_from_bytes(self):
+        data = _encode(Image.new("RGB", (321, 123)), "PNG")
+
+        assert get_image_dimensions(data) == (321, 123)
+
+    @pytest.mark.parametrize("fmt, mode, options", [
+        ("PNG", "RGBA", {}),
+        ("GIF", "P", {}),
+        ("JPEG", "RGB", {}),
+        ("JPEG", "RGB", {"progressive": True}),
+        ("WEBP", "RGB", {}),
+        ("WEBP", "RGBA", {"lossless": True}),
+    ])
+    def test_common_formats_read_from_header_without_pillow(self, fmt, mode, options):
+        data = _encode(Image.new(mode, (1234, 567)), fmt, **options)
+
+        with patch("core.image_utils.Image.open", side_effect=AssertionError("fast path missed")):
+            assert get_image_dimensions(data) == (1234, 567)
+
+    def test_other_formats_fall_back_to_pillow(self):
+        data = _encode(Image.new("RGB", (77, 66)), "BMP")
+
+        assert get_image_dimensions(data) == (77, 66)
+
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview])
+    def test_accepts_other_buffers(self, wrap):
+        data = _encode(Image.new("RGB", (90, 60)), "TIFF")
+
+        assert get_image_dimensions(wrap(data)) == (90, 60)
+
+    def test_leaves_caller_stream_open(self):
+        stream = BytesIO(_encode(Image.new("RGB", (40, 30)), "JPEG"))
+
+        assert get_image_dimensions(stream) == (40, 30)
+        assert not stream.closed
+
+    def test_rejects_non_image(self):
+        with pytest.raises(ValueError):
+            get_image_dimensions(b"not an image")
+
+
+class TestThumbnailDataUris:
+    """Test data URI encoding of thumbnails"""
+
+    def test_single_uri_matches_base64(self):
+        image_id = uuid.uuid4()
+        data = b"\xff\xd8\xff\xe0jpeg-bytes"
+
+        uri = thumbnail_data_uri(image_id, data)
+
+        assert uri == "data:image/jpeg;base64," + base64.b64encode(data).decode("ascii")
+
+    @pytest.mark.parametrize("data", [b"", None])
+    def test_single_uri_for_empty_data_has_empty_payload(self, data):
+        assert thumbnail_data_uri(uuid.uuid4(), data) == "data:image/jpeg;base64,"
+
+    def test_batch_skips_empty_and_keys_by_str_id(self):
+        first, second, empty = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+        uris = thumbnail_data_uris({first: b"one", second: b"two", empty: None})
+
+        assert set(uris) == {str(first), str(second)}
+        assert uris[str(second)] == thumbnail_data_uri(second, b"two")
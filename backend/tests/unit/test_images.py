@@ -0,0 +1,24 @@
+"""
+Unit tests for image analysis helpers
+"""
+from api.v1.images import extract_labels
+
+
+class TestExtractLabels:
+    """Test keyword label extraction"""
+
+    def test_matches_case_insensitively_in_keyword_order(self):
+        labels = extract_labels("A Dog chases a CAT past a person")
+
+        assert labels == ["person", "dog", "cat"]
+
+    def test_reports_each_label_once(self):
+        assert extract_labels("tree, tree and another tree") == ["tree"]
+
+    def test_caps_at_five_labels(self):
+        labels = extract_labels("person people car building tree animal dog")
+
+        assert labels == ["person", "people", "car", "building", "tree"]
+
+    def test_no_matches(self):
+        assert extract_labels("an empty beach") == []
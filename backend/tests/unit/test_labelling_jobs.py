@@ -0,0 +1,73 @@
+"""
+Unit tests for labelling job API helpers
+"""
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from api.v1.labelling_jobs import encode_cursor, decode_cursor, LabellingJobUpdate, _run_job_bg
+
+
+class TestKeysetCursor:
+    """Test the opaque pagination cursor used by runs/results endpoints"""
+
+    def test_cursor_round_trip(self):
+        timestamp = datetime(2024, 1, 15, 10, 30, 45, 123456)
+        row_id = uuid.uuid4()
+
+        assert decode_cursor(encode_cursor(timestamp, row_id)) == (timestamp, row_id)
+
+    @pytest.mark.parametrize("cursor", ["not-base64!!", "aGVsbG8=", ""])
+    def test_invalid_cursor_returns_400(self, cursor):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor)
+
+        assert exc_info.value.status_code == 400
+
+
+class TestLabellingJobSchemas:
+    """Test request validation on labelling job schemas"""
+
+    @pytest.mark.parametrize("path", ["gs://my-bucket", "gs://my-bucket/", "gs://my.bucket/images/2024"])
+    def test_valid_gcs_paths(self, path):
+        job = LabellingJobUpdate(gcs_folder_path=path)
+        assert job.gcs_folder_path == path
+
+    @pytest.mark.parametrize("path", ["s3://bucket/x", "gs://", "gs://B", "bucket/path", "gs://UPPER/x"])
+    def test_invalid_gcs_paths(self, path):
+        with pytest.raises(ValidationError):
+            LabellingJobUpdate(gcs_folder_path=path)
+
+    @pytest.mark.parametrize("minutes", [0, -5, 10081])
+    def test_frequency_out_of_range(self, minutes):
+        with pytest.raises(ValidationError):
+            LabellingJobUpdate(frequency_minutes=minutes)
+
+
+class TestRunJobInBackground:
+    """Test the local (non-Cloud Tasks) job runner"""
+
+    @pytest.mark.asyncio
+    async def test_runs_job_and_closes_session(self):
+        session = Mock()
+        service = Mock(run_job=AsyncMock())
+        with patch("api.v1.labelling_jobs.SessionLocal", return_value=session), \
+                patch("api.v1.labelling_jobs.get_labelling_job_service", return_value=service):
+            await _run_job_bg("job-1", "manual")
+
+        service.run_job.assert_awaited_once_with("job-1", session, "manual")
+        session.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_logged_and_session_closed(self):
+        session = Mock()
+        service = Mock(run_job=AsyncMock(side_effect=RuntimeError("boom")))
+        with patch("api.v1.labelling_jobs.SessionLocal", return_value=session), \
+                patch("api.v1.labelling_jobs.get_labelling_job_service", return_value=service):
+            await _run_job_bg("job-1", "manual")
+
+        session.close.assert_called_once()
@@ -0,0 +1,139 @@
+"""
+Unit tests for model config endpoint helpers
+"""
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from api.v1 import model_configs
+
+
+def make_config(**overrides):
+    defaults = dict(
+        id=uuid.uuid4(),
+        provider="openai",
+        api_key="sk-test",
+        auth_type="api_key",
+        model_name="gpt-4o",
+        temperature=0.0,
+        max_tokens=16,
+    )
+    defaults.update(overrides)
+    return SimpleNamespace(**defaults)
+
+
+class TestRunTestPrompt:
+    """Test _run_test_prompt success, error and timeout handling"""
+
+    @pytest.mark.asyncio
+    async def test_success(self):
+        llm_service = MagicMock()
+        llm_service.generate_content = AsyncMock(return_value=("hello", 42, {}))
+
+        result = await model_configs._run_test_prompt(llm_service, make_config(), "hi")
+
+        assert result.success is True
+        assert result.response == "hello"
+        assert result.latency_ms == 42
+
+    @pytest.mark.asyncio
+    async def test_provider_error_is_captured(self):
+        llm_service = MagicMock()
+        llm_service.generate_content = AsyncMock(side_effect=RuntimeError("boom"))
+
+        result = await model_configs._run_test_prompt(llm_service, make_config(), "hi")
+
+        assert result.success is False
+        assert result.error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_hung_provider_times_out(self):
+        async def hang(**kwargs):
+            await asyncio.sleep(10)
+
+        llm_service = MagicMock()
+        llm_service.generate_content = hang
+
+        with patch.object(model_configs, "TEST_TIMEOUT_SECONDS", 0.01):
+            result = await model_configs._run_test_prompt(llm_service, make_config(), "hi")
+
+        assert result.success is False
+        assert "Timed out" in result.error
+
+    @pytest.mark.asyncio
+    async def test_no_free_provider_slot_returns_503(self):
+        llm_service = MagicMock()
+        llm_service.generate_content = AsyncMock(return_value=("hello", 42, {}))
+        busy = asyncio.Semaphore(0)
+
+        with patch.object(model_configs, "TEST_TIMEOUT_SECONDS", 0.01), \
+                patch.object(model_configs, "_provider_test_semaphore", return_value=busy):
+            with pytest.raises(model_configs.HTTPException) as exc_info:
+                await model_configs._run_test_prompt(llm_service, make_config(), "hi", raise_if_busy=True)
+
+        assert exc_info.value.status_code == 503
+        llm_service.generate_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_free_provider_slot_in_batch_is_a_failed_result(self):
+        llm_service = MagicMock()
+        llm_service.generate_content = AsyncMock(return_value=("hello", 42, {}))
+        busy = asyncio.Semaphore(0)
+
+        with patch.object(model_configs, "TEST_TIMEOUT_SECONDS", 0.01), \
+                patch.object(model_configs, "_provider_test_semaphore", return_value=busy):
+            result = await model_configs._run_test_prompt(llm_service, make_config(), "hi")
+
+        assert result.success is False
+        assert "busy" in result.error.lower()
+        llm_service.generate_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_provider_slot_released_after_call(self):
+        llm_service = MagicMock()
+        llm_service.generate_content = AsyncMock(side_effect=RuntimeError("boom"))
+        slot = asyncio.Semaphore(1)
+
+        with patch.object(model_configs, "_provider_test_semaphore", return_value=slot):
+            await model_configs._run_test_prompt(llm_service, make_config(), "hi")
+
+        assert not slot.locked()
+
+
+class TestUpdateModelConfig:
+    """Test update_model_config id handling"""
+
+    def test_malformed_id_returns_404_without_querying(self):
+        db = MagicMock()
+
+        with pytest.raises(model_configs.HTTPException) as exc_info:
+            model_configs.update_model_config(
+                "not-a-uuid", model_configs.ModelConfigUpdate(name="x"), current_user=MagicMock(), db=db
+            )
+
+        assert exc_info.value.status_code == 404
+        db.scalars.assert_not_called()
+
+
+class TestLoadConfigForTest:
+    """Test that the test endpoint releases its DB connection before provider calls"""
+
+    def test_session_closed_after_lookup(self):
+        config = make_config()
+        db = MagicMock()
+        db.get.return_value = config
+
+        assert model_configs._load_config_for_test(db, str(config.id)) is config
+        db.close.assert_called_once()
+
+    def test_session_closed_when_not_found(self):
+        db = MagicMock()
+        db.get.return_value = None
+
+        with pytest.raises(model_configs.HTTPException):
+            model_configs._load_config_for_test(db, str(uuid.uuid4()))
+
+        db.close.assert_called_once()
@@ -0,0 +1,37 @@
+"""
+Unit tests for Pydantic-rendering response classes
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, RootModel
+
+from core.responses import PydanticResponse
+
+
+class Item(BaseModel):
+    id: str
+    created_at: datetime
+    note: Optional[str] = None
+
+
+class TestPydanticResponse:
+    """Test PydanticResponse rendering"""
+
+    def test_renders_model_json(self):
+        response = PydanticResponse(Item(id="a", created_at=datetime(2024, 1, 1)))
+
+        assert response.media_type == "application/json"
+        assert response.body == b'{"id":"a","created_at":"2024-01-01T00:00:00","note":null}'
+
+    def test_renders_root_model_list_with_status(self):
+        items = RootModel[List[Item]]([Item(id="a", created_at=datetime(2024, 1, 1))])
+        response = PydanticResponse(items, status_code=201)
+
+        assert response.status_code == 201
+        assert response.body == b'[{"id":"a","created_at":"2024-01-01T00:00:00","note":null}]'
+
+    def test_exclude_none_drops_null_fields(self):
+        response = PydanticResponse(Item(id="a", created_at=datetime(2024, 1, 1)), exclude_none=True)
+
+        assert response.body == b'{"id":"a","created_at":"2024-01-01T00:00:00"}'
@@ -0,0 +1,32 @@
+"""
+Unit tests for shared schema field types
+"""
+import uuid
+from types import SimpleNamespace
+
+from pydantic import BaseModel
+
+from core.schemas import UUIDStr
+
+
+class Item(BaseModel):
+    id: UUIDStr
+
+    class Config:
+        from_attributes = True
+
+
+class TestUUIDStr:
+    """Test UUIDStr coercion"""
+
+    def test_uuid_becomes_string(self):
+        value = uuid.uuid4()
+        assert Item(id=value).id == str(value)
+
+    def test_validates_from_orm_attributes(self):
+        value = uuid.uuid4()
+        item = Item.model_validate(SimpleNamespace(id=value))
+        assert item.model_dump() == {"id": str(value)}
+
+    def test_string_passes_through(self):
+        assert Item(id="abc").id == "abc"
@@ -0,0 +1,49 @@
+"""
+Unit tests for internal task endpoints
+"""
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.v1 import tasks
+
+
+def make_job(name, frequency_minutes=15):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name=name,
+        frequency_minutes=frequency_minutes,
+        next_run_at=datetime(2024, 1, 1)
+    )
+
+
+class TestCheckScheduledJobs:
+    """Test that due jobs are enqueued together and rescheduled in one bulk UPDATE"""
+
+    @pytest.mark.asyncio
+    async def test_enqueues_due_jobs_and_commits_once(self):
+        ok_job, failing_job = make_job("ok"), make_job("failing")
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = [ok_job, failing_job]
+
+        def enqueue(job_id, trigger_type='scheduled'):
+            if job_id == str(failing_job.id):
+                raise RuntimeError("queue unavailable")
+            return f"task-{job_id}"
+
+        cloud_tasks = MagicMock()
+        cloud_tasks.enqueue_labelling_job_task.side_effect = enqueue
+
+        with patch.object(tasks, "get_cloud_tasks_service", return_value=cloud_tasks):
+            result = await tasks.check_scheduled_jobs_task(db=db, x_cloudscheduler="scheduler")
+
+        assert result["triggered_count"] == 1
+        assert result["failed_count"] == 1
+        assert result["failed_jobs"][0]["error"] == "queue unavailable"
+        stmt, mappings = db.execute.call_args.args
+        assert [m["id"] for m in mappings] == [ok_job.id]
+        assert mappings[0]["next_run_at"] > datetime(2024, 1, 1)
+        db.commit.assert_called_once()